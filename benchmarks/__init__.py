@@ -0,0 +1 @@
+"""Bancs de mesure de performance (à lancer depuis la racine : `python -m benchmarks.<nom>`)."""
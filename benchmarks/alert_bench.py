@@ -0,0 +1,90 @@
+"""Banc de l'AlertManager : sélection de la bannière avec des milliers d'alertes actives."""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from models import Alert, AlertLevel
+from services import AlertManager
+
+_LEVELS = (AlertLevel.INFO, AlertLevel.WARNING, AlertLevel.CRITICAL)
+
+
+class SortingAlertManager:
+    """Implémentation d'origine (tri de toutes les alertes à chaque trame), pour comparaison."""
+
+    _priority = {AlertLevel.INFO: 0, AlertLevel.WARNING: 1, AlertLevel.CRITICAL: 2}
+
+    def __init__(self) -> None:
+        self._active: dict[str, Alert] = {}
+        self._acked: set[str] = set()
+
+    def ingest(self, alerts) -> None:
+        for alert in alerts:
+            self._active[alert.alert_id] = alert
+
+    def acknowledge(self, alert_id: str) -> None:
+        self._acked.add(alert_id)
+
+    def get_banner_alert(self) -> Alert | None:
+        candidates = [a for a in self._active.values() if a.alert_id not in self._acked]
+        if not candidates:
+            return None
+        candidates.sort(key=lambda a: self._priority[a.level], reverse=True)
+        return candidates[0]
+
+
+def make_alerts(count: int) -> list[Alert]:
+    return [
+        Alert(alert_id=f"fault-{i}", level=_LEVELS[i % 3], message=f"Fault {i}", ack_required=i % 7 == 0)
+        for i in range(count)
+    ]
+
+
+def bench(manager, alerts: list[Alert], frames: int, per_frame: int) -> float:
+    manager.ingest(alerts)
+    for alert in alerts[::5]:
+        manager.acknowledge(alert.alert_id)
+    started = time.perf_counter()
+    for frame in range(frames):
+        start = (frame * per_frame) % len(alerts)
+        manager.ingest(alerts[start : start + per_frame])
+        manager.get_banner_alert()
+    return (time.perf_counter() - started) / frames * 1e6
+
+
+def bench_flapping(alert_count: int, cycles: int) -> tuple[float, int]:
+    now = 0.0
+    manager = AlertManager(default_ttl_s=1.0, clock=lambda: now)
+    alerts = make_alerts(alert_count)
+    started = time.perf_counter()
+    for cycle in range(cycles):
+        now = cycle * 0.6
+        manager.ingest(alerts[cycle % 2 :: 2])
+        manager.get_banner_alert()
+    elapsed = (time.perf_counter() - started) / cycles * 1e6
+    return elapsed, len(manager)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 5_000, 20_000])
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--per-frame", type=int, default=4, help="alertes ré-émises par trame")
+    args = parser.parse_args()
+
+    print(f"{'alerts':>8} {'sorting us/frame':>18} {'indexed us/frame':>18} {'speedup':>9}")
+    for size in args.sizes:
+        alerts = make_alerts(size)
+        legacy = bench(SortingAlertManager(), alerts, args.frames, args.per_frame)
+        indexed = bench(AlertManager(default_ttl_s=30.0), alerts, args.frames, args.per_frame)
+        print(f"{size:>8} {legacy:>18.1f} {indexed:>18.1f} {legacy / indexed:>8.1f}x")
+
+    elapsed, remaining = bench_flapping(args.sizes[-1], 200)
+    print(f"flapping {args.sizes[-1]} ids with TTL: {elapsed:.1f} us/cycle, {remaining} still active")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,85 @@
+"""Banc du compositing caméra (« Mosaic » et « Bird-eye ») à la résolution du panneau.
+
+    python -m benchmarks.composite_bench --frames 300 --width 1280 --height 800
+
+Mesure, pour chaque mode, la construction de la table de correspondance
+(une fois) puis le coût par image de `CompositeSource.read_into` avec des
+entrées synthétiques qui changent à chaque image, et en déduit les fps
+atteignables sur un cœur.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from camera import CompositeSource, SyntheticCameraSource, birdeye_remap, default_sources, mosaic_remap
+
+
+class _StaticFeed:
+    """Entrée qui présente un nouveau tableau à chaque acquisition, sans thread de capture."""
+
+    def __init__(self, source: SyntheticCameraSource) -> None:
+        self._source = source
+        self._arrays = [np.zeros((source.height, source.width, 4), dtype=np.uint8) for _ in range(2)]
+        for array in self._arrays:
+            source.read_into(array, timeout=0.0)
+        self._index = 0
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self._source.width, self._source.height
+
+    def acquire_array(self, consumer: str) -> np.ndarray:
+        self._index ^= 1
+        return self._arrays[self._index]
+
+    def release(self, consumer: str) -> None:
+        pass
+
+
+def bench_mode(name: str, build_table, frames: int, width: int, height: int) -> None:
+    inputs = [_StaticFeed(source) for source in default_sources("synthetic")]
+    composite = CompositeSource(name, inputs, build_table, width=width, height=height)
+    started = time.perf_counter()
+    table = composite.table()
+    build_ms = (time.perf_counter() - started) * 1000
+    out = np.zeros((height, width, 4), dtype=np.uint8)
+    composite.read_into(out, timeout=0.0)
+    samples = []
+    for _ in range(frames):
+        started = time.perf_counter()
+        composite.read_into(out, timeout=0.0)
+        samples.append(time.perf_counter() - started)
+    composite.close()
+    mean_ms = statistics.fmean(samples) * 1000
+    p99_ms = sorted(samples)[int(len(samples) * 0.99) - 1] * 1000
+    print(
+        f"{name:<9} {width}x{height}  table {build_ms:6.1f} ms, blended px {table.blend_dst.size:7d}, "
+        f"frame {mean_ms:5.2f} ms (p99 {p99_ms:5.2f} ms) -> {1000 / mean_ms:6.1f} fps"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=800)
+    parser.add_argument("--pin-core", type=int, default=None, help="épingle le processus sur ce cœur")
+    args = parser.parse_args()
+
+    if args.pin_core is not None:
+        os.sched_setaffinity(0, {args.pin_core})
+    for name, build_table in (("Mosaic", mosaic_remap), ("Bird-eye", birdeye_remap)):
+        bench_mode(name, build_table, args.frames, args.width, args.height)
+    sys.stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,103 @@
+"""Banc de la diffusion par champ (`state.TelemetryState`) face à un appel de tous les widgets.
+
+    python -m benchmarks.dispatch_bench --widgets 16 128 1024 --pages 4 --frames 5000
+
+Les widgets sont répartis sur `--pages` pages et abonnés chacun à un champ
+(tirage déterministe). Trois stratégies par trame simulée :
+
+- `broadcast` : chaque widget de chaque page est appelé, qu'il affiche un
+  champ modifié ou non (ce qu'imposerait un `on_telemetry` sur toutes les
+  pages) ;
+- `fields` : abonnements par champ, toutes les pages actives ;
+- `visible` : abonnements par champ, seule la première page est active.
+
+Les rappels ne font qu'incrémenter un compteur : on mesure le coût de la
+diffusion elle-même (µs par trame) et le nombre de rappels par trame.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+from services import MockFrameGenerator
+from state import Field, TelemetryState
+
+_FIELDS = list(Field)
+
+
+def _build(widgets: int, pages: int, active_pages: int) -> tuple[TelemetryState, list[int]]:
+    state = TelemetryState()
+    groups = [state.group() for _ in range(pages)]
+    calls = [0]
+
+    def callback(frame) -> None:
+        calls[0] += 1
+
+    rng = random.Random(7)
+    for index in range(widgets):
+        groups[index % pages].subscribe(rng.choice(_FIELDS), callback)
+    for group in groups[:active_pages]:
+        group.resume()
+    return state, calls
+
+
+def _broadcast(frames, widgets: int) -> tuple[float, float]:
+    calls = [0]
+
+    def callback(frame) -> None:
+        calls[0] += 1
+
+    callbacks = [callback] * widgets
+    started = time.perf_counter()
+    for frame in frames:
+        for target in callbacks:
+            target(frame)
+    elapsed = time.perf_counter() - started
+    return elapsed / len(frames) * 1e6, calls[0] / len(frames)
+
+
+def _subscribed(frames, widgets: int, pages: int, active_pages: int) -> tuple[float, float]:
+    state, calls = _build(widgets, pages, active_pages)
+    started = time.perf_counter()
+    for frame in frames:
+        state.update(frame)
+    elapsed = time.perf_counter() - started
+    return elapsed / len(frames) * 1e6, calls[0] / len(frames)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--widgets", type=int, nargs="+", default=[16, 128, 1024])
+    parser.add_argument("--pages", type=int, default=4)
+    parser.add_argument("--frames", type=int, default=5000)
+    args = parser.parse_args()
+
+    generator = MockFrameGenerator()
+    frames = [generator.next_frame() for _ in range(args.frames)]
+    probe = TelemetryState()
+    for frame in frames:
+        probe.update(frame)
+    stats = probe.stats()
+    print(f"{args.frames} frames, {stats.fields_changed / stats.updates:.2f} of {len(_FIELDS)} fields changed per frame")
+    print(
+        f"{'widgets':>8}{'broadcast µs':>14}{'calls':>8}{'fields µs':>11}{'calls':>8}"
+        f"{'visible µs':>12}{'calls':>8}"
+    )
+    for widgets in args.widgets:
+        broadcast_us, broadcast_calls = _broadcast(frames, widgets)
+        fields_us, fields_calls = _subscribed(frames, widgets, args.pages, args.pages)
+        visible_us, visible_calls = _subscribed(frames, widgets, args.pages, 1)
+        print(
+            f"{widgets:>8}{broadcast_us:>14.1f}{broadcast_calls:>8.0f}{fields_us:>11.1f}{fields_calls:>8.1f}"
+            f"{visible_us:>12.1f}{visible_calls:>8.1f}"
+        )
+    sys.stdout.flush()
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,153 @@
+"""Banc du relais de télémétrie (`fanout.FanoutServer`) avec des abonnés en boucle locale.
+
+    python -m benchmarks.fanout_bench --clients 8 --stalled 2 --rate-hz 500 --duration 8
+
+Le thread principal joue le rôle du thread GUI : il publie des trames simulées
+au débit demandé et mesure le coût de `publish`. Des abonnés TCP, dans un
+processus à part comme des PC de stand, décodent le flux avec `FrameDecoder` et
+mesurent le retard de chaque trame (horodatage de la trame → décodage) ; les
+abonnés « bloqués » se connectent puis ne lisent plus jamais et doivent être
+évincés sans ralentir les autres.
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+from datetime import datetime
+
+from fanout import FanoutServer
+from protocol import FrameDecoder, encode_into
+from services import MockFrameGenerator
+
+
+class _Reader(threading.Thread):
+    def __init__(self, port: int) -> None:
+        super().__init__(daemon=True)
+        self.socket = socket.create_connection(("127.0.0.1", port))
+        self.socket.settimeout(0.2)
+        self.decoder = FrameDecoder()
+        self.frames = 0
+        self.lag_ms: list[float] = []
+        self.stop_requested = threading.Event()
+
+    def run(self) -> None:
+        buffer = bytearray(64 * 1024)
+        with memoryview(buffer) as view:
+            while not self.stop_requested.is_set():
+                try:
+                    count = self.socket.recv_into(buffer)
+                except TimeoutError:
+                    continue
+                if count == 0:
+                    return
+                now = datetime.utcnow()
+                for frame in self.decoder.feed(view[:count]):
+                    self.frames += 1
+                    self.lag_ms.append((now - frame.timestamp).total_seconds() * 1000)
+
+
+def _run_readers(port: int, count: int, connection) -> None:
+    readers = [_Reader(port) for _ in range(count)]
+    for reader in readers:
+        reader.start()
+    connection.send("ready")
+    connection.recv()
+    for reader in readers:
+        reader.stop_requested.set()
+    connection.send(([reader.frames for reader in readers], [lag for reader in readers for lag in reader.lag_ms]))
+
+
+def _stalled_client(port: int) -> socket.socket:
+    sock = socket.socket()
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    sock.connect(("127.0.0.1", port))
+    return sock
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _paced(rate_hz: float, duration: float, call) -> list[float]:
+    generator = MockFrameGenerator()
+    samples: list[float] = []
+    period = 1.0 / rate_hz
+    started = time.monotonic()
+    next_at = started
+    while (now := time.monotonic()) - started < duration:
+        if now < next_at:
+            time.sleep(next_at - now)
+        next_at += period
+        frame = generator.next_frame()
+        begin = time.perf_counter()
+        call(frame)
+        samples.append((time.perf_counter() - begin) * 1e6)
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--stalled", type=int, default=2)
+    parser.add_argument("--rate-hz", type=float, default=500.0)
+    parser.add_argument("--duration", type=float, default=8.0)
+    parser.add_argument("--batch-ms", type=float, default=20.0)
+    parser.add_argument("--max-stall-s", type=float, default=1.0)
+    args = parser.parse_args()
+
+    server = FanoutServer(port=0, batch_interval_s=args.batch_ms / 1000, max_stall_s=args.max_stall_s)
+    server.start()
+    connection, child_connection = multiprocessing.Pipe()
+    child = multiprocessing.get_context("fork").Process(
+        target=_run_readers, args=(server.bound_port, args.clients, child_connection), daemon=True
+    )
+    child.start()
+    connection.recv()
+    stalled = [_stalled_client(server.bound_port) for _ in range(args.stalled)]
+    deadline = time.monotonic() + 1.0
+    while server.stats().clients < args.clients + args.stalled and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # Référence : le seul encodage, au même rythme (caches froids entre deux trames compris).
+    scratch = bytearray()
+    encode_us = _paced(args.rate_hz, 1.0, lambda frame: (scratch.clear(), encode_into(scratch, frame)))
+    publish_us = _paced(args.rate_hz, args.duration, server.publish)
+    time.sleep(0.2)
+    stats = server.stats()
+    connection.send("stop")
+    received, lags = connection.recv()
+    server.stop()
+
+    published = len(publish_us)
+    print(f"published {published} frames at {published / args.duration:.0f} Hz")
+    print(
+        f"publish  p50 {statistics.median(publish_us):.1f} µs, p99 {_percentile(publish_us, 0.99):.1f} µs, "
+        f"max {max(publish_us):.0f} µs (encode alone p50 {statistics.median(encode_us):.1f} µs)"
+    )
+    print(
+        f"readers  {args.clients} x received min {min(received, default=0)} / max {max(received, default=0)}, "
+        f"lag p50 {_percentile(lags, 0.5):.1f} ms, p99 {_percentile(lags, 0.99):.1f} ms"
+    )
+    print(
+        f"server   batches {stats.batches} ({stats.frames / max(1, stats.batches):.1f} frames/write), "
+        f"accepted {stats.accepted}, evicted {stats.evicted}/{args.stalled} stalled, "
+        f"{stats.bytes_sent / 1024:.0f} KiB sent"
+    )
+    for sock in stalled:
+        sock.close()
+    sys.stdout.flush()
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+"""Banc du mode flotte : N karts simulés sur la boucle d'ingestion partagée, classement affiché.
+
+    python -m benchmarks.fleet_bench --karts 1 5 10 25 50 --kart-hz 25 --duration 4
+
+Pour chaque N, `FleetTelemetryService` fait tourner N sources simulées
+(`MockFrameGenerator`, trames réellement encodées puis décodées) et la
+`FleetWindow` rafraîchit le classement au rythme de l'affichage. On relève le
+débit ingéré, le temps CPU du thread d'ingestion, le coût d'un
+rafraîchissement du classement (instantané, tri, comparaison, `dataChanged`
+et repeint qui suit) et le retard p99 de la boucle Qt (`PerfMonitor`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication
+
+from benchmarks.ui_bench import pump
+from fleet import FleetTelemetryService
+from models import ThemeMode
+from perf import PerfMonitor
+from services import ThemeManager
+from ui import FleetWindow
+
+
+def _run(app: QApplication, theme_manager: ThemeManager, karts: int, kart_hz: float, duration: float, refresh_hz: int):
+    fleet = FleetTelemetryService()
+    for number in range(karts):
+        fleet.add_synthetic(f"Kart {number + 1}", kart_hz)
+    fleet.start()
+    window = FleetWindow(fleet.state, theme_manager, refresh_hz=refresh_hz)
+    window.resize(1280, 800)
+    window.show()
+    page = window.page()
+    refresh_ms: list[float] = []
+    changed: list[int] = []
+    original = page.refresh
+
+    def timed_refresh() -> int:
+        started = time.perf_counter()
+        cells = original()
+        # Le repeint des seules cellules invalidées fait partie du coût d'un rafraîchissement.
+        app.sendPostedEvents(None, QEvent.UpdateRequest)
+        refresh_ms.append((time.perf_counter() - started) * 1000)
+        changed.append(cells)
+        return cells
+
+    page._refresh_timer.timeout.disconnect(page.refresh)
+    page._refresh_timer.timeout.connect(timed_refresh)
+    monitor = PerfMonitor()
+    pump(app, 0.5)
+    refresh_ms.clear()
+    changed.clear()
+    before = fleet.stats()
+    monitor.start()
+    started = time.perf_counter()
+    pump(app, duration)
+    elapsed = time.perf_counter() - started
+    after = fleet.stats()
+    monitor.stop()
+    fleet.stop()
+    window.close()
+    return (
+        (after.frames - before.frames) / elapsed,
+        (after.ingest_cpu_s - before.ingest_cpu_s) / elapsed * 100,
+        statistics.median(refresh_ms) if refresh_ms else 0.0,
+        max(refresh_ms, default=0.0),
+        statistics.fmean(changed) if changed else 0.0,
+        len(refresh_ms) / elapsed,
+        monitor.snapshot().loop_lag_p99_us / 1000,
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--karts", type=int, nargs="+", default=[1, 5, 10, 25, 50])
+    parser.add_argument("--kart-hz", type=float, default=25.0)
+    parser.add_argument("--duration", type=float, default=4.0)
+    parser.add_argument("--refresh-hz", type=int, default=30)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    theme_manager = ThemeManager(app)
+    theme_manager.apply_theme(ThemeMode.NIGHT, 100)
+    print(
+        f"{'karts':>5}{'frames/s':>10}{'expected':>10}{'ingest cpu':>12}"
+        f"{'refresh p50':>13}{'max':>8}{'cells':>7}{'refresh/s':>11}{'loop lag p99':>14}"
+    )
+    for karts in args.karts:
+        rate, cpu, refresh_p50, refresh_max, cells, refreshes, lag = _run(
+            app, theme_manager, karts, args.kart_hz, args.duration, args.refresh_hz
+        )
+        print(
+            f"{karts:>5}{rate:>10.0f}{karts * args.kart_hz:>10.0f}{cpu:>11.1f}%"
+            f"{refresh_p50:>10.2f} ms{refresh_max:>5.1f} ms{cells:>7.0f}{refreshes:>11.1f}{lag:>11.1f} ms"
+        )
+    sys.stdout.flush()
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,146 @@
+"""Banc des jauges peintes (`gauges.py`) contre les libellés texte qu'elles remplacent.
+
+    python -m benchmarks.gauge_bench --updates 600 --theme night
+
+Pour chaque indicateur (vitesse, batterie, cap), la même suite de valeurs est
+appliquée d'une part à un `QLabel#MetricValue` (via `WidgetBinder`, comme
+avant), d'autre part à la jauge, chacun seul dans une carte `PanelCard`.
+La ligne `status` compare la jauge batterie de `TopStatusBar` (64 x 26) au
+libellé de la barre d'état. Chaque mise à jour est suivie d'un
+`processEvents` qui déclenche la mise en page et le repaint.
+
+Un premier passage hors mesure remplit les caches (mise en forme du texte) ;
+on relève ensuite, en régime établi, le temps médian des mises à jour qui
+repeignent effectivement le widget et la surface repeinte par mise à jour.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import QApplication, QGroupBox, QHBoxLayout, QLabel, QVBoxLayout, QWidget
+
+from gauges import BatteryGauge, CompassGauge, Gauge, SpeedGauge
+from models import ThemeMode
+from services import ThemeManager
+from ui import WidgetBinder
+
+
+class _PaintCounter(QObject):
+    def __init__(self) -> None:
+        super().__init__()
+        self.area = 0
+        self.paints = 0
+
+    def eventFilter(self, watched, event) -> bool:
+        if event.type() == QEvent.Paint:
+            self.paints += 1
+            self.area += sum(rect.width() * rect.height() for rect in event.region())
+        return False
+
+
+def _series(name: str, count: int) -> list[float]:
+    if name == "speed":
+        return [55 + 45 * math.sin(i / 40) + (i % 7) * 0.3 for i in range(count)]
+    if name in ("battery", "status"):
+        return [100 - i * 90 // count for i in range(count)]
+    return [(i * 1.7) % 360 for i in range(count)]
+
+
+def _card(title: str, widget: QWidget) -> QGroupBox:
+    """Carte `PanelCard` contenant le widget, comme sur la page d'accueil."""
+    box = QGroupBox(title)
+    box.setObjectName("PanelCard")
+    QVBoxLayout(box).addWidget(widget)
+    return box
+
+
+def _status_bar(widget: QWidget) -> QWidget:
+    """Barre `TopStatusBar` réduite : la jauge batterie à sa taille fixe de 64 x 26."""
+    bar = QWidget()
+    bar.setObjectName("TopStatusBar")
+    layout = QHBoxLayout(bar)
+    layout.addWidget(QLabel("0 km/h"))
+    layout.addWidget(widget)
+    layout.addStretch(1)
+    return bar
+
+
+def _measure(
+    app: QApplication, host: QWidget, painted: QWidget, apply, values: list[float], size: tuple[int, int]
+) -> tuple[float, float]:
+    host.resize(*size)
+    host.show()
+    app.processEvents()
+    # Passage de chauffe, hors mesure.
+    for value in values:
+        apply(value)
+        app.processEvents()
+    counter = _PaintCounter()
+    painted.installEventFilter(counter)
+    samples = []
+    for value in values:
+        paints = counter.paints
+        started = time.perf_counter()
+        apply(value)
+        app.processEvents()
+        elapsed = time.perf_counter() - started
+        if counter.paints != paints:
+            samples.append(elapsed)
+    painted.removeEventFilter(counter)
+    host.hide()
+    return statistics.median(samples) * 1e6, counter.area / len(values)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--updates", type=int, default=600)
+    parser.add_argument("--theme", choices=[mode.value for mode in ThemeMode], default=ThemeMode.NIGHT.value)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    ThemeManager(app).apply_theme(ThemeMode(args.theme), 100)
+    binder = WidgetBinder()
+    indicators = {
+        "speed": (SpeedGauge, "set_speed", lambda v: f"{v:0.0f}"),
+        "battery": (BatteryGauge, "set_percent", "{:.0f}%".format),
+        "heading": (CompassGauge, "set_heading", lambda v: f"{v:.0f}°"),
+        "status": (BatteryGauge, "set_percent", "Battery: {:.0f}%".format),
+    }
+    print(f"{'indicator':<10}{'label µs':>10}{'gauge µs':>10}{'label px':>10}{'gauge px':>10}  static layer")
+    for name, (gauge_type, setter, text) in indicators.items():
+        values = _series(name, args.updates)
+        label = QLabel("")
+        gauge: Gauge = gauge_type()
+        if name == "status":
+            gauge.setFixedSize(64, 26)
+            label_host, gauge_host, size = _status_bar(label), _status_bar(gauge), (640, 46)
+        else:
+            label.setObjectName("MetricValue")
+            label_host, gauge_host, size = _card(name, label), _card(name, gauge), (320, 240)
+        label_us, label_px = _measure(app, label_host, label, lambda v: binder.set_text(label, text(v)), values, size)
+        gauge_us, gauge_px = _measure(app, gauge_host, gauge, getattr(gauge, setter), values, size)
+        # Reconstruction forcée du calque, comme après un changement de thème ou de taille.
+        renders = gauge.static_renders
+        gauge._static_key = None
+        started = time.perf_counter()
+        gauge._static_layer()
+        static_ms = (time.perf_counter() - started) * 1000
+        print(
+            f"{name:<10}{label_us:>10.1f}{gauge_us:>10.1f}{label_px:>10.0f}{gauge_px:>10.0f}"
+            f"  {static_ms:.2f} ms, built {renders}x during updates"
+        )
+    sys.stdout.flush()
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
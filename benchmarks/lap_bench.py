@@ -0,0 +1,132 @@
+"""Banc du chronométrage au tour (`laps.LapTimer`) sur un circuit synthétique.
+
+    python -m benchmarks.lap_bench --gates 4 32 256 --rate-hz 25 --laps 20
+
+Le kart tourne à vitesse constante sur un cercle de `--radius-m` mètres,
+découpé en `--gates` portes. Pour chaque nombre de portes, on compare l'index
+en grille à un parcours exhaustif (une seule cellule couvrant tout le
+circuit) : coût de `update` par trame et nombre de tests d'intersection.
+
+Le temps au tour mesuré est ensuite comparé au temps exact (circonférence /
+vitesse) : avec l'interpolation du franchissement entre deux trames, et tel
+qu'on l'obtiendrait en datant le franchissement à la première trame après la
+ligne.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+from laps import GRID_CELL_M, LapTimer, Track
+from models import GpsData, GpsFixState, TelemetryFrame
+from trip import EARTH_RADIUS_M
+
+_LAT0 = 45.0
+_LON0 = 5.0
+# Cellule infinie : une seule cellule, toutes les portes sont testées à chaque trame.
+_BRUTE_FORCE_CELL_M = math.inf
+
+
+def _to_latlon(x: float, y: float) -> tuple[float, float]:
+    m_per_deg_lat = math.radians(EARTH_RADIUS_M)
+    m_per_deg_lon = m_per_deg_lat * math.cos(math.radians(_LAT0))
+    return _LAT0 + y / m_per_deg_lat, _LON0 + x / m_per_deg_lon
+
+
+def _circle_track(gates: int, radius_m: float) -> Track:
+    def gate(angle: float):
+        inner = _to_latlon((radius_m - 8) * math.cos(angle), (radius_m - 8) * math.sin(angle))
+        outer = _to_latlon((radius_m + 8) * math.cos(angle), (radius_m + 8) * math.sin(angle))
+        return inner, outer
+
+    # Départ légèrement décalé de l'angle 0 : la première trame n'est pas sur la ligne.
+    angles = [0.01 + 2 * math.pi * index / gates for index in range(gates)]
+    return Track("Bench circle", gate(angles[0]), [gate(angle) for angle in angles[1:]], min_lap_s=5.0)
+
+
+def _frames(radius_m: float, speed_ms: float, rate_hz: float, laps: int) -> list[TelemetryFrame]:
+    omega = speed_ms / radius_m
+    count = int(laps * 2 * math.pi / omega * rate_hz) + 2
+    origin = datetime(2026, 1, 1)
+    frames = []
+    for index in range(count):
+        t = index / rate_hz
+        latitude, longitude = _to_latlon(radius_m * math.cos(omega * t), radius_m * math.sin(omega * t))
+        frames.append(
+            TelemetryFrame(
+                speed_kmh=speed_ms * 3.6,
+                gps=GpsData(latitude=latitude, longitude=longitude, fix_state=GpsFixState.FIX_3D),
+                timestamp=origin + timedelta(seconds=t),
+            )
+        )
+    return frames
+
+
+def _run(track: Track, frames: list[TelemetryFrame], cell_m: float) -> tuple[float, float, list[float]]:
+    timer = LapTimer(track, cell_m)
+    lap_times: list[float] = []
+    completed = 0
+    started = time.perf_counter()
+    for frame in frames:
+        timer.update(frame)
+    elapsed = time.perf_counter() - started
+    # Second passage, hors chronométrage, pour relever les temps au tour.
+    timer.reset()
+    for frame in frames:
+        timer.update(frame)
+        stats = timer.stats()
+        if stats.laps_completed != completed:
+            completed = stats.laps_completed
+            lap_times.append(stats.last_lap_s)
+    return elapsed / len(frames) * 1e6, timer.gate_tests / len(frames), lap_times
+
+
+def _quantized_lap_times(radius_m: float, speed_ms: float, rate_hz: float, laps: int) -> list[float]:
+    """Temps au tour si le franchissement était daté à la première trame après la ligne."""
+    omega = speed_ms / radius_m
+    crossings = [math.ceil((0.01 + 2 * math.pi * lap) / omega * rate_hz) / rate_hz for lap in range(laps)]
+    return [b - a for a, b in zip(crossings, crossings[1:])]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--gates", type=int, nargs="+", default=[4, 32, 256])
+    parser.add_argument("--radius-m", type=float, default=200.0)
+    parser.add_argument("--speed-kmh", type=float, default=54.0)
+    parser.add_argument("--rate-hz", type=float, default=25.0)
+    parser.add_argument("--laps", type=int, default=20)
+    parser.add_argument("--cell-m", type=float, default=GRID_CELL_M)
+    args = parser.parse_args()
+
+    speed_ms = args.speed_kmh / 3.6
+    exact = 2 * math.pi * args.radius_m / speed_ms
+    frames = _frames(args.radius_m, speed_ms, args.rate_hz, args.laps)
+    print(f"{len(frames)} frames, {args.laps} laps of {exact:.3f} s, {args.rate_hz:.0f} Hz")
+    print(f"{'gates':>6}{'grid µs':>10}{'tests':>8}{'brute µs':>11}{'tests':>8}")
+    interpolated: list[float] = []
+    for gates in args.gates:
+        track = _circle_track(gates, args.radius_m)
+        grid_us, grid_tests, lap_times = _run(track, frames, args.cell_m)
+        brute_us, brute_tests, _ = _run(track, frames, _BRUTE_FORCE_CELL_M)
+        interpolated = lap_times
+        print(f"{gates:>6}{grid_us:>10.1f}{grid_tests:>8.2f}{brute_us:>11.1f}{brute_tests:>8.2f}")
+
+    quantized = _quantized_lap_times(args.radius_m, speed_ms, args.rate_hz, args.laps)
+    for label, lap_times in (("interpolated", interpolated), ("frame-quantized", quantized)):
+        errors_ms = [abs(lap - exact) * 1000 for lap in lap_times]
+        print(
+            f"{label:<16} lap error mean {statistics.fmean(errors_ms):.2f} ms, "
+            f"max {max(errors_ms):.2f} ms over {len(errors_ms)} laps"
+        )
+    sys.stdout.flush()
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,73 @@
+"""Microbenchmark du protocole binaire : trames décodées par seconde."""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from protocol import FrameDecoder, decode_frames, encode_into
+from services import MockFrameGenerator
+
+
+def build_stream(frame_count: int) -> bytes:
+    generator = MockFrameGenerator()
+    buffer = bytearray()
+    for seq in range(frame_count):
+        encode_into(buffer, generator.next_frame(), seq)
+    return bytes(buffer)
+
+
+def bench_batch(stream: bytes, frame_count: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        frames, _ = decode_frames(stream)
+        best = min(best, time.perf_counter() - started)
+        assert len(frames) == frame_count
+    return frame_count / best
+
+
+def bench_stream(stream: bytes, frame_count: int, chunk_size: int, repeat: int) -> float:
+    view = memoryview(stream)
+    best = float("inf")
+    for _ in range(repeat):
+        decoder = FrameDecoder()
+        decoded = 0
+        started = time.perf_counter()
+        for offset in range(0, len(stream), chunk_size):
+            decoded += len(decoder.feed(view[offset : offset + chunk_size]))
+        best = min(best, time.perf_counter() - started)
+        assert decoded == frame_count
+    return frame_count / best
+
+
+def bench_encode(frame_count: int, repeat: int) -> float:
+    generator = MockFrameGenerator()
+    frames = [generator.next_frame() for _ in range(frame_count)]
+    best = float("inf")
+    for _ in range(repeat):
+        buffer = bytearray()
+        started = time.perf_counter()
+        for seq, frame in enumerate(frames):
+            encode_into(buffer, frame, seq)
+        best = min(best, time.perf_counter() - started)
+    return frame_count / best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--frames", type=int, default=50_000)
+    parser.add_argument("--chunk", type=int, default=1500, help="taille de lecture simulée (octets)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    stream = build_stream(args.frames)
+    print(f"stream: {args.frames} frames, {len(stream)} bytes ({len(stream) / args.frames:.1f} B/frame)")
+    print(f"encode:           {bench_encode(args.frames, args.repeat):>12,.0f} frames/s")
+    print(f"decode (batch):   {bench_batch(stream, args.frames, args.repeat):>12,.0f} frames/s")
+    print(f"decode (stream):  {bench_stream(stream, args.frames, args.chunk, args.repeat):>12,.0f} frames/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
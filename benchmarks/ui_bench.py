@@ -0,0 +1,333 @@
+"""Banc de performance de l'UI en mode headless (plateforme Qt `offscreen`).
+
+Mesure le coût par trame de `MainWindow._on_telemetry` (et du rendu qui en
+découle) de 12.5 Hz à 1 kHz, la latence de `set_page`, celle d'un changement
+de niveau du bandeau d'alerte, la durée de `ThemeManager.apply_theme` et le temps démarrage → première trame. Les
+résultats sont écrits en JSON pour comparer deux commits :
+
+    python -m benchmarks.ui_bench --output before.json
+    python -m benchmarks.ui_bench --output after.json --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import PySide6
+from PySide6.QtCore import QElapsedTimer, Qt, QTimer
+from PySide6.QtWidgets import QApplication
+
+from models import Alert, AlertLevel, PageId, TelemetryFrame, ThemeMode
+from services import MockFrameGenerator, SettingsRepository, TelemetryService, ThemeManager
+from ui import MainWindow
+
+DEFAULT_RATES_HZ = (12.5, 30.0, 60.0, 100.0, 250.0, 500.0, 1000.0)
+
+
+class SyntheticTelemetryService(TelemetryService):
+    """Émet des trames simulées au débit demandé depuis le thread GUI (rattrapage si le timer est en retard)."""
+
+    def __init__(self, rate_hz: float) -> None:
+        super().__init__()
+        self._rate_hz = rate_hz
+        self._generator = MockFrameGenerator()
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(max(1, int(1000 / rate_hz)))
+        self._timer.timeout.connect(self._tick)
+        self._clock = QElapsedTimer()
+        self._emitted = 0
+
+    @property
+    def emitted(self) -> int:
+        return self._emitted
+
+    def set_rate(self, rate_hz: float) -> None:
+        self._rate_hz = rate_hz
+        self._timer.setInterval(max(1, int(1000 / rate_hz)))
+
+    def start(self) -> None:
+        self._emitted = 0
+        self._clock.start()
+        self._timer.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    def emit_one(self) -> None:
+        self._emitted += 1
+        self.telemetry_updated.emit(self._generator.next_frame())
+
+    def _tick(self) -> None:
+        due = int(self._clock.nsecsElapsed() * 1e-9 * self._rate_hz)
+        while self._emitted < due:
+            self.emit_one()
+
+
+class InstrumentedMainWindow(MainWindow):
+    def __init__(self, *args, **kwargs) -> None:
+        self.intake_ns: list[int] = []
+        self.render_ns: list[int] = []
+        self.first_render_at: float | None = None
+        super().__init__(*args, **kwargs)
+
+    def _on_telemetry(self, frame: TelemetryFrame) -> None:
+        started = time.perf_counter_ns()
+        super()._on_telemetry(frame)
+        self.intake_ns.append(time.perf_counter_ns() - started)
+
+    def _render_frame(self, frame: TelemetryFrame) -> None:
+        started = time.perf_counter_ns()
+        super()._render_frame(frame)
+        self.render_ns.append(time.perf_counter_ns() - started)
+        if self.first_render_at is None:
+            self.first_render_at = time.perf_counter()
+
+
+def summarize_ns(samples: list[int]) -> dict[str, float]:
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def pct(p: float) -> float:
+        return ordered[min(len(ordered) - 1, math.ceil(p / 100 * len(ordered)) - 1)] / 1000
+
+    return {
+        "count": len(ordered),
+        "mean_us": statistics.fmean(ordered) / 1000,
+        "p50_us": pct(50),
+        "p95_us": pct(95),
+        "p99_us": pct(99),
+        "max_us": ordered[-1] / 1000,
+    }
+
+
+def pump(app: QApplication, seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.0005)
+
+
+def bench_startup(app: QApplication, settings_path: Path) -> tuple[dict, InstrumentedMainWindow, SyntheticTelemetryService]:
+    started = time.perf_counter()
+    repo = SettingsRepository(settings_path)
+    settings = repo.load_settings()
+    theme_manager = ThemeManager(app)
+    theme_manager.apply_theme(settings.theme_mode, settings.brightness)
+    service = SyntheticTelemetryService(DEFAULT_RATES_HZ[0])
+    window = InstrumentedMainWindow(
+        settings=settings,
+        settings_repo=repo,
+        theme_manager=theme_manager,
+        telemetry_service=service,
+    )
+    built_at = time.perf_counter()
+    window.resize(1280, 800)
+    window.show()
+    service.emit_one()
+    while window.first_render_at is None and time.perf_counter() - started < 5:
+        app.processEvents()
+    app.processEvents()
+    painted_at = time.perf_counter()
+    result = {
+        "window_build_ms": (built_at - started) * 1000,
+        "first_frame_ms": ((window.first_render_at or painted_at) - started) * 1000,
+        "first_paint_ms": (painted_at - started) * 1000,
+        "pages_built_at_first_paint": len(window.built_pages()),
+    }
+    return result, window, service
+
+
+def bench_rates(
+    app: QApplication,
+    window: InstrumentedMainWindow,
+    service: SyntheticTelemetryService,
+    rates: list[float],
+    duration_s: float,
+) -> list[dict]:
+    results = []
+    for rate in rates:
+        window.intake_ns.clear()
+        window.render_ns.clear()
+        stats_before = window.render_stats()
+        service.set_rate(rate)
+        service.start()
+        pump(app, duration_s)
+        service.stop()
+        stats_after = window.render_stats()
+        results.append(
+            {
+                "rate_hz": rate,
+                "frames": service.emitted,
+                "achieved_hz": service.emitted / duration_s,
+                "renders": stats_after.rendered - stats_before.rendered,
+                "skipped": stats_after.skipped - stats_before.skipped,
+                "on_telemetry": summarize_ns(window.intake_ns),
+                "render": summarize_ns(window.render_ns),
+            }
+        )
+    return results
+
+
+def bench_page_switch(app: QApplication, window: MainWindow, rounds: int) -> dict:
+    pages = [PageId.HOME, PageId.NAVIGATION, PageId.CAMERA, PageId.SETTINGS]
+    call_ns: dict[str, list[int]] = {page.value: [] for page in pages}
+    painted_ns: dict[str, list[int]] = {page.value: [] for page in pages}
+    for _ in range(rounds):
+        for page in pages:
+            started = time.perf_counter_ns()
+            window.set_page(page)
+            called = time.perf_counter_ns()
+            window.repaint()
+            app.processEvents()
+            painted = time.perf_counter_ns()
+            call_ns[page.value].append(called - started)
+            painted_ns[page.value].append(painted - started)
+    return {
+        page: {"set_page": summarize_ns(call_ns[page]), "set_page_and_paint": summarize_ns(painted_ns[page])}
+        for page in call_ns
+    }
+
+
+def bench_alert_change(app: QApplication, window: MainWindow, rounds: int) -> dict:
+    """Alterne le niveau du bandeau (warning/critical) : coût du restylage seul puis avec peinture."""
+    banner = window._banner_host
+    alerts = [
+        Alert(alert_id="bench-warning", level=AlertLevel.WARNING, message="Batterie faible"),
+        Alert(alert_id="bench-critical", level=AlertLevel.CRITICAL, message="Surchauffe moteur"),
+    ]
+    call_ns: list[int] = []
+    painted_ns: list[int] = []
+    for i in range(rounds * 2):
+        started = time.perf_counter_ns()
+        banner.show_alert(alerts[i % 2])
+        called = time.perf_counter_ns()
+        window.repaint()
+        app.processEvents()
+        painted = time.perf_counter_ns()
+        call_ns.append(called - started)
+        painted_ns.append(painted - started)
+    banner.show_alert(None)
+    return {"set_alert": summarize_ns(call_ns), "set_alert_and_paint": summarize_ns(painted_ns)}
+
+
+def bench_theme(app: QApplication, theme_manager: ThemeManager, rounds: int) -> dict:
+    results = {}
+    for mode in (ThemeMode.DAY, ThemeMode.NIGHT):
+        samples = []
+        for i in range(rounds):
+            started = time.perf_counter_ns()
+            theme_manager.apply_theme(mode, 40 + i % 60)
+            app.processEvents()
+            samples.append(time.perf_counter_ns() - started)
+        results[mode.value] = summarize_ns(samples)
+    return results
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent.parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current: dict, previous: dict) -> None:
+    def walk(cur, prev, path):
+        if isinstance(cur, dict) and isinstance(prev, dict):
+            for key, value in cur.items():
+                if key in prev:
+                    walk(value, prev[key], f"{path}.{key}" if path else key)
+        elif isinstance(cur, list) and isinstance(prev, list):
+            for index, (value, old) in enumerate(zip(cur, prev)):
+                walk(value, old, f"{path}[{index}]")
+        elif isinstance(cur, (int, float)) and isinstance(prev, (int, float)) and path.endswith(("_us", "_ms")):
+            if prev:
+                delta = (cur - prev) / prev * 100
+                flag = "  <-- regression" if delta > 15 else ""
+                print(f"{path:<60} {prev:>10.1f} -> {cur:>10.1f} ({delta:+6.1f}%){flag}")
+
+    walk(current["results"], previous.get("results", {}), "")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", type=Path, default=Path("bench_ui.json"))
+    parser.add_argument("--compare", type=Path, help="fichier JSON d'un run précédent")
+    parser.add_argument("--duration", type=float, default=2.0, help="durée par débit (s)")
+    parser.add_argument("--rates", type=float, nargs="+", default=list(DEFAULT_RATES_HZ))
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    with tempfile.TemporaryDirectory() as tmp:
+        startup, window, service = bench_startup(app, Path(tmp) / "settings.json")
+        results = {
+            "startup": startup,
+            "telemetry": bench_rates(app, window, service, args.rates, args.duration),
+            "page_switch": bench_page_switch(app, window, args.rounds),
+            "alert_change": bench_alert_change(app, window, args.rounds),
+            "apply_theme": bench_theme(app, window._theme_manager, args.rounds),
+        }
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pyside": PySide6.__version__,
+            "platform": platform.platform(),
+            "qpa": os.environ.get("QT_QPA_PLATFORM"),
+        },
+        "results": results,
+    }
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    print(f"startup: first frame {startup['first_frame_ms']:.1f} ms, first paint {startup['first_paint_ms']:.1f} ms")
+    for row in results["telemetry"]:
+        intake = row["on_telemetry"]
+        render = row["render"]
+        print(
+            f"{row['rate_hz']:>7.1f} Hz: {row['frames']:>5} frames, {row['renders']:>4} renders, "
+            f"on_telemetry p50 {intake.get('p50_us', 0):7.1f} us p99 {intake.get('p99_us', 0):7.1f} us, "
+            f"render p50 {render.get('p50_us', 0):7.1f} us"
+        )
+    for page, row in results["page_switch"].items():
+        print(f"set_page({page}): p50 {row['set_page_and_paint']['p50_us']:.0f} us (with paint)")
+    alert = results["alert_change"]
+    print(
+        f"alert level change: p50 {alert['set_alert']['p50_us']:.0f} us, "
+        f"{alert['set_alert_and_paint']['p50_us']:.0f} us (with paint)"
+    )
+    for mode, row in results["apply_theme"].items():
+        print(f"apply_theme({mode}): p50 {row['p50_us']:.0f} us")
+    print(f"results written to {args.output}")
+
+    if args.compare is not None:
+        compare(report, json.loads(args.compare.read_text(encoding="utf-8")))
+    service.stop()
+    sys.stdout.flush()
+    # Évite le démontage Qt à la sortie de l'interpréteur, inutile pour un banc.
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,595 @@
+"""Chaîne caméra sans copie : sources interchangeables, tampons partagés et tuiles d'affichage.
+
+Chaque flux possède quelques tampons préalloués, enveloppés une fois pour
+toutes dans des `QImage` qui pointent sur la même mémoire (aucune copie). Le
+thread de capture écrit toujours dans un tampon qui n'est ni le dernier publié
+ni réservé par un consommateur (affichage, compositeur) ; une image publiée
+mais pas encore consommée est simplement remplacée (comptée comme « dropped »),
+si bien qu'aucun retard ne s'accumule.
+
+Les modes « Mosaic » et « Bird-eye » sont des sources composites : des tables
+de correspondance (indices NumPy) calculées une seule fois, puis à chaque
+image un `take` vectorisé et un fondu limité aux zones de recouvrement,
+écrits directement dans le tampon de sortie du flux composite.
+"""
+
+from __future__ import annotations
+
+import os
+import select
+import struct
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import numpy as np
+from PySide6.QtCore import QObject, QRect, Qt, Signal
+from PySide6.QtGui import QColor, QImage, QPainter
+from PySide6.QtWidgets import QWidget
+
+from models import CameraStats
+
+DEFAULT_WIDTH = 640
+DEFAULT_HEIGHT = 480
+PANEL_WIDTH = 1280
+PANEL_HEIGHT = 800
+# Dernière image publiée + une réservée par consommateur (affichage, compositeur) + une en écriture.
+SLOT_COUNT = 4
+DISPLAY = "display"
+
+
+class CameraSource:
+    """Remplit un tableau (hauteur, largeur, 4) uint8 au format BGRA (`QImage.Format_RGB32`)."""
+
+    name = "camera"
+    fps = 0.0
+
+    def __init__(self, width: int = DEFAULT_WIDTH, height: int = DEFAULT_HEIGHT) -> None:
+        self.width = width
+        self.height = height
+
+    def open(self) -> None:
+        pass
+
+    def read_into(self, frame: np.ndarray, timeout: float) -> bool:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class SyntheticCameraSource(CameraSource):
+    """Mire animée calculée sur place dans le tampon (dégradés décalés + barre mobile)."""
+
+    def __init__(
+        self,
+        name: str,
+        tint: tuple[int, int, int] = (0, 0, 0),
+        fps: float = 30.0,
+        width: int = DEFAULT_WIDTH,
+        height: int = DEFAULT_HEIGHT,
+    ) -> None:
+        super().__init__(width, height)
+        self.name = name
+        self.fps = fps
+        self._tint = tint
+        self._tick = 0
+        self._base_x = np.zeros((height, width), dtype=np.uint8)
+        self._base_y = np.zeros((height, width), dtype=np.uint8)
+
+    def open(self) -> None:
+        self._base_x[:] = (np.arange(self.width, dtype=np.uint32) * 256 // self.width).astype(np.uint8)
+        self._base_y[:] = (np.arange(self.height, dtype=np.uint32) * 256 // self.height).astype(np.uint8)[:, None]
+
+    def read_into(self, frame: np.ndarray, timeout: float) -> bool:
+        self._tick += 1
+        t = self._tick
+        blue, green, red = self._tint[2], self._tint[1], self._tint[0]
+        np.add(self._base_x, np.uint8((t * 3 + blue) & 0xFF), out=frame[..., 0])
+        np.add(self._base_y, np.uint8((t * 2 + green) & 0xFF), out=frame[..., 1])
+        frame[..., 2] = red
+        frame[..., 3] = 0xFF
+        bar = self.width // 16
+        x = (t * 8) % (self.width - bar)
+        frame[:, x : x + bar, :3] = 0xFF
+        return True
+
+
+# --- V4L2 (Linux) : capture en mode read() au format YUYV ---------------------------------------
+
+_VIDIOC_QUERYCAP = 0x80685600
+_VIDIOC_S_FMT = 0xC0D05605
+_V4L2_BUF_TYPE_VIDEO_CAPTURE = 1
+_V4L2_CAP_VIDEO_CAPTURE = 0x00000001
+_V4L2_CAP_READWRITE = 0x01000000
+_V4L2_CAP_DEVICE_CAPS = 0x80000000
+_V4L2_FIELD_NONE = 1
+_V4L2_PIX_FMT_YUYV = int.from_bytes(b"YUYV", "little")
+_CAPABILITY = struct.Struct("<16s32s32sIII12x")
+_PIX_FORMAT = struct.Struct("<I4xIIIIII")
+_FORMAT_SIZE = 208
+
+
+class V4L2CameraSource(CameraSource):
+    """Périphérique V4L2 lu par `readv` dans un tampon brut préalloué, converti YUYV → BGRA sur place."""
+
+    def __init__(self, device: str, width: int = DEFAULT_WIDTH, height: int = DEFAULT_HEIGHT) -> None:
+        super().__init__(width, height)
+        self.name = Path(device).name
+        self._device = device
+        self._fd: int | None = None
+        self._raw = bytearray(width * height * 2)
+        self._yuyv = np.frombuffer(self._raw, dtype=np.uint8).reshape(height, width // 2, 4)
+        self._scratch = np.empty((4, height, width // 2), dtype=np.int32)
+
+    @staticmethod
+    def available(device: str) -> bool:
+        if not os.path.exists(device):
+            return False
+        try:
+            fd = os.open(device, os.O_RDWR | os.O_NONBLOCK)
+        except OSError:
+            return False
+        try:
+            caps = _query_caps(fd)
+        except OSError:
+            return False
+        finally:
+            os.close(fd)
+        return bool(caps & _V4L2_CAP_VIDEO_CAPTURE) and bool(caps & _V4L2_CAP_READWRITE)
+
+    def open(self) -> None:
+        fd = os.open(self._device, os.O_RDWR | os.O_NONBLOCK)
+        try:
+            import fcntl
+
+            request = bytearray(_FORMAT_SIZE)
+            _PIX_FORMAT.pack_into(
+                request, 0, _V4L2_BUF_TYPE_VIDEO_CAPTURE, self.width, self.height, _V4L2_PIX_FMT_YUYV,
+                _V4L2_FIELD_NONE, self.width * 2, len(self._raw),
+            )
+            fcntl.ioctl(fd, _VIDIOC_S_FMT, request)
+            _, width, height, pixel_format, *_ = _PIX_FORMAT.unpack_from(request)
+            if (width, height, pixel_format) != (self.width, self.height, _V4L2_PIX_FMT_YUYV):
+                raise OSError(f"{self._device}: unsupported format {width}x{height}")
+        except OSError:
+            os.close(fd)
+            raise
+        self._fd = fd
+
+    def read_into(self, frame: np.ndarray, timeout: float) -> bool:
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return False
+        try:
+            count = os.readv(self._fd, [self._raw])
+        except BlockingIOError:
+            return False
+        if count < len(self._raw):
+            return False
+        self._convert(frame)
+        return True
+
+    def _convert(self, frame: np.ndarray) -> None:
+        # BT.601 en entiers (×256) ; les composantes décalées vivent dans un tampon réutilisé.
+        y0, u, y1, v = self._scratch
+        np.subtract(self._yuyv[..., 0], 16, out=y0, dtype=np.int32)
+        np.subtract(self._yuyv[..., 2], 16, out=y1, dtype=np.int32)
+        np.subtract(self._yuyv[..., 1], 128, out=u, dtype=np.int32)
+        np.subtract(self._yuyv[..., 3], 128, out=v, dtype=np.int32)
+        y0 *= 298
+        y1 *= 298
+        pairs = frame.reshape(self.height, self.width // 2, 8)
+        for luma, offset in ((y0, 0), (y1, 4)):
+            pairs[..., offset + 0] = np.clip((luma + 516 * u + 128) >> 8, 0, 255)
+            pairs[..., offset + 1] = np.clip((luma - 100 * u - 208 * v + 128) >> 8, 0, 255)
+            pairs[..., offset + 2] = np.clip((luma + 409 * v + 128) >> 8, 0, 255)
+            pairs[..., offset + 3] = 0xFF
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def _query_caps(fd: int) -> int:
+    import fcntl
+
+    buffer = bytearray(_CAPABILITY.size)
+    fcntl.ioctl(fd, _VIDIOC_QUERYCAP, buffer)
+    _, _, _, _, capabilities, device_caps = _CAPABILITY.unpack(buffer)
+    return device_caps if capabilities & _V4L2_CAP_DEVICE_CAPS else capabilities
+
+
+def default_sources(kind: str = "synthetic") -> list[CameraSource]:
+    """Caméras arrière, gauche et droite ; `kind="v4l2"` prend /dev/video0..2 quand ils existent."""
+    names = ("Rear camera", "Left side", "Right side")
+    tints = ((40, 0, 0), (0, 40, 0), (0, 0, 40))
+    sources: list[CameraSource] = []
+    for index, (name, tint) in enumerate(zip(names, tints)):
+        device = f"/dev/video{index}"
+        if kind == "v4l2" and V4L2CameraSource.available(device):
+            source: CameraSource = V4L2CameraSource(device)
+            source.name = name
+        else:
+            source = SyntheticCameraSource(name, tint)
+        sources.append(source)
+    return sources
+
+
+class CameraFeed(QObject):
+    """Flux d'une source : thread de capture, tampons partagés et notification « dernière image »."""
+
+    frame_ready = Signal()
+
+    def __init__(self, source: CameraSource, parent=None) -> None:
+        super().__init__(parent)
+        self._source = source
+        width, height = source.width, source.height
+        self._buffers = [bytearray(width * height * 4) for _ in range(SLOT_COUNT)]
+        self._arrays = [np.frombuffer(buffer, dtype=np.uint8).reshape(height, width, 4) for buffer in self._buffers]
+        # Les QImage partagent la mémoire des bytearray : ni copie à la capture, ni à l'affichage.
+        self._images = [QImage(buffer, width, height, width * 4, QImage.Format_RGB32) for buffer in self._buffers]
+        self._lock = threading.Lock()
+        self._latest: int | None = None
+        self._reserved: dict[str, int] = {}
+        self._notify_pending = False
+        self._stats = CameraStats()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def name(self) -> str:
+        return self._source.name
+
+    @property
+    def source(self) -> CameraSource:
+        return self._source
+
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.is_running():
+            return
+        self._source.open()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._capture, name=f"camera-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._source.close()
+
+    @property
+    def size(self) -> tuple[int, int]:
+        return self._source.width, self._source.height
+
+    def acquire(self) -> QImage | None:
+        """Image la plus récente (thread GUI) ; elle reste réservée jusqu'au prochain `acquire`."""
+        with self._lock:
+            self._notify_pending = False
+            slot = self._take(DISPLAY)
+        return self._images[slot] if slot is not None else None
+
+    def acquire_array(self, consumer: str) -> np.ndarray | None:
+        """Comme `acquire`, pour un consommateur hors thread GUI ; retourne le tableau (h, l, 4)."""
+        with self._lock:
+            slot = self._take(consumer)
+        return self._arrays[slot] if slot is not None else None
+
+    def release(self, consumer: str) -> None:
+        with self._lock:
+            self._reserved.pop(consumer, None)
+
+    def _take(self, consumer: str) -> int | None:
+        if self._latest is not None:
+            self._reserved[consumer], self._latest = self._latest, None
+            self._stats.displayed += 1
+        return self._reserved.get(consumer)
+
+    def stats(self) -> CameraStats:
+        with self._lock:
+            return replace(self._stats)
+
+    def _capture(self) -> None:
+        interval = 1.0 / self._source.fps if self._source.fps > 0 else 0.0
+        deadline = time.monotonic()
+        while not self._stop.is_set():
+            with self._lock:
+                busy = set(self._reserved.values())
+                slot = next(i for i in range(SLOT_COUNT) if i != self._latest and i not in busy)
+            try:
+                captured = self._source.read_into(self._arrays[slot], timeout=0.2)
+            except OSError:
+                with self._lock:
+                    self._stats.errors += 1
+                if self._stop.wait(0.5):
+                    return
+                continue
+            if captured:
+                with self._lock:
+                    if self._latest is not None:
+                        self._stats.dropped += 1
+                    self._latest = slot
+                    self._stats.captured += 1
+                    notify = not self._notify_pending
+                    self._notify_pending = True
+                if notify:
+                    self.frame_ready.emit()
+            if interval:
+                deadline += interval
+                delay = deadline - time.monotonic()
+                if delay < -interval:
+                    deadline = time.monotonic()
+                elif delay > 0 and self._stop.wait(delay):
+                    return
+
+
+@dataclass(slots=True)
+class RemapTable:
+    """Correspondance sortie → entrées, en indices dans l'empilement des entrées.
+
+    `primary` donne, pour chaque pixel de sortie (ordre ligne), le pixel source
+    principal ; les pixels vus par deux caméras sont repris dans `blend_dst`
+    et fondus entre `blend_a` et `blend_b` avec le poids `blend_weight` (sur 256)
+    pour `blend_a`.
+    """
+
+    width: int
+    height: int
+    primary: np.ndarray
+    blend_dst: np.ndarray
+    blend_a: np.ndarray
+    blend_b: np.ndarray
+    blend_weight: np.ndarray
+
+
+@dataclass(slots=True)
+class CameraPose:
+    """Caméra sur le kart : cap (0 = avant, sens horaire), plongée, hauteur, position et champ horizontal."""
+
+    yaw_deg: float
+    pitch_deg: float
+    height_m: float
+    x_m: float
+    y_m: float
+    hfov_deg: float = 120.0
+
+
+# Arrière, gauche, droite, dans l'ordre de `default_sources`.
+DEFAULT_POSES = (
+    CameraPose(180.0, 35.0, 0.9, 0.0, -0.9),
+    CameraPose(270.0, 40.0, 0.8, -0.5, 0.0),
+    CameraPose(90.0, 40.0, 0.8, 0.5, 0.0),
+)
+KART_COLOR = 0xFF2F4CC6
+
+InputSizes = list[tuple[int, int]]
+
+
+def _stack_offsets(sizes: InputSizes) -> tuple[list[int], int]:
+    offsets, total = [], 0
+    for width, height in sizes:
+        offsets.append(total)
+        total += width * height
+    return offsets, total
+
+
+def mosaic_remap(sizes: InputSizes, width: int, height: int) -> RemapTable:
+    """Panoramique gauche | arrière | droite ; l'arrière est retourné horizontalement comme un rétroviseur."""
+    offsets, total = _stack_offsets(sizes)
+    black = total
+    primary = np.full(width * height, black, dtype=np.intp)
+    order = (1, 0, 2) if len(sizes) >= 3 else tuple(range(len(sizes)))
+    panel_width = width // len(order)
+    for column, index in enumerate(order):
+        in_w, in_h = sizes[index]
+        scale = min(panel_width / in_w, height / in_h)
+        out_w, out_h = int(in_w * scale), int(in_h * scale)
+        x0 = column * panel_width + (panel_width - out_w) // 2
+        y0 = (height - out_h) // 2
+        src_x = np.minimum((np.arange(out_w) / scale).astype(np.intp), in_w - 1)
+        src_y = np.minimum((np.arange(out_h) / scale).astype(np.intp), in_h - 1)
+        if index == 0:
+            src_x = src_x[::-1]
+        block = offsets[index] + src_y[:, None] * in_w + src_x[None, :]
+        primary.reshape(height, width)[y0 : y0 + out_h, x0 : x0 + out_w] = block
+    empty = np.empty(0, dtype=np.intp)
+    return RemapTable(width, height, primary, empty, empty, empty, np.empty(0, dtype=np.uint16))
+
+
+def birdeye_remap(
+    sizes: InputSizes,
+    width: int,
+    height: int,
+    poses: tuple[CameraPose, ...] = DEFAULT_POSES,
+    ground_width_m: float = 8.0,
+) -> RemapTable:
+    """Vue de dessus : chaque pixel de sol est projeté dans chaque caméra (sténopé), les deux meilleures sont fondues."""
+    offsets, total = _stack_offsets(sizes)
+    black, kart = total, total + 1
+    m_per_px = ground_width_m / width
+    u, v = np.meshgrid(np.arange(width, dtype=np.float64), np.arange(height, dtype=np.float64))
+    ground_x = ((u - width / 2) * m_per_px).ravel()
+    ground_y = ((height / 2 - v) * m_per_px).ravel()
+
+    count = min(len(sizes), len(poses))
+    index = np.full((count, ground_x.size), black, dtype=np.intp)
+    weight = np.full((count, ground_x.size), -1.0)
+    for k in range(count):
+        pose, (in_w, in_h) = poses[k], sizes[k]
+        yaw, pitch = np.radians(pose.yaw_deg), np.radians(pose.pitch_deg)
+        forward = np.array([np.sin(yaw) * np.cos(pitch), np.cos(yaw) * np.cos(pitch), -np.sin(pitch)])
+        right = np.array([np.cos(yaw), -np.sin(yaw), 0.0])
+        down = np.cross(forward, right)
+        dx, dy, dz = ground_x - pose.x_m, ground_y - pose.y_m, -pose.height_m
+        z_c = dx * forward[0] + dy * forward[1] + dz * forward[2]
+        x_c = dx * right[0] + dy * right[1]
+        y_c = dx * down[0] + dy * down[1] + dz * down[2]
+        focal = in_w / 2 / np.tan(np.radians(pose.hfov_deg) / 2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            px = np.rint(in_w / 2 + focal * x_c / z_c)
+            py = np.rint(in_h / 2 + focal * y_c / z_c)
+        valid = (z_c > 0.05) & (px >= 0) & (px < in_w) & (py >= 0) & (py < in_h)
+        index[k, valid] = offsets[k] + py[valid].astype(np.intp) * in_w + px[valid].astype(np.intp)
+        # Poids = cosinus de l'écart à l'axe optique : on privilégie la caméra qui voit le point de face.
+        weight[k, valid] = z_c[valid] / np.sqrt(dx[valid] ** 2 + dy[valid] ** 2 + dz**2)
+
+    order = np.argsort(-weight, axis=0)
+    pixels = np.arange(ground_x.size)
+    best, second = order[0], order[1] if count > 1 else order[0]
+    primary = index[best, pixels]
+    w_a, w_b = weight[best, pixels], weight[second, pixels]
+    both = (w_b > 0) & (second != best)
+    blend_dst = np.flatnonzero(both)
+    blend_weight = np.rint(256 * w_a[both] / (w_a[both] + w_b[both])).astype(np.uint16)
+
+    footprint = (np.abs(ground_x) < 0.6) & (np.abs(ground_y) < 1.0)
+    primary[footprint] = kart
+    keep = ~footprint[blend_dst]
+    blend_dst, blend_weight = blend_dst[keep], blend_weight[keep]
+    return RemapTable(
+        width,
+        height,
+        primary,
+        blend_dst,
+        index[best[blend_dst], blend_dst],
+        index[second[blend_dst], blend_dst],
+        blend_weight,
+    )
+
+
+class CompositeSource(CameraSource):
+    """Source composite : rassemble les dernières images des flux d'entrée selon une `RemapTable`.
+
+    Tourne dans le thread de capture de son propre `CameraFeed` ; l'image est
+    écrite directement dans le tampon de sortie du flux.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        inputs: list[CameraFeed],
+        build_table: Callable[[InputSizes, int, int], RemapTable],
+        width: int = PANEL_WIDTH,
+        height: int = PANEL_HEIGHT,
+        fps: float = 30.0,
+    ) -> None:
+        super().__init__(width, height)
+        self.name = name
+        self.fps = fps
+        self._inputs = inputs
+        self._build_table = build_table
+        self._consumer = f"composite:{name}"
+        self._table: RemapTable | None = None
+        self._stack: np.ndarray | None = None
+        self._last: list[np.ndarray | None] = [None] * len(inputs)
+
+    @property
+    def inputs(self) -> list[CameraFeed]:
+        return list(self._inputs)
+
+    def table(self) -> RemapTable:
+        """Table de correspondance, construite au premier appel (dans le thread de capture en service)."""
+        if self._table is None:
+            self._prepare()
+        return self._table
+
+    def _prepare(self) -> None:
+        sizes = [feed.size for feed in self._inputs]
+        table = self._build_table(sizes, self.width, self.height)
+        offsets, total = _stack_offsets(sizes)
+        # Entrées empilées + deux pixels constants (noir, silhouette du kart).
+        self._stack = np.zeros(total + 2, dtype=np.uint32)
+        self._stack[total:] = (0xFF000000, KART_COLOR)
+        self._views = [self._stack[offset : offset + w * h] for offset, (w, h) in zip(offsets, sizes)]
+        blend_count = table.blend_dst.size
+        self._blend_a = np.empty(blend_count, dtype=np.uint32)
+        self._blend_b = np.empty(blend_count, dtype=np.uint32)
+        self._accumulator = np.empty((blend_count, 4), dtype=np.uint16)
+        self._scratch = np.empty((blend_count, 4), dtype=np.uint16)
+        self._blended = np.empty(blend_count, dtype=np.uint32)
+        self._weight_a = table.blend_weight[:, None]
+        self._weight_b = (256 - table.blend_weight)[:, None]
+        self._table = table
+
+    def close(self) -> None:
+        for feed in self._inputs:
+            feed.release(self._consumer)
+        self._last = [None] * len(self._inputs)
+
+    def read_into(self, frame: np.ndarray, timeout: float) -> bool:
+        if self._table is None:
+            self._prepare()
+        changed = False
+        for k, feed in enumerate(self._inputs):
+            array = feed.acquire_array(self._consumer)
+            if array is not None and array is not self._last[k]:
+                np.copyto(self._views[k], array.reshape(-1).view(np.uint32))
+                self._last[k] = array
+                changed = True
+        if not changed:
+            return False
+        self._compose(frame.reshape(-1).view(np.uint32))
+        return True
+
+    def _compose(self, out: np.ndarray) -> None:
+        """Gather principal directement dans `out`, puis fondu des seuls pixels vus par deux caméras."""
+        table, stack = self._table, self._stack
+        np.take(stack, table.primary, out=out)
+        if table.blend_dst.size == 0:
+            return
+        np.take(stack, table.blend_a, out=self._blend_a)
+        np.take(stack, table.blend_b, out=self._blend_b)
+        accumulator, scratch = self._accumulator, self._scratch
+        np.multiply(self._blend_a.view(np.uint8).reshape(-1, 4), self._weight_a, out=accumulator)
+        np.multiply(self._blend_b.view(np.uint8).reshape(-1, 4), self._weight_b, out=scratch)
+        accumulator += scratch
+        accumulator >>= 8
+        np.copyto(self._blended.view(np.uint8).reshape(-1, 4), accumulator, casting="unsafe")
+        out[table.blend_dst] = self._blended
+
+
+class CameraTile(QWidget):
+    """Affiche la dernière image d'un flux ; ne demande un repaint que si la tuile est visible."""
+
+    def __init__(self, feed: CameraFeed | None, title: str = "", parent=None) -> None:
+        super().__init__(parent)
+        self.setObjectName("CameraTile")
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setMinimumSize(160, 120)
+        self._feed = feed
+        self._title = title or (feed.name if feed is not None else "")
+        if feed is not None:
+            feed.frame_ready.connect(self._on_frame_ready)
+
+    @property
+    def feed(self) -> CameraFeed | None:
+        return self._feed
+
+    def _on_frame_ready(self) -> None:
+        if self.isVisible():
+            self.update()
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#05080d"))
+        image = self._feed.acquire() if self._feed is not None else None
+        if image is not None:
+            target = _fit(image.width(), image.height(), self.rect())
+            painter.drawImage(target, image)
+        painter.setPen(QColor("#e8eef7"))
+        painter.drawText(self.rect().adjusted(10, 8, -10, -8), Qt.AlignLeft | Qt.AlignTop, self._title)
+
+
+def _fit(width: int, height: int, bounds: QRect) -> QRect:
+    scale = min(bounds.width() / width, bounds.height() / height)
+    w, h = round(width * scale), round(height * scale)
+    return QRect(bounds.x() + (bounds.width() - w) // 2, bounds.y() + (bounds.height() - h) // 2, w, h)
@@ -0,0 +1,274 @@
+"""Diffusion de la télémétrie vers les stands (PC de stand, enregistreurs) sur socket TCP.
+
+`FanoutServer` s'abonne à `telemetry_updated` comme `SessionRecorder` et
+réencode chaque trame avec le protocole binaire (`protocol.encode_into`) : un
+abonné lit le même flux d'octets qu'une liaison série et le décode avec
+`FrameDecoder` (voir `transport.TcpTelemetryService`).
+
+La boucle asyncio tourne dans son propre thread. Côté appelant (le thread GUI),
+`publish` se limite à encoder la trame dans un tampon partagé et, pour la
+première trame d'un lot, à réveiller la boucle ; sans abonné, rien n'est
+encodé. Les trames arrivées pendant `batch_interval_s` partent en une seule
+écriture par client.
+
+Chaque client a sa propre file d'envoi bornée. Tant que le socket accepte les
+octets, les lots partent directement ; quand il se bloque (`pause_writing`),
+ils s'accumulent dans la file, et le client est évincé (`abort`) si elle
+dépasse `max_queue_bytes` ou s'il reste bloqué plus de `max_stall_s`. Un
+abonné lent ne retarde ainsi ni les autres ni l'affichage pilote.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import socket
+import threading
+import time
+from collections import deque
+from dataclasses import replace
+
+from models import FanoutStats, TelemetryFrame
+from protocol import ProtocolError, encode_into
+from services import TelemetryService
+
+_LOG = logging.getLogger(__name__)
+
+DEFAULT_PORT = 5006
+BATCH_INTERVAL_S = 0.02
+MAX_QUEUE_BYTES = 256 * 1024
+MAX_STALL_S = 2.0
+# Tampon du transport asyncio au-delà duquel `pause_writing` est appelé.
+_WRITE_BUFFER_HIGH = 16 * 1024
+# Tampon d'émission du noyau borné : sinon il absorberait plusieurs secondes de flux
+# (autoréglage TCP) avant que le blocage d'un abonné ne soit visible.
+_SOCKET_SEND_BUFFER = 16 * 1024
+
+
+class _Subscriber(asyncio.Protocol):
+    """Un abonné : écrit directement tant que le transport suit, met en file sinon."""
+
+    def __init__(self, server: FanoutServer) -> None:
+        self._server = server
+        self._transport: asyncio.Transport | None = None
+        self._queue: deque[bytes] = deque()
+        self._queued = 0
+        self._paused_at: float | None = None
+        self.peer = None
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self._transport = transport
+        self.peer = transport.get_extra_info("peername")
+        sock = transport.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_SEND_BUFFER)
+        transport.set_write_buffer_limits(high=_WRITE_BUFFER_HIGH)
+        self._server._add(self)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._server._remove(self)
+        self._server._discard_queued(self._queued)
+        self._queue.clear()
+        self._queued = 0
+
+    def data_received(self, data: bytes) -> None:
+        # Flux descendant uniquement : ce que l'abonné envoie est ignoré.
+        pass
+
+    def pause_writing(self) -> None:
+        self._paused_at = time.monotonic()
+
+    def resume_writing(self) -> None:
+        self._paused_at = None
+        # `write` peut rappeler `pause_writing` : on s'arrête dès que le transport sature de nouveau.
+        while self._queue and self._paused_at is None:
+            chunk = self._queue.popleft()
+            self._queued -= len(chunk)
+            self._server._discard_queued(len(chunk))
+            self._transport.write(chunk)
+
+    def send(self, chunk: bytes, now: float) -> bool:
+        """Écrit ou met en file un lot ; faux si l'abonné doit être évincé."""
+        if self._paused_at is None and not self._queue:
+            self._transport.write(chunk)
+            return True
+        if self._paused_at is not None and now - self._paused_at > self._server.max_stall_s:
+            return False
+        self._queue.append(chunk)
+        self._queued += len(chunk)
+        self._server._stats.queued_bytes += len(chunk)
+        return self._queued <= self._server.max_queue_bytes
+
+    def abort(self) -> None:
+        if self._transport is not None:
+            self._transport.abort()
+
+
+class FanoutServer:
+    """Serveur TCP qui relaie les trames de `telemetry_updated` à tous les abonnés connectés."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        batch_interval_s: float = BATCH_INTERVAL_S,
+        max_queue_bytes: int = MAX_QUEUE_BYTES,
+        max_stall_s: float = MAX_STALL_S,
+    ) -> None:
+        self._host = host
+        self._port = port
+        self._batch_interval_s = max(0.0, batch_interval_s)
+        self.max_queue_bytes = max_queue_bytes
+        self.max_stall_s = max_stall_s
+        self._lock = threading.Lock()
+        self._pending = bytearray()
+        self._pending_frames = 0
+        self._seq = 0
+        self._running = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._error: BaseException | None = None
+        self._server: asyncio.Server | None = None
+        self._clients: set[_Subscriber] = set()
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._last_flush = 0.0
+        self._stats = FanoutStats()
+
+    @property
+    def bound_port(self) -> int:
+        return self._port
+
+    def stats(self) -> FanoutStats:
+        return replace(self._stats)
+
+    def attach(self, service: TelemetryService) -> None:
+        service.telemetry_updated.connect(self.publish)
+
+    def detach(self, service: TelemetryService) -> None:
+        service.telemetry_updated.disconnect(self.publish)
+
+    def start(self, timeout: float | None = 5.0) -> None:
+        """Ouvre le socket d'écoute ; lève `OSError` si l'adresse est indisponible."""
+        if self._thread is not None:
+            return
+        self._ready.clear()
+        self._error = None
+        self._thread = threading.Thread(target=self._serve, name="telemetry-fanout", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout)
+        if self._error is not None:
+            self._thread.join()
+            self._thread = None
+            raise self._error
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        with self._lock:
+            self._running = False
+            loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+        self._thread = None
+
+    def publish(self, frame: TelemetryFrame) -> None:
+        """Encode la trame pour le prochain lot ; appelée depuis le thread de `telemetry_updated`."""
+        self._seq += 1
+        if not self._stats.clients:
+            return
+        with self._lock:
+            if not self._running:
+                return
+            wake = not self._pending
+            try:
+                encode_into(self._pending, frame, self._seq - 1)
+            except ProtocolError:
+                # `encode_into` n'a rien laissé dans `_pending` : le lot en cours reste intact.
+                self._stats.dropped += 1
+                _LOG.warning("dropping unencodable frame %d", self._seq - 1, exc_info=True)
+                return
+            self._pending_frames += 1
+        if wake:
+            self._loop.call_soon_threadsafe(self._schedule_flush)
+
+    def _serve(self) -> None:
+        loop = asyncio.new_event_loop()
+        try:
+            self._server = loop.run_until_complete(
+                loop.create_server(lambda: _Subscriber(self), self._host, self._port)
+            )
+        except OSError as exc:
+            self._error = exc
+            loop.close()
+            self._ready.set()
+            return
+        self._port = self._server.sockets[0].getsockname()[1]
+        with self._lock:
+            self._loop = loop
+            self._running = True
+        _LOG.info("telemetry fan-out listening on %s:%d", self._host, self._port)
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            self._server.close()
+            for client in list(self._clients):
+                client.abort()
+            loop.run_until_complete(self._server.wait_closed())
+            # Laisse passer les `connection_lost` des clients interrompus.
+            loop.run_until_complete(asyncio.sleep(0))
+            with self._lock:
+                self._loop = None
+                self._pending.clear()
+                self._pending_frames = 0
+            loop.close()
+            self._server = None
+            self._flush_handle = None
+
+    def _schedule_flush(self) -> None:
+        if self._flush_handle is not None:
+            return
+        delay = self._last_flush + self._batch_interval_s - time.monotonic()
+        if delay <= 0:
+            self._flush()
+        else:
+            self._flush_handle = self._loop.call_later(delay, self._flush)
+
+    def _flush(self) -> None:
+        self._flush_handle = None
+        with self._lock:
+            if not self._pending:
+                return
+            chunk = bytes(self._pending)
+            frames = self._pending_frames
+            self._pending.clear()
+            self._pending_frames = 0
+        now = time.monotonic()
+        self._last_flush = now
+        stats = self._stats
+        stats.frames += frames
+        stats.batches += 1
+        for client in list(self._clients):
+            if client.send(chunk, now):
+                stats.bytes_sent += len(chunk)
+            else:
+                self._evict(client)
+
+    def _evict(self, client: _Subscriber) -> None:
+        _LOG.warning("evicting slow telemetry subscriber %s", client.peer)
+        self._stats.evicted += 1
+        client.abort()
+
+    def _add(self, client: _Subscriber) -> None:
+        self._clients.add(client)
+        self._stats.accepted += 1
+        self._stats.clients = len(self._clients)
+
+    def _remove(self, client: _Subscriber) -> None:
+        self._clients.discard(client)
+        self._stats.clients = len(self._clients)
+
+    def _discard_queued(self, size: int) -> None:
+        self._stats.queued_bytes -= size
@@ -0,0 +1,331 @@
+"""Mode flotte : un seul processus reçoit les flux de télémétrie de N karts (jusqu'à `MAX_KARTS`).
+
+Toutes les sources partagent une seule boucle asyncio, exécutée dans un thread
+dédié : un point d'écoute UDP par kart, un abonnement TCP au relais d'un kart
+(`fanout.FanoutServer`) ou une source simulée. Chaque trame décodée met à jour
+une ligne de `FleetState`, dont les colonnes sont des tableaux NumPy
+préalloués (une valeur par kart) ; aucun signal Qt n'est émis par trame.
+
+L'interface (`ui.FleetPage`) relit une copie de l'état au rythme de
+l'affichage et ne repeint que les cellules qui ont changé. Le classement suit
+la distance parcourue depuis le lancement.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+
+import numpy as np
+
+from models import FleetStats, GpsFixState, TelemetryFrame
+from protocol import FrameDecoder, decode_frames, encode_into, to_epoch_us
+from services import MockFrameGenerator
+from transport import RECONNECT_DELAY_S
+from trip import MAX_GAP_S, haversine_m
+
+_LOG = logging.getLogger(__name__)
+
+MAX_KARTS = 64
+# Âge de la dernière trame reçue au-delà duquel un kart est signalé en retard, puis perdu.
+STALE_AFTER_S = 1.0
+LOST_AFTER_S = 3.0
+_CPU_SAMPLE_S = 0.5
+
+COLUMNS: dict[str, np.dtype] = {
+    "speed_kmh": np.dtype(np.float32),
+    "max_speed_kmh": np.dtype(np.float32),
+    "battery_percent": np.dtype(np.uint8),
+    "heading_deg": np.dtype(np.float32),
+    "latitude": np.dtype(np.float64),
+    "longitude": np.dtype(np.float64),
+    "fix": np.dtype(np.bool_),
+    "reverse": np.dtype(np.bool_),
+    "distance_m": np.dtype(np.float64),
+    "frames": np.dtype(np.uint32),
+    "timestamp_us": np.dtype(np.int64),
+    # Réception locale (`time.monotonic_ns`), 0 tant qu'aucune trame n'est arrivée.
+    "received_ns": np.dtype(np.int64),
+}
+
+
+class FleetState:
+    """État courant de chaque kart, en colonnes de `capacity` valeurs ; lignes ajoutées par `add_kart`."""
+
+    def __init__(self, capacity: int = MAX_KARTS) -> None:
+        self._capacity = capacity
+        self._columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in COLUMNS.items()}
+        self._names: list[str] = []
+        self._lock = threading.Lock()
+        self._version = 0
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    @property
+    def names(self) -> list[str]:
+        return list(self._names)
+
+    @property
+    def version(self) -> int:
+        """Incrémenté à chaque trame : une lecture au même numéro peut être sautée."""
+        return self._version
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self._columns.values())
+
+    def add_kart(self, name: str) -> int:
+        with self._lock:
+            if len(self._names) >= self._capacity:
+                raise ValueError(f"fleet is full ({self._capacity} karts)")
+            self._names.append(name)
+            return len(self._names) - 1
+
+    def update(self, index: int, frame: TelemetryFrame, received_ns: int) -> None:
+        c = self._columns
+        gps = frame.gps
+        fix = gps.fix_state is not GpsFixState.NO_FIX
+        timestamp_us = to_epoch_us(frame.timestamp)
+        with self._lock:
+            if fix and c["fix"][index] and 0 < timestamp_us - c["timestamp_us"][index] <= MAX_GAP_S * 1e6:
+                c["distance_m"][index] += haversine_m(
+                    float(c["latitude"][index]), float(c["longitude"][index]), gps.latitude, gps.longitude
+                )
+            c["speed_kmh"][index] = frame.speed_kmh
+            if frame.speed_kmh > c["max_speed_kmh"][index]:
+                c["max_speed_kmh"][index] = frame.speed_kmh
+            c["battery_percent"][index] = frame.battery_percent
+            c["heading_deg"][index] = gps.heading_deg
+            if fix:
+                c["latitude"][index] = gps.latitude
+                c["longitude"][index] = gps.longitude
+            c["fix"][index] = fix
+            c["reverse"][index] = frame.reverse
+            c["frames"][index] += 1
+            c["timestamp_us"][index] = timestamp_us
+            c["received_ns"][index] = received_ns
+            self._version += 1
+
+    def snapshot(self) -> dict[str, np.ndarray]:
+        """Copie cohérente des colonnes, limitée aux karts déclarés."""
+        with self._lock:
+            count = len(self._names)
+            return {name: column[:count].copy() for name, column in self._columns.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            for column in self._columns.values():
+                column.fill(0)
+            self._version += 1
+
+
+class _KartDatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, fleet: FleetTelemetryService, index: int) -> None:
+        self._fleet = fleet
+        self._index = index
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        self._fleet._ingest_datagram(self._index, data)
+
+
+class _KartStreamProtocol(asyncio.Protocol):
+    def __init__(self, fleet: FleetTelemetryService, index: int) -> None:
+        self._fleet = fleet
+        self._index = index
+        self.closed = asyncio.get_running_loop().create_future()
+
+    def data_received(self, data: bytes) -> None:
+        with memoryview(data) as view:
+            self._fleet._ingest_stream(self._index, view)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        if not self.closed.done():
+            self.closed.set_result(None)
+
+
+class FleetTelemetryService:
+    """Reçoit les flux de tous les karts sur une boucle asyncio partagée et alimente `FleetState`.
+
+    Les sources sont déclarées avant `start` ; chacune retourne l'index de sa
+    ligne dans l'état.
+    """
+
+    def __init__(self, capacity: int = MAX_KARTS) -> None:
+        self._state = FleetState(capacity)
+        self._decoders: list[FrameDecoder] = []
+        self._openers: list = []
+        self._transports: list[asyncio.BaseTransport] = []
+        self._rx_bytes = 0
+        self._cpu_s = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._error: BaseException | None = None
+
+    @property
+    def state(self) -> FleetState:
+        return self._state
+
+    def add_udp(self, name: str, port: int, host: str = "0.0.0.0") -> int:
+        """Kart qui envoie ses trames en datagrammes sur son propre port."""
+        index = self._add(name)
+
+        async def open_endpoint(loop: asyncio.AbstractEventLoop) -> None:
+            transport, _ = await loop.create_datagram_endpoint(
+                lambda: _KartDatagramProtocol(self, index), local_addr=(host, port)
+            )
+            self._transports.append(transport)
+
+        self._openers.append(open_endpoint)
+        return index
+
+    def add_tcp(self, name: str, host: str, port: int) -> int:
+        """Kart dont on lit le relais (`--fanout`) ; reconnexion automatique."""
+        index = self._add(name)
+
+        async def open_subscription(loop: asyncio.AbstractEventLoop) -> None:
+            loop.create_task(self._subscribe(index, host, port))
+
+        self._openers.append(open_subscription)
+        return index
+
+    def add_synthetic(self, name: str, rate_hz: float = 25.0) -> int:
+        """Kart simulé (`MockFrameGenerator`) ; ses trames passent par l'encodage et le décodage réels."""
+        index = self._add(name)
+
+        async def open_generator(loop: asyncio.AbstractEventLoop) -> None:
+            loop.create_task(self._synthesize(index, rate_hz))
+
+        self._openers.append(open_generator)
+        return index
+
+    def start(self, timeout: float | None = 5.0) -> None:
+        """Ouvre toutes les sources ; lève `OSError` si un port UDP est indisponible."""
+        if self._thread is not None:
+            return
+        self._ready.clear()
+        self._error = None
+        self._thread = threading.Thread(target=self._serve, name="fleet-ingest", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout)
+        if self._error is not None:
+            self._thread.join()
+            self._thread = None
+            raise self._error
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        loop = self._loop
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+        self._thread.join()
+        self._thread = None
+
+    def stats(self) -> FleetStats:
+        frames = crc_errors = resyncs = 0
+        for decoder in self._decoders:
+            frames += decoder.stats.frames
+            crc_errors += decoder.stats.crc_errors
+            resyncs += decoder.stats.resyncs
+        return FleetStats(
+            karts=len(self._state),
+            frames=frames,
+            rx_bytes=self._rx_bytes,
+            crc_errors=crc_errors,
+            resyncs=resyncs,
+            ingest_cpu_s=self._cpu_s,
+        )
+
+    def _add(self, name: str) -> int:
+        if self._thread is not None:
+            raise RuntimeError("sources must be added before start()")
+        index = self._state.add_kart(name)
+        self._decoders.append(FrameDecoder())
+        return index
+
+    def _serve(self) -> None:
+        loop = asyncio.new_event_loop()
+        try:
+            for opener in self._openers:
+                loop.run_until_complete(opener(loop))
+        except OSError as exc:
+            self._error = exc
+            self._cancel_all(loop)
+            loop.close()
+            self._ready.set()
+            return
+        self._loop = loop
+        loop.create_task(self._sample_cpu())
+        _LOG.info("fleet ingest running for %d karts", len(self._state))
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            self._cancel_all(loop)
+            self._loop = None
+            loop.close()
+
+    def _cancel_all(self, loop: asyncio.AbstractEventLoop) -> None:
+        for transport in self._transports:
+            transport.close()
+        self._transports.clear()
+        tasks = asyncio.all_tasks(loop)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        loop.run_until_complete(asyncio.sleep(0))
+
+    async def _sample_cpu(self) -> None:
+        while True:
+            self._cpu_s = time.thread_time()
+            await asyncio.sleep(_CPU_SAMPLE_S)
+
+    async def _subscribe(self, index: int, host: str, port: int) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                transport, protocol = await loop.create_connection(
+                    lambda: _KartStreamProtocol(self, index), host, port
+                )
+            except OSError as exc:
+                _LOG.debug("kart %s unreachable at %s:%d: %s", self._state.names[index], host, port, exc)
+            else:
+                try:
+                    await protocol.closed
+                finally:
+                    transport.close()
+            await asyncio.sleep(RECONNECT_DELAY_S)
+
+    async def _synthesize(self, index: int, rate_hz: float) -> None:
+        loop = asyncio.get_running_loop()
+        generator = MockFrameGenerator(phase=index * 0.37)
+        buffer = bytearray()
+        period = 1.0 / rate_hz
+        # Décalage par kart : les sources ne se réveillent pas toutes au même instant.
+        next_at = loop.time() + period * (index * 0.618 % 1.0)
+        seq = 0
+        while True:
+            await asyncio.sleep(max(0.0, next_at - loop.time()))
+            next_at += period
+            buffer.clear()
+            encode_into(buffer, generator.next_frame(), seq)
+            seq += 1
+            self._ingest_datagram(index, buffer)
+
+    def _ingest_datagram(self, index: int, data: bytes | bytearray) -> None:
+        self._rx_bytes += len(data)
+        frames, _ = decode_frames(data, self._decoders[index].stats)
+        received_ns = time.monotonic_ns()
+        for frame in frames:
+            self._state.update(index, frame, received_ns)
+
+    def _ingest_stream(self, index: int, data: memoryview) -> None:
+        self._rx_bytes += len(data)
+        received_ns = time.monotonic_ns()
+        for frame in self._decoders[index].feed(data):
+            self._state.update(index, frame, received_ns)
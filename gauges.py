@@ -0,0 +1,433 @@
+"""Jauges peintes au `QPainter` : compteur de vitesse, batterie et boussole.
+
+Les parties fixes (cadran, graduations, libellés) sont dessinées une seule fois
+dans un `QPixmap` par couple (taille, couleurs du thème) ; chaque changement de
+valeur ne redessine que la partie mobile (aiguille, remplissage, valeur) et
+n'invalide que la région qu'elle occupait avant et après. Géométrie, polices,
+stylos et textes déjà mis en forme (`QStaticText`) sont eux aussi calculés une
+fois par taille ou par thème, pas à chaque image.
+
+Les polices sont plafonnées à `MAX_FONT_PX` : au-delà, le moteur raster ne met
+plus les glyphes en cache et redessine leurs contours à chaque image (plus de
+dix fois plus cher, davantage que le `QLabel` que la jauge remplace). La
+région invalidée pour une valeur est le rectangle de son texte mis en forme.
+
+Les couleurs viennent de la palette, donc du thème QSS : `color` pour le
+cadran, `selection-background-color` pour l'aiguille et
+`alternate-background-color` pour la piste.
+"""
+
+from __future__ import annotations
+
+import math
+
+from PySide6.QtCore import QEvent, QPoint, QPointF, QRect, QRectF, Qt
+from PySide6.QtGui import QColor, QFont, QPainter, QPalette, QPen, QPixmap, QPolygonF, QRegion, QStaticText
+from PySide6.QtWidgets import QWidget
+
+_BATTERY_OK = QColor("#3fbf6f")
+_BATTERY_LOW = QColor("#e0a030")
+_BATTERY_CRITICAL = QColor("#e04848")
+# Taille maximale des glyphes mis en cache par le moteur raster de Qt.
+MAX_FONT_PX = 64
+
+
+class Gauge(QWidget):
+    """Base : calque statique en cache, seule la région de la partie dynamique est invalidée.
+
+    Les sous-classes implémentent `_layout` (géométrie, appelée à chaque
+    changement de taille), `_theme` (polices et stylos, à chaque changement de
+    thème), `_paint_static`, `_paint_dynamic` et `_dynamic_region` (zone
+    couverte par la partie dynamique dans l'état courant).
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        # Le calque statique contient le fond des ancêtres : Qt n'a pas à les repeindre sous la jauge.
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self._static: QPixmap | None = None
+        self._static_key: tuple | None = None
+        self._layout_size: tuple[int, int] | None = None
+        # Région dynamique de l'état courant, réutilisée comme « avant » au changement suivant.
+        self._region: QRegion | None = None
+        self._static_texts: dict[str, tuple[QStaticText, int, int]] = {}
+        self._static_renders = 0
+
+    @property
+    def static_renders(self) -> int:
+        return self._static_renders
+
+    def _change(self, apply) -> bool:
+        """Applique un changement d'état et invalide l'ancienne et la nouvelle région dynamique."""
+        # Géométrie et polices à jour : la région du texte en dépend.
+        self._static_layer()
+        before = self._region if self._region is not None else self._dynamic_region()
+        apply()
+        self._region = self._dynamic_region()
+        self.update(before.united(self._region))
+        return True
+
+    def _ensure_layout(self) -> None:
+        size = (self.width(), self.height())
+        if size != self._layout_size:
+            self._layout_size = size
+            self._layout()
+
+    def _static_layer(self) -> QPixmap:
+        self._ensure_layout()
+        # Couleurs et police n'entrent pas dans la clé : `changeEvent` la remet à zéro.
+        # La position dans la fenêtre y entre, le fond des ancêtres en dépend.
+        key = (self._layout_size, self.devicePixelRatioF(), self.mapTo(self.window(), QPoint()))
+        if key != self._static_key:
+            self._region = None
+            self._static_texts.clear()
+            self._theme()
+            ratio = self.devicePixelRatioF()
+            pixmap = QPixmap(max(1, round(self.width() * ratio)), max(1, round(self.height() * ratio)))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(self.palette().color(self.backgroundRole()))
+            painter = QPainter(pixmap)
+            self._paint_backdrop(painter)
+            painter.setRenderHint(QPainter.Antialiasing)
+            self._paint_static(painter)
+            painter.end()
+            self._static, self._static_key = pixmap, key
+            self._static_renders += 1
+        return self._static
+
+    def _paint_backdrop(self, painter: QPainter) -> None:
+        """Fond propre de chaque ancêtre (QSS compris) sous la jauge, de la fenêtre au parent."""
+        ancestors = []
+        widget = self.parentWidget()
+        while widget is not None:
+            ancestors.append(widget)
+            widget = None if widget.isWindow() else widget.parentWidget()
+        for ancestor in reversed(ancestors):
+            area = QRect(self.mapTo(ancestor, QPoint()), self.size())
+            ancestor.render(painter, QPoint(), QRegion(area), QWidget.RenderFlag.DrawWindowBackground)
+
+    def changeEvent(self, event) -> None:
+        if event.type() in (QEvent.PaletteChange, QEvent.StyleChange, QEvent.FontChange):
+            self._static_key = None
+            self.update()
+        super().changeEvent(event)
+
+    def paintEvent(self, event) -> None:
+        layer = self._static_layer()
+        painter = QPainter(self)
+        # Le découpage système du widget limite déjà la copie à la région invalidée.
+        painter.drawPixmap(0, 0, layer)
+        painter.setRenderHint(QPainter.Antialiasing)
+        self._paint_dynamic(painter)
+
+    def _static_text(self, text: str, font: QFont) -> tuple[QStaticText, int, int]:
+        """`QStaticText` et dimensions, mis en forme une seule fois par valeur (cache vidé avec le calque)."""
+        entry = self._static_texts.get(text)
+        if entry is None:
+            static = QStaticText(text)
+            static.setTextFormat(Qt.PlainText)
+            static.prepare(font=font)
+            size = static.size()
+            entry = self._static_texts[text] = (static, math.ceil(size.width()), math.ceil(size.height()))
+        return entry
+
+    def _text_rect(self, rect: QRectF, text: str, font: QFont) -> QRect:
+        """Rectangle, aligné sur les pixels, occupé par `text` centré dans `rect`."""
+        _, width, height = self._static_text(text, font)
+        center = rect.center()
+        return QRect(round(center.x() - width / 2), round(center.y() - height / 2), width, height)
+
+    def _draw_centered(self, painter: QPainter, rect: QRectF, text: str, font: QFont) -> None:
+        painter.setFont(font)
+        painter.drawStaticText(self._text_rect(rect, text, font).topLeft(), self._static_text(text, font)[0])
+
+    def _accent(self) -> QColor:
+        return self.palette().color(QPalette.Highlight)
+
+    def _foreground(self) -> QColor:
+        return self.palette().color(QPalette.WindowText)
+
+    def _scaled_font(self, pixel_size: float, weight: QFont.Weight = QFont.Normal) -> QFont:
+        font = QFont(self.font())
+        font.setPixelSize(max(6, min(MAX_FONT_PX, round(pixel_size))))
+        font.setWeight(weight)
+        return font
+
+    def _layout(self) -> None:
+        raise NotImplementedError
+
+    def _theme(self) -> None:
+        raise NotImplementedError
+
+    def _paint_static(self, painter: QPainter) -> None:
+        raise NotImplementedError
+
+    def _paint_dynamic(self, painter: QPainter) -> None:
+        raise NotImplementedError
+
+    def _dynamic_region(self) -> QRegion:
+        raise NotImplementedError
+
+
+class _Dial(Gauge):
+    """Géométrie commune aux cadrans ronds (carré centré)."""
+
+    def _layout(self) -> None:
+        side = min(self.width(), self.height())
+        self._center = QPointF(self.width() / 2, self.height() / 2)
+        self._radius = max(1.0, side / 2 - 4)
+
+    def _polar(self, radius: float, angle_deg: float) -> QPointF:
+        """Point à `radius` du centre ; 0° à droite, sens trigonométrique."""
+        angle = math.radians(angle_deg)
+        return QPointF(self._center.x() + radius * math.cos(angle), self._center.y() - radius * math.sin(angle))
+
+    def _box(self, cx: float, cy: float, width: float, height: float) -> QRectF:
+        """Rectangle centré en (cx, cy) ; position et dimensions en fractions du rayon."""
+        r = self._radius
+        return QRectF(
+            self._center.x() + (cx - width / 2) * r, self._center.y() + (cy - height / 2) * r, width * r, height * r
+        )
+
+
+class SpeedGauge(_Dial):
+    """Compteur : arc de 240°, aiguille et valeur numérique ; seule l'aiguille et la valeur sont repeintes."""
+
+    SWEEP_DEG = 240.0
+    START_DEG = 210.0
+
+    def __init__(self, max_kmh: int = 120, major_step: int = 20, parent=None) -> None:
+        super().__init__(parent)
+        self.setObjectName("SpeedGauge")
+        self.setMinimumSize(180, 180)
+        self._max = max_kmh
+        self._major_step = major_step
+        self._angle = self.START_DEG
+        self._text = "0"
+
+    def set_speed(self, speed_kmh: float) -> bool:
+        """Retourne vrai si l'affichage change (aiguille au quart de degré, valeur à l'unité)."""
+        ratio = max(0.0, min(1.0, speed_kmh / self._max))
+        angle = round((self.START_DEG - self.SWEEP_DEG * ratio) * 4) / 4
+        text = f"{speed_kmh:0.0f}"
+        if angle == self._angle and text == self._text:
+            return False
+
+        def apply() -> None:
+            self._angle, self._text = angle, text
+
+        return self._change(apply)
+
+    def _layout(self) -> None:
+        super()._layout()
+        self._value_rect = self._box(0, 0.39, 0.9, 0.34)
+        self._unit_rect = self._box(0, 0.65, 0.8, 0.18)
+        self._needle_width = max(3.0, self._radius * 0.05)
+        self._hub_radius = self._needle_width * 1.6
+
+    def _theme(self) -> None:
+        self._value_font = self._scaled_font(self._radius * 0.3, QFont.Bold)
+        self._value_pen = QPen(self._foreground())
+        self._needle_pen = QPen(self._accent(), self._needle_width)
+        self._needle_pen.setCapStyle(Qt.RoundCap)
+
+    def _paint_static(self, painter: QPainter) -> None:
+        radius = self._radius
+        track = QPen(self.palette().color(QPalette.AlternateBase), max(4.0, radius * 0.06))
+        track.setCapStyle(Qt.RoundCap)
+        painter.setPen(track)
+        painter.drawArc(
+            self._box(0, 0, 1.84, 1.84), round((self.START_DEG - self.SWEEP_DEG) * 16), round(self.SWEEP_DEG * 16)
+        )
+
+        foreground = self._foreground()
+        painter.setFont(self._scaled_font(radius * 0.14))
+        minor_step = self._major_step / 2
+        for index in range(int(self._max / minor_step) + 1):
+            value = index * minor_step
+            angle = self.START_DEG - self.SWEEP_DEG * value / self._max
+            major = index % 2 == 0
+            painter.setPen(QPen(foreground, 3 if major else 1.5))
+            painter.drawLine(self._polar(radius * (0.72 if major else 0.78), angle), self._polar(radius * 0.84, angle))
+            if major:
+                label = self._polar(radius * 0.58, angle)
+                rect = QRectF(label.x() - radius * 0.2, label.y() - radius * 0.1, radius * 0.4, radius * 0.2)
+                painter.drawText(rect, Qt.AlignCenter, f"{value:.0f}")
+        muted = QColor(foreground)
+        muted.setAlphaF(0.6)
+        painter.setPen(muted)
+        painter.setFont(self._scaled_font(radius * 0.12))
+        painter.drawText(self._unit_rect, Qt.AlignCenter, "km/h")
+        # Moyeu fixe : l'aiguille part de son bord et ne le recouvre qu'en sa propre couleur.
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._accent())
+        painter.drawEllipse(self._center, self._hub_radius, self._hub_radius)
+
+    def _needle(self) -> tuple[QPointF, QPointF]:
+        return self._polar(self._hub_radius, self._angle), self._polar(self._radius * 0.8, self._angle)
+
+    def _paint_dynamic(self, painter: QPainter) -> None:
+        painter.setPen(self._value_pen)
+        self._draw_centered(painter, self._value_rect, self._text, self._value_font)
+        painter.setPen(self._needle_pen)
+        painter.drawLine(*self._needle())
+
+    def _dynamic_region(self) -> QRegion:
+        pad = self._needle_width / 2 + 2
+        needle = QRectF(*self._needle()).normalized().adjusted(-pad, -pad, pad, pad).toAlignedRect()
+        return QRegion(self._text_rect(self._value_rect, self._text, self._value_font)).united(needle)
+
+
+class CompassGauge(_Dial):
+    """Boussole : rose fixe en cache, flèche tournante et cap en degrés."""
+
+    _ARROW = ((0.0, -0.5), (0.16, 0.12), (0.0, 0.02), (-0.16, 0.12))
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.setObjectName("CompassGauge")
+        self.setMinimumSize(72, 72)
+        self._heading = 0.0
+        self._text = "--°"
+
+    def set_heading(self, heading_deg: float) -> bool:
+        heading = round(heading_deg % 360.0 * 2) / 2
+        text = f"{heading_deg % 360.0:.0f}°"
+        if heading == self._heading and text == self._text:
+            return False
+
+        def apply() -> None:
+            self._heading, self._text = heading, text
+
+        return self._change(apply)
+
+    def _layout(self) -> None:
+        super()._layout()
+        self._value_rect = self._box(0, 0.31, 0.8, 0.3)
+        self._arrow_heading: float | None = None
+
+    def _theme(self) -> None:
+        self._value_font = self._scaled_font(self._radius * 0.2)
+        self._value_pen = QPen(self._foreground())
+        self._arrow_brush = self._accent()
+
+    def _paint_static(self, painter: QPainter) -> None:
+        radius = self._radius
+        painter.setPen(QPen(self.palette().color(QPalette.AlternateBase), max(2.0, radius * 0.05)))
+        painter.drawEllipse(self._center, radius * 0.95, radius * 0.95)
+        painter.setPen(QPen(self._foreground(), 1.5))
+        for index in range(12):
+            # Cap 0° vers le haut, sens horaire : angle trigonométrique 90° - cap.
+            angle = 90 - index * 30
+            painter.drawLine(
+                self._polar(radius * (0.8 if index % 3 == 0 else 0.86), angle), self._polar(radius * 0.93, angle)
+            )
+        painter.setFont(self._scaled_font(radius * 0.2, QFont.DemiBold))
+        for index, name in enumerate("NESW"):
+            label = self._polar(radius * 0.64, 90 - index * 90)
+            rect = QRectF(label.x() - radius * 0.2, label.y() - radius * 0.14, radius * 0.4, radius * 0.28)
+            painter.drawText(rect, Qt.AlignCenter, name)
+
+    def _arrow(self) -> QPolygonF:
+        """Flèche au cap courant, calculée une fois par cap (région puis peinture)."""
+        if self._arrow_heading != self._heading:
+            angle = math.radians(self._heading)
+            sin, cos = math.sin(angle) * self._radius, math.cos(angle) * self._radius
+            cx, cy = self._center.x(), self._center.y()
+            self._arrow_polygon = QPolygonF(
+                [QPointF(cx + x * cos - y * sin, cy + x * sin + y * cos) for x, y in self._ARROW]
+            )
+            self._arrow_heading = self._heading
+        return self._arrow_polygon
+
+    def _paint_dynamic(self, painter: QPainter) -> None:
+        painter.setPen(self._value_pen)
+        self._draw_centered(painter, self._value_rect, self._text, self._value_font)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._arrow_brush)
+        painter.drawPolygon(self._arrow())
+
+    def _dynamic_region(self) -> QRegion:
+        arrow = self._arrow().boundingRect().adjusted(-2, -2, 2, 2).toAlignedRect()
+        return QRegion(self._text_rect(self._value_rect, self._text, self._value_font)).united(arrow)
+
+
+class BatteryGauge(Gauge):
+    """Pile horizontale : contour fixe en cache, remplissage et pourcentage repeints à la demande."""
+
+    LOW_PERCENT = 30
+    CRITICAL_PERCENT = 15
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.setObjectName("BatteryGauge")
+        self.setMinimumSize(64, 24)
+        self._percent = 100
+
+    def set_percent(self, percent: int) -> bool:
+        percent = max(0, min(100, int(percent)))
+        if percent == self._percent:
+            return False
+        if self._level_color(percent) is not self._level_color(self._percent):
+            # Changement de couleur : tout le remplissage est à repeindre.
+            self._ensure_layout()
+            self._percent = percent
+            self._region = None
+            self.update(self._inner)
+            return True
+
+        self._ensure_layout()
+        before = self._fill_rect().width()
+
+        def apply() -> None:
+            self._percent = percent
+
+        self._change(apply)
+        # Colonnes entre l'ancien et le nouveau bord du remplissage.
+        after = self._fill_rect().width()
+        inner = self._inner
+        self.update(QRect(inner.left() + min(before, after), inner.top(), abs(after - before), inner.height()))
+        return True
+
+    def _layout(self) -> None:
+        height = min(self.height() - 2, self.width() * 0.42)
+        width = min(self.width() - 2 - height * 0.12, height * 2.4)
+        self._body = QRectF((self.width() - width - height * 0.12) / 2, (self.height() - height) / 2, width, height)
+        inset = max(2.0, height * 0.1)
+        self._inner = self._body.adjusted(inset, inset, -inset, -inset).toAlignedRect()
+
+    def _theme(self) -> None:
+        self._text_font = self._scaled_font(self._inner.height() * 0.7, QFont.Bold)
+        self._text_pen = QPen(self._foreground())
+
+    def _level_color(self, percent: int) -> QColor:
+        if percent <= self.CRITICAL_PERCENT:
+            return _BATTERY_CRITICAL
+        if percent <= self.LOW_PERCENT:
+            return _BATTERY_LOW
+        return _BATTERY_OK
+
+    def _fill_rect(self) -> QRect:
+        inner = self._inner
+        return QRect(inner.left(), inner.top(), round(inner.width() * self._percent / 100), inner.height())
+
+    def _paint_static(self, painter: QPainter) -> None:
+        body = self._body
+        painter.setPen(QPen(self._foreground(), max(1.5, body.height() * 0.06)))
+        painter.drawRoundedRect(body, body.height() * 0.16, body.height() * 0.16)
+        terminal = QRectF(
+            body.right() + 1, body.center().y() - body.height() * 0.2, body.height() * 0.1, body.height() * 0.4
+        )
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._foreground())
+        painter.drawRect(terminal)
+
+    def _paint_dynamic(self, painter: QPainter) -> None:
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.fillRect(self._fill_rect(), self._level_color(self._percent))
+        painter.setPen(self._text_pen)
+        self._draw_centered(painter, QRectF(self._inner), f"{self._percent}%", self._text_font)
+
+    def _dynamic_region(self) -> QRegion:
+        # Le texte seulement : `set_percent` invalide lui-même la bande de remplissage modifiée.
+        return QRegion(self._text_rect(QRectF(self._inner), f"{self._percent}%", self._text_font))
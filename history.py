@@ -0,0 +1,166 @@
+"""Historique de télémétrie en colonnes NumPy (tampons circulaires préalloués).
+
+Chaque colonne est allouée en double longueur et chaque valeur est écrite deux
+fois (à `i` et `i + capacity`) : n'importe quelle fenêtre des `capacity`
+dernières valeurs est alors une vue contiguë, sans copie.
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from models import TelemetryFrame
+
+COLUMNS: dict[str, np.dtype] = {
+    "t": np.dtype(np.float64),
+    "speed_kmh": np.dtype(np.float32),
+    "battery_percent": np.dtype(np.float32),
+    "latitude": np.dtype(np.float64),
+    "longitude": np.dtype(np.float64),
+    "heading_deg": np.dtype(np.float32),
+    "reverse": np.dtype(np.bool_),
+}
+
+
+class TelemetryHistory:
+    def __init__(self, capacity: int = 1 << 18, min_interval_s: float = 0.0) -> None:
+        self._capacity = max(2, int(capacity))
+        self._min_interval_s = min_interval_s
+        self._last_t = -float("inf")
+        self._columns = {
+            name: np.zeros(2 * self._capacity, dtype=dtype) for name, dtype in COLUMNS.items()
+        }
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self._columns.values())
+
+    def clear(self) -> None:
+        self._head = 0
+        self._size = 0
+        self._last_t = -float("inf")
+
+    def append(self, frame: TelemetryFrame, t: float | None = None) -> bool:
+        """Ajoute une trame ; ignorée si elle arrive moins de `min_interval_s` après la précédente."""
+        if t is None:
+            t = time.monotonic()
+        if t - self._last_t < self._min_interval_s:
+            return False
+        self.append_values(
+            t,
+            frame.speed_kmh,
+            frame.battery_percent,
+            frame.gps.latitude,
+            frame.gps.longitude,
+            frame.gps.heading_deg,
+            frame.reverse,
+        )
+        return True
+
+    def append_values(
+        self,
+        t: float,
+        speed_kmh: float,
+        battery_percent: float,
+        latitude: float,
+        longitude: float,
+        heading_deg: float,
+        reverse: bool,
+    ) -> None:
+        self._last_t = t
+        i = self._head
+        j = i + self._capacity
+        columns = self._columns
+        for name, value in (
+            ("t", t),
+            ("speed_kmh", speed_kmh),
+            ("battery_percent", battery_percent),
+            ("latitude", latitude),
+            ("longitude", longitude),
+            ("heading_deg", heading_deg),
+            ("reverse", reverse),
+        ):
+            column = columns[name]
+            column[i] = value
+            column[j] = value
+        self._head = (i + 1) % self._capacity
+        if self._size < self._capacity:
+            self._size += 1
+
+    def column(self, name: str, last_n: int | None = None) -> np.ndarray:
+        """Vue en lecture seule des `last_n` dernières valeurs (toutes par défaut)."""
+        n = self._size if last_n is None else max(0, min(int(last_n), self._size))
+        end = self._head + self._capacity if self._size == self._capacity else self._head
+        view = self._columns[name][end - n : end]
+        view.flags.writeable = False
+        return view
+
+    def window_since(self, t0: float) -> int:
+        """Nombre d'échantillons dont le timestamp est >= t0 (recherche dichotomique)."""
+        t = self.column("t")
+        return self._size - int(np.searchsorted(t, t0, side="left"))
+
+    def stats(self, name: str, last_n: int | None = None) -> tuple[float, float, float] | None:
+        values = self.column(name, last_n)
+        if values.size == 0:
+            return None
+        return float(values.min()), float(values.max()), float(values.mean(dtype=np.float64))
+
+    def downsample(
+        self, name: str, threshold: int, last_n: int | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        return lttb(self.column("t", last_n), self.column(name, last_n), threshold)
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> tuple[np.ndarray, np.ndarray]:
+    """Largest-Triangle-Three-Buckets vectorisé.
+
+    Variante sans dépendance séquentielle : le sommet gauche du triangle est la
+    moyenne du seau précédent plutôt que le point retenu, ce qui permet de
+    traiter tous les seaux en une passe NumPy.
+    """
+    n = x.size
+    if threshold >= n or threshold < 3:
+        return np.array(x, dtype=np.float64), np.array(y, dtype=np.float64)
+
+    xf = np.asarray(x, dtype=np.float64)
+    yf = np.asarray(y, dtype=np.float64)
+    buckets = threshold - 2
+    edges = 1 + (np.arange(buckets + 1) * (n - 2)) // buckets
+    starts = edges[:-1]
+    counts = np.diff(edges)
+
+    sum_x = np.add.reduceat(xf[1:-1], starts - 1)
+    sum_y = np.add.reduceat(yf[1:-1], starts - 1)
+    mean_x = sum_x / counts
+    mean_y = sum_y / counts
+    prev_x = np.concatenate(([xf[0]], mean_x[:-1]))
+    prev_y = np.concatenate(([yf[0]], mean_y[:-1]))
+    next_x = np.concatenate((mean_x[1:], [xf[-1]]))
+    next_y = np.concatenate((mean_y[1:], [yf[-1]]))
+
+    bucket_of = np.repeat(np.arange(buckets), counts)
+    px = xf[1:-1]
+    py = yf[1:-1]
+    area = np.abs(
+        (prev_x[bucket_of] - next_x[bucket_of]) * (py - prev_y[bucket_of])
+        - (prev_x[bucket_of] - px) * (next_y[bucket_of] - prev_y[bucket_of])
+    )
+    best = np.maximum.reduceat(area, starts - 1)
+    hits = np.flatnonzero(area == best[bucket_of])
+    _, first = np.unique(bucket_of[hits], return_index=True)
+    picked = hits[first] + 1
+
+    index = np.concatenate(([0], picked, [n - 1]))
+    return xf[index], yf[index]
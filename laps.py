@@ -0,0 +1,358 @@
+"""Chronométrage au tour : ligne de départ/arrivée, portes de secteur et voie des stands.
+
+Le circuit (`Track`) est décrit en JSON, en coordonnées GPS :
+
+    {"name": "Demo", "start_finish": [[lat, lon], [lat, lon]],
+     "sectors": [[[lat, lon], [lat, lon]], ...], "pit_lane": [[lat, lon], ...],
+     "min_lap_s": 20}
+
+Les portes sont projetées en mètres dans un plan local (équirectangulaire,
+centré sur la ligne d'arrivée). Entre deux positions successives, le
+déplacement du kart est un segment : `GateIndex`, une grille de cellules de
+`cell_m` mètres, ne renvoie que les portes dont l'emprise touche les cellules
+de ce segment, et seules celles-ci sont testées par intersection. Le
+paramètre d'intersection donne l'instant du franchissement entre les deux
+trames (interpolation linéaire), plus précis que l'horodatage des trames.
+
+Les portes de secteur ne comptent que franchies dans l'ordre ; la ligne
+d'arrivée est toujours acceptée (au-delà de `min_lap_s`), mais un tour dont
+un secteur manque, ou qui passe par la voie des stands, n'entre pas dans les
+meilleurs temps. L'écart au meilleur tour compare le temps écoulé à celui du
+meilleur tour à la même distance parcourue depuis la ligne.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from pathlib import Path
+
+from models import GpsFixState, LapStats, TelemetryFrame
+from trip import EARTH_RADIUS_M, MAX_GAP_S
+
+GRID_CELL_M = 50.0
+MIN_LAP_S = 20.0
+_EPOCH = datetime(1970, 1, 1)
+
+Point = tuple[float, float]
+Segment = tuple[Point, Point]
+
+
+class Track:
+    """Géométrie du circuit en (latitude, longitude) ; la porte 0 est la ligne de départ/arrivée."""
+
+    def __init__(
+        self,
+        name: str,
+        start_finish: Segment,
+        sectors: list[Segment] | None = None,
+        pit_lane: list[Point] | None = None,
+        min_lap_s: float = MIN_LAP_S,
+    ) -> None:
+        self.name = name
+        self.gates: list[Segment] = [start_finish, *(sectors or [])]
+        self.pit_lane: list[Point] = list(pit_lane or [])
+        self.min_lap_s = min_lap_s
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Track:
+        def point(value) -> Point:
+            latitude, longitude = value
+            return float(latitude), float(longitude)
+
+        def segment(value) -> Segment:
+            a, b = value
+            return point(a), point(b)
+
+        return cls(
+            name=str(data.get("name", "Track")),
+            start_finish=segment(data["start_finish"]),
+            sectors=[segment(gate) for gate in data.get("sectors", [])],
+            pit_lane=[point(vertex) for vertex in data.get("pit_lane", [])],
+            min_lap_s=float(data.get("min_lap_s", MIN_LAP_S)),
+        )
+
+    @classmethod
+    def load(cls, path: Path) -> Track:
+        try:
+            return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"invalid track file {path}: {exc}") from exc
+
+
+class Projection:
+    """Plan local en mètres (x vers l'est, y vers le nord) autour d'une origine."""
+
+    def __init__(self, latitude: float, longitude: float) -> None:
+        self._lat0 = latitude
+        self._lon0 = longitude
+        self._m_per_deg_lat = math.radians(EARTH_RADIUS_M)
+        self._m_per_deg_lon = self._m_per_deg_lat * math.cos(math.radians(latitude))
+
+    def to_local(self, latitude: float, longitude: float) -> Point:
+        return (longitude - self._lon0) * self._m_per_deg_lon, (latitude - self._lat0) * self._m_per_deg_lat
+
+
+def segment_intersection(p: Point, q: Point, a: Point, b: Point) -> float | None:
+    """Paramètre t ∈ ]0, 1] du point où `p→q` coupe `a→b`, ou None.
+
+    L'intervalle est semi-ouvert : un passage exactement sur une trame n'est
+    compté qu'une fois, sur le segment qui y arrive.
+    """
+    rx, ry = q[0] - p[0], q[1] - p[1]
+    sx, sy = b[0] - a[0], b[1] - a[1]
+    denom = rx * sy - ry * sx
+    if denom == 0.0:
+        return None
+    ax, ay = a[0] - p[0], a[1] - p[1]
+    t = (ax * sy - ay * sx) / denom
+    u = (ax * ry - ay * rx) / denom
+    if 0.0 < t <= 1.0 and 0.0 <= u <= 1.0:
+        return t
+    return None
+
+
+def point_in_polygon(point: Point, polygon: list[Point]) -> bool:
+    x, y = point
+    inside = False
+    j = len(polygon) - 1
+    for i in range(len(polygon)):
+        xi, yi = polygon[i]
+        xj, yj = polygon[j]
+        if (yi > y) != (yj > y) and x < (xj - xi) * (y - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+class GateIndex:
+    """Grille uniforme : cellule (ix, iy) → portes dont la boîte englobante touche la cellule."""
+
+    def __init__(self, gates: list[Segment], cell_m: float = GRID_CELL_M) -> None:
+        self._cell_m = cell_m
+        self._cells: dict[tuple[int, int], tuple[int, ...]] = {}
+        cells: dict[tuple[int, int], list[int]] = {}
+        for index, (a, b) in enumerate(gates):
+            for cell in self._cells_between(a, b):
+                cells.setdefault(cell, []).append(index)
+        self._cells = {cell: tuple(indices) for cell, indices in cells.items()}
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def _cells_between(self, a: Point, b: Point):
+        size = self._cell_m
+        x0, x1 = sorted((math.floor(a[0] / size), math.floor(b[0] / size)))
+        y0, y1 = sorted((math.floor(a[1] / size), math.floor(b[1] / size)))
+        for ix in range(x0, x1 + 1):
+            for iy in range(y0, y1 + 1):
+                yield ix, iy
+
+    def candidates(self, p: Point, q: Point) -> tuple[int, ...] | set[int]:
+        """Portes à tester pour le déplacement `p→q` (souvent une seule cellule)."""
+        size = self._cell_m
+        cell_p = (math.floor(p[0] / size), math.floor(p[1] / size))
+        cell_q = (math.floor(q[0] / size), math.floor(q[1] / size))
+        if cell_p == cell_q:
+            return self._cells.get(cell_p, ())
+        found: set[int] = set()
+        for cell in self._cells_between(p, q):
+            found.update(self._cells.get(cell, ()))
+        return found
+
+
+class LapTimer:
+    """Détecte les franchissements de portes trame par trame et tient les temps au tour et par secteur."""
+
+    def __init__(self, track: Track, cell_m: float = GRID_CELL_M) -> None:
+        self._track = track
+        (lat0, lon0), _ = track.gates[0]
+        self._projection = Projection(lat0, lon0)
+        to_local = self._projection.to_local
+        self._gates = [(to_local(*a), to_local(*b)) for a, b in track.gates]
+        self._index = GateIndex(self._gates, cell_m)
+        self._pit = [to_local(*vertex) for vertex in track.pit_lane]
+        if self._pit:
+            xs, ys = zip(*self._pit)
+            self._pit_box = (min(xs), min(ys), max(xs), max(ys))
+        self.reset()
+
+    @property
+    def track(self) -> Track:
+        return self._track
+
+    @property
+    def gate_tests(self) -> int:
+        """Nombre de tests d'intersection effectués (évalue l'efficacité de l'index)."""
+        return self._gate_tests
+
+    def reset(self) -> None:
+        sector_count = len(self._gates)
+        self._last: tuple[float, float, float] | None = None
+        self._now = 0.0
+        self._lap = 0
+        self._lap_start: float | None = None
+        self._sector_start = 0.0
+        self._sectors: list[float] = []
+        self._last_sectors: tuple[float, ...] = ()
+        self._best_sectors: list[float | None] = [None] * sector_count
+        self._last_lap: float | None = None
+        self._best_lap: float | None = None
+        self._laps_completed = 0
+        self._in_pit = False
+        self._lap_pit = False
+        self._distance = 0.0
+        self._trace_d = array("d")
+        self._trace_t = array("d")
+        self._best_d: array | None = None
+        self._best_t: array | None = None
+        self._gate_tests = 0
+
+    def update(self, frame: TelemetryFrame) -> bool:
+        """Intègre une position ; vrai si une porte a été franchie."""
+        gps = frame.gps
+        if gps.fix_state is GpsFixState.NO_FIX:
+            return False
+        t = (frame.timestamp - _EPOCH).total_seconds()
+        x, y = self._projection.to_local(gps.latitude, gps.longitude)
+        crossed = False
+        if self._last is not None and 0.0 < t - self._last[2] <= MAX_GAP_S:
+            px, py, pt = self._last
+            length = math.hypot(x - px, y - py)
+            hits = []
+            for gate in self._index.candidates((px, py), (x, y)):
+                self._gate_tests += 1
+                a, b = self._gates[gate]
+                s = segment_intersection((px, py), (x, y), a, b)
+                if s is not None:
+                    hits.append((s, gate))
+            for s, gate in sorted(hits):
+                crossed |= self._cross(gate, pt + s * (t - pt), s * length)
+            self._distance += length
+            if self._lap_start is not None:
+                self._trace_d.append(self._distance)
+                self._trace_t.append(t - self._lap_start)
+        self._in_pit = self._inside_pit(x, y)
+        self._lap_pit |= self._in_pit
+        self._last = (x, y, t)
+        self._now = t
+        return crossed
+
+    def stats(self) -> LapStats:
+        lap_time = self._now - self._lap_start if self._lap_start is not None else 0.0
+        delta = None
+        if self._best_d is not None and self._lap_start is not None and not self._lap_pit:
+            delta = lap_time - self._best_time_at(self._distance)
+        return LapStats(
+            lap=self._lap,
+            lap_time_s=lap_time,
+            sector=len(self._sectors),
+            last_lap_s=self._last_lap,
+            best_lap_s=self._best_lap,
+            delta_s=delta,
+            last_sectors_s=self._last_sectors,
+            best_sectors_s=tuple(self._best_sectors) if self._best_lap is not None else (),
+            in_pit=self._in_pit,
+            laps_completed=self._laps_completed,
+        )
+
+    def _cross(self, gate: int, at: float, distance_in_step: float) -> bool:
+        if gate == 0:
+            if self._lap_start is not None:
+                lap_time = at - self._lap_start
+                if lap_time < self._track.min_lap_s:
+                    return False
+                self._end_sector(at)
+                self._end_lap(lap_time, self._distance + distance_in_step)
+            self._lap += 1
+            self._lap_start = at
+            self._sector_start = at
+            self._sectors = []
+            self._lap_pit = self._in_pit
+            # Le reste du déplacement (après la ligne) compte pour le nouveau tour.
+            self._distance = -distance_in_step
+            self._trace_d = array("d", [0.0])
+            self._trace_t = array("d", [0.0])
+            return True
+        if self._lap_start is None or gate != len(self._sectors) + 1:
+            # Hors séquence (demi-tour, raccourci, porte ratée) : ignoré.
+            return False
+        self._end_sector(at)
+        return True
+
+    def _end_sector(self, at: float) -> None:
+        self._sectors.append(at - self._sector_start)
+        self._sector_start = at
+
+    def _end_lap(self, lap_time: float, distance: float) -> None:
+        self._laps_completed += 1
+        self._last_lap = lap_time
+        self._last_sectors = tuple(self._sectors)
+        if len(self._sectors) != len(self._gates) or self._lap_pit:
+            return
+        for index, sector in enumerate(self._sectors):
+            best = self._best_sectors[index]
+            if best is None or sector < best:
+                self._best_sectors[index] = sector
+        if self._best_lap is None or lap_time < self._best_lap:
+            self._best_lap = lap_time
+            self._trace_d.append(distance)
+            self._trace_t.append(lap_time)
+            self._best_d, self._best_t = self._trace_d, self._trace_t
+
+    def _best_time_at(self, distance: float) -> float:
+        best_d, best_t = self._best_d, self._best_t
+        index = bisect_left(best_d, distance)
+        if index <= 0:
+            return best_t[0]
+        if index >= len(best_d):
+            return best_t[-1]
+        d0, d1 = best_d[index - 1], best_d[index]
+        fraction = (distance - d0) / (d1 - d0) if d1 > d0 else 0.0
+        return best_t[index - 1] + fraction * (best_t[index] - best_t[index - 1])
+
+    def _inside_pit(self, x: float, y: float) -> bool:
+        if not self._pit:
+            return False
+        x0, y0, x1, y1 = self._pit_box
+        return x0 <= x <= x1 and y0 <= y <= y1 and point_in_polygon((x, y), self._pit)
+
+
+def demo_track() -> Track:
+    """Circuit calé sur la boucle de `MockFrameGenerator` (un tour ≈ 90 trames), avec trois secteurs."""
+    step = 0.07
+    stride = 0.00002
+    # Somme des pas de la simulation : un cercle de rayon stride / (2 sin(step / 2)).
+    radius = stride / (2 * math.sin(step / 2))
+    center_lat = 37.7749 - stride / 2
+    center_lon = -122.4194 + stride / (2 * math.tan(step / 2))
+
+    def gate(angle: float) -> Segment:
+        inner, outer = 0.8 * radius, 1.2 * radius
+        return (
+            (center_lat + inner * math.sin(angle), center_lon - inner * math.cos(angle)),
+            (center_lat + outer * math.sin(angle), center_lon - outer * math.cos(angle)),
+        )
+
+    pit_lat, pit_lon = center_lat, center_lon + 1.6 * radius
+    pit = [
+        (pit_lat - 0.2 * radius, pit_lon - 0.2 * radius),
+        (pit_lat - 0.2 * radius, pit_lon + 0.2 * radius),
+        (pit_lat + 0.2 * radius, pit_lon + 0.2 * radius),
+        (pit_lat + 0.2 * radius, pit_lon - 0.2 * radius),
+    ]
+    return Track(
+        "Demo loop",
+        start_finish=gate(math.pi / 2),
+        sectors=[gate(math.pi / 2 + 2 * math.pi / 3), gate(math.pi / 2 + 4 * math.pi / 3)],
+        pit_lane=pit,
+        min_lap_s=1.0,
+    )
+
+
+def format_lap_time(seconds: float, decimals: int = 3) -> str:
+    minutes, secs = divmod(seconds, 60)
+    return f"{int(minutes)}:{secs:0{3 + decimals}.{decimals}f}"
@@ -1,30 +1,264 @@
-"""Point d'entrée minimal pour lancer InterfaceKart."""
+"""Point d'entrée minimal pour lancer InterfaceKart.
 
-from PySide6.QtWidgets import QApplication
+Démarrage en deux temps : une vue vitesse minimale (`startup.SpeedView`)
+s'affiche dès que Qt et le service de télémétrie sont prêts. L'import de l'UI
+complète, les réglages, le thème et la fenêtre principale suivent, une fois la
+première vitesse affichée (ou après `DEFERRED_START_TIMEOUT_MS` sans trame).
+"""
 
-from services import MockTelemetryService, SettingsRepository, ThemeManager
-from ui import MainWindow
+from __future__ import annotations
 
+import argparse
+import logging
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-def main() -> int:
-    app = QApplication([])
+from models import OverflowPolicy
+
+if TYPE_CHECKING:
+    from fleet import FleetTelemetryService
+    from laps import Track
+    from services import TelemetryService
+
+DEFERRED_START_TIMEOUT_MS = 500
+
+
+def build_telemetry_service(args: argparse.Namespace) -> TelemetryService:
+    policy = OverflowPolicy(args.overflow)
+    if args.replay is not None:
+        from recorder import ReplayTelemetryService
+
+        return ReplayTelemetryService(
+            args.replay, speed=args.replay_speed, loop=True, overflow_policy=policy
+        )
+    if args.udp is not None:
+        from transport import UdpTelemetryService
+
+        return UdpTelemetryService(port=args.udp, overflow_policy=policy)
+    if args.connect is not None:
+        from transport import TcpTelemetryService
+
+        host, _, port = args.connect.rpartition(":")
+        return TcpTelemetryService(host or "127.0.0.1", int(port), overflow_policy=policy)
+    if args.serial is not None:
+        from transport import SerialTelemetryService
+
+        return SerialTelemetryService(args.serial, baudrate=args.baud, overflow_policy=policy)
+    from services import ThreadedMockTelemetryService
+
+    return ThreadedMockTelemetryService(rate_hz=12.5)
+
+
+def build_track(args: argparse.Namespace) -> Track | None:
+    from laps import Track, demo_track
 
+    if args.track is not None:
+        return Track.load(args.track)
+    if all(getattr(args, name) is None for name in ("replay", "udp", "connect", "serial")):
+        # La boucle de démo suit le trajet de la télémétrie simulée.
+        return demo_track()
+    return None
+
+
+def build_fleet_service(args: argparse.Namespace) -> FleetTelemetryService:
+    from fleet import FleetTelemetryService
+
+    fleet = FleetTelemetryService()
+    # Numérotation continue d'une source à l'autre : les noms restent uniques au classement.
+    for _ in range(args.fleet_mock or 0):
+        fleet.add_synthetic(f"Kart {len(fleet.state) + 1}")
+    if args.fleet_udp is not None:
+        first_port, _, count = args.fleet_udp.partition(":")
+        for number in range(int(count or 1)):
+            fleet.add_udp(f"Kart {len(fleet.state) + 1}", int(first_port) + number)
+    for address in args.fleet_connect or []:
+        host, _, port = address.rpartition(":")
+        fleet.add_tcp(address, host or "127.0.0.1", int(port))
+    return fleet
+
+
+def run_fleet(args: argparse.Namespace) -> int:
+    """Mode flotte : le classement de tous les karts à la place de la console d'un seul kart."""
+    from PySide6.QtWidgets import QApplication
+
+    from services import SettingsRepository, ThemeManager
+    from ui import FleetWindow
+
+    app = QApplication([])
     settings_repo = SettingsRepository()
     settings = settings_repo.load_settings()
     theme_manager = ThemeManager(app)
     theme_manager.apply_theme(settings.theme_mode, settings.brightness)
+    fleet = build_fleet_service(args)
+    fleet.start()
+    window = FleetWindow(fleet.state, theme_manager, refresh_hz=settings.max_render_hz)
+    window.showFullScreen()
+    try:
+        return app.exec()
+    finally:
+        fleet.stop()
+        settings_repo.close()
 
-    telemetry_service = MockTelemetryService()
-    window = MainWindow(
-        settings=settings,
-        settings_repo=settings_repo,
-        theme_manager=theme_manager,
-        telemetry_service=telemetry_service,
+
+def main(argv: list[str] | None = None) -> int:
+    started = time.perf_counter()
+    parser = argparse.ArgumentParser(description="Electric Kart Console")
+    parser.add_argument("--udp", type=int, metavar="PORT", help="écoute la télémétrie en UDP")
+    parser.add_argument("--serial", metavar="PATH", help="lit la télémétrie sur un port série")
+    parser.add_argument("--baud", type=int, default=None)
+    parser.add_argument(
+        "--connect", metavar="HOST:PORT", help="s'abonne au flux relayé par le kart (option --fanout)"
     )
-    window.showFullScreen()
+    parser.add_argument("--record", type=Path, metavar="PATH", help="enregistre la session")
+    parser.add_argument(
+        "--fanout", type=int, metavar="PORT", help="relaie les trames aux stands sur ce port TCP"
+    )
+    parser.add_argument(
+        "--fanout-host", default="127.0.0.1", help="adresse d'écoute du relais (0.0.0.0 pour le réseau local)"
+    )
+    parser.add_argument("--replay", type=Path, metavar="PATH", help="relit une session enregistrée")
+    parser.add_argument(
+        "--replay-speed", type=float, default=1.0, help="facteur de relecture (0 = au plus vite)"
+    )
+    parser.add_argument(
+        "--overflow",
+        choices=[policy.value for policy in OverflowPolicy],
+        default=OverflowPolicy.COALESCE.value,
+    )
+    parser.add_argument(
+        "--tiles", type=Path, metavar="PATH", help="fichier MBTiles hors ligne (défaut : tuiles de test générées)"
+    )
+    parser.add_argument(
+        "--camera", choices=["synthetic", "v4l2"], default="synthetic", help="source des caméras"
+    )
+    parser.add_argument(
+        "--track",
+        type=Path,
+        metavar="PATH",
+        help="circuit JSON pour le chronométrage (défaut : boucle de démo avec la télémétrie simulée)",
+    )
+    parser.add_argument(
+        "--fleet-mock", type=int, metavar="N", help="mode flotte avec N karts simulés"
+    )
+    parser.add_argument(
+        "--fleet-udp", metavar="PORT[:N]", help="mode flotte : N karts en UDP sur PORT, PORT+1, ..."
+    )
+    parser.add_argument(
+        "--fleet-connect",
+        action="append",
+        metavar="HOST:PORT",
+        help="mode flotte : s'abonne au relais d'un kart (répétable)",
+    )
+    parser.add_argument(
+        "--startup-profile", type=Path, metavar="PATH", help="écrit le détail du démarrage en JSON"
+    )
+    args = parser.parse_args(argv)
+    if args.tiles is not None and not args.tiles.exists():
+        parser.error(f"tileset not found: {args.tiles}")
+    if args.serial is not None and args.baud is not None:
+        from transport import is_supported_baudrate
+
+        if not is_supported_baudrate(args.baud):
+            parser.error(f"unsupported baud rate: {args.baud}")
+    if args.track is not None and not args.track.exists():
+        parser.error(f"track not found: {args.track}")
+    logging.basicConfig(level=logging.INFO, format="%(name)s: %(message)s")
+    if args.fleet_mock or args.fleet_udp or args.fleet_connect:
+        return run_fleet(args)
+
+    from PySide6.QtCore import Qt, QTimer
+    from PySide6.QtWidgets import QApplication
+
+    from startup import SpeedView, StartupProfiler
+
+    profiler = StartupProfiler(origin=started)
+    profiler.record("imports", started)
+
+    with profiler.phase("qapplication"):
+        app = QApplication([])
+
+    with profiler.phase("telemetry_service"):
+        telemetry_service = build_telemetry_service(args)
+        recorder = None
+        if args.record is not None:
+            from recorder import SessionRecorder
+
+            recorder = SessionRecorder(args.record)
+            recorder.attach(telemetry_service)
+        fanout = None
+        if args.fanout is not None:
+            from fanout import FanoutServer
+
+            fanout = FanoutServer(args.fanout_host, args.fanout)
+            fanout.start()
+            fanout.attach(telemetry_service)
+
+    speed_view = SpeedView(profiler)
+    telemetry_service.telemetry_updated.connect(speed_view.on_telemetry)
+    speed_view.showFullScreen()
     telemetry_service.start()
+    profiler.mark("speed_view_shown")
+
+    windows = []
+    repositories = []
+
+    def finish_startup() -> None:
+        if windows:
+            return
+        with profiler.phase("deferred_imports"):
+            from services import SettingsRepository, ThemeManager
+            from ui import MainWindow
+
+        with profiler.phase("load_settings"):
+            settings_repo = SettingsRepository()
+            settings = settings_repo.load_settings()
+            repositories.append(settings_repo)
+        with profiler.phase("apply_theme"):
+            theme_manager = ThemeManager(app)
+            theme_manager.apply_theme(settings.theme_mode, settings.brightness)
+        tiles_path = args.tiles
+        if tiles_path is None:
+            from tiles import DEFAULT_TILESET, generate_test_tileset
+
+            tiles_path = DEFAULT_TILESET
+            if not tiles_path.exists():
+                with profiler.phase("generate_tiles"):
+                    generate_test_tileset(tiles_path)
+        with profiler.phase("load_track"):
+            track = build_track(args)
+        with profiler.phase("window_build"):
+            window = MainWindow(
+                settings=settings,
+                settings_repo=settings_repo,
+                theme_manager=theme_manager,
+                telemetry_service=telemetry_service,
+                tiles_path=tiles_path,
+                camera_source=args.camera,
+                track=track,
+            )
+        windows.append(window)
+        window.showFullScreen()
+        telemetry_service.telemetry_updated.disconnect(speed_view.on_telemetry)
+        speed_view.close()
+        profiler.mark("main_window_shown")
+        profiler.log()
+        if args.startup_profile is not None:
+            profiler.dump(args.startup_profile)
+
+    speed_view.first_frame_shown.connect(finish_startup, Qt.QueuedConnection)
+    QTimer.singleShot(DEFERRED_START_TIMEOUT_MS, finish_startup)
 
-    return app.exec()
+    try:
+        return app.exec()
+    finally:
+        telemetry_service.stop()
+        if fanout is not None:
+            fanout.stop()
+        for settings_repo in repositories:
+            settings_repo.close()
+        if recorder is not None:
+            recorder.close()
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -26,6 +27,13 @@ class AppSettings:
     default_page: PageId = PageId.HOME
     map_follow: bool = True
     map_zoom: int = 12
+    max_render_hz: int = 30
+    perf_overlay: bool = False
+
+
+class OverflowPolicy(str, Enum):
+    DROP_OLDEST = "drop_oldest"
+    COALESCE = "coalesce"
 
 
 class AlertLevel(str, Enum):
@@ -60,6 +68,7 @@ class Alert:
     level: AlertLevel
     message: str
     ack_required: bool = False
+    ttl_s: float | None = None
     timestamp: datetime = field(default_factory=datetime.utcnow)
 
 
@@ -72,3 +81,145 @@ class TelemetryFrame:
     gps: GpsData = field(default_factory=GpsData)
     alerts: list[Alert] = field(default_factory=list)
     timestamp: datetime = field(default_factory=datetime.utcnow)
+    produced_ns: int = field(default_factory=time.monotonic_ns)
+
+
+@dataclass(slots=True)
+class MailboxStats:
+    posted: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+
+
+@dataclass(slots=True)
+class RenderStats:
+    submitted: int = 0
+    rendered: int = 0
+    skipped: int = 0
+    coalesced: int = 0
+
+
+@dataclass(slots=True)
+class BindingStats:
+    applied: int = 0
+    skipped: int = 0
+
+
+@dataclass(slots=True)
+class DispatchStats:
+    updates: int = 0
+    fields_changed: int = 0
+    notifications: int = 0
+    catch_ups: int = 0
+
+
+@dataclass(slots=True)
+class DecoderStats:
+    frames: int = 0
+    bytes: int = 0
+    crc_errors: int = 0
+    resyncs: int = 0
+    malformed: int = 0
+
+
+@dataclass(slots=True)
+class TransportStats:
+    rx_bytes: int = 0
+    rx_reads: int = 0
+    frames: int = 0
+    receive_rate_hz: float = 0.0
+    queue_depth: int = 0
+    dropped: int = 0
+    coalesced: int = 0
+    crc_errors: int = 0
+    resyncs: int = 0
+
+
+@dataclass(slots=True)
+class PerfSnapshot:
+    intake_p50_us: int = 0
+    intake_p99_us: int = 0
+    render_p50_us: int = 0
+    render_p99_us: int = 0
+    paint_p50_us: int = 0
+    paint_p99_us: int = 0
+    loop_lag_p99_us: int = 0
+    fps: float = 0.0
+    frame_rate_hz: float = 0.0
+
+
+@dataclass(slots=True)
+class TileStats:
+    hits: int = 0
+    misses: int = 0
+    decoded: int = 0
+    missing: int = 0
+    evicted: int = 0
+    prefetched: int = 0
+    stale_skipped: int = 0
+    cached: int = 0
+
+
+@dataclass(slots=True)
+class CameraStats:
+    captured: int = 0
+    displayed: int = 0
+    dropped: int = 0
+    errors: int = 0
+
+
+@dataclass(slots=True)
+class TripStats:
+    distance_m: float = 0.0
+    max_speed_kmh: float = 0.0
+    avg_speed_kmh: float = 0.0
+    energy_wh: float = 0.0
+    reverse_s: float = 0.0
+    elapsed_s: float = 0.0
+    frames: int = 0
+
+
+@dataclass(slots=True)
+class LapStats:
+    lap: int = 0
+    lap_time_s: float = 0.0
+    sector: int = 0
+    last_lap_s: float | None = None
+    best_lap_s: float | None = None
+    delta_s: float | None = None
+    last_sectors_s: tuple[float, ...] = ()
+    best_sectors_s: tuple[float | None, ...] = ()
+    in_pit: bool = False
+    laps_completed: int = 0
+
+
+@dataclass(slots=True)
+class SettingsStats:
+    saves: int = 0
+    writes: int = 0
+    coalesced: int = 0
+    unchanged: int = 0
+    errors: int = 0
+
+
+@dataclass(slots=True)
+class FanoutStats:
+    clients: int = 0
+    accepted: int = 0
+    evicted: int = 0
+    dropped: int = 0
+    frames: int = 0
+    batches: int = 0
+    bytes_sent: int = 0
+    queued_bytes: int = 0
+
+
+@dataclass(slots=True)
+class FleetStats:
+    karts: int = 0
+    frames: int = 0
+    rx_bytes: int = 0
+    crc_errors: int = 0
+    resyncs: int = 0
+    ingest_cpu_s: float = 0.0
@@ -0,0 +1,168 @@
+"""Estimation de mouvement du kart entre deux positions GPS (filtre de Kalman à vitesse constante).
+
+Les positions arrivent au rythme de la télémétrie (souvent 10 à 25 Hz, voire
+moins) ; la carte, elle, est peinte au rythme de l'affichage. `MotionEstimator`
+fusionne chaque fix (position) avec la vitesse et le cap mesurés, puis répond à
+`position_at(t)` : interpolation du dernier état filtré, extrapolée d'au plus
+`max_extrapolation_s` quand les trames se font attendre.
+
+Le filtre travaille en mètres dans un plan local (est, nord) centré sur une
+position de référence. Avec un bruit d'accélération indépendant par axe et une
+mesure directe de la position et de la vitesse, les deux axes se découplent :
+chacun est un filtre à deux états (position, vitesse) résolu en forme close,
+sans NumPy ni allocation par trame.
+"""
+
+from __future__ import annotations
+
+import math
+
+from models import GpsData, GpsFixState
+
+EARTH_RADIUS_M = 6_371_008.8
+# Au-delà, la position est réinitialisée sur la mesure (saut de relecture, perte longue du signal).
+RESET_DISTANCE_M = 200.0
+RESET_GAP_S = 5.0
+# Le plan local est recentré quand le kart s'éloigne de la référence (distorsion de la projection).
+REANCHOR_DISTANCE_M = 5_000.0
+# En dessous, le cap mesuré est gardé : le vecteur vitesse filtré n'a plus de direction fiable.
+MIN_HEADING_SPEED_MS = 0.5
+MIN_MOVING_SPEED_MS = 0.05
+
+
+class _Axis:
+    """Un axe du filtre : état (position, vitesse) et covariance 2x2 symétrique."""
+
+    __slots__ = ("p", "v", "pp", "pv", "vv")
+
+    def __init__(self, p: float, v: float, p_var: float, v_var: float) -> None:
+        self.p, self.v = p, v
+        self.pp, self.pv, self.vv = p_var, 0.0, v_var
+
+    def predict(self, dt: float, accel_var: float) -> None:
+        # Modèle à accélération blanche discrète : Q = q * [[dt⁴/4, dt³/2], [dt³/2, dt²]].
+        dt2 = dt * dt
+        self.p += self.v * dt
+        self.pp += dt * (2 * self.pv + dt * self.vv) + accel_var * dt2 * dt2 / 4
+        self.pv += dt * self.vv + accel_var * dt2 * dt / 2
+        self.vv += accel_var * dt2
+
+    def correct(self, z_p: float, z_v: float, p_var: float, v_var: float) -> None:
+        s_pp, s_pv, s_vv = self.pp + p_var, self.pv, self.vv + v_var
+        det = s_pp * s_vv - s_pv * s_pv
+        # K = P · S⁻¹
+        k_pp = (self.pp * s_vv - self.pv * s_pv) / det
+        k_pv = (self.pv * s_pp - self.pp * s_pv) / det
+        k_vp = (self.pv * s_vv - self.vv * s_pv) / det
+        k_vv = (self.vv * s_pp - self.pv * s_pv) / det
+        r_p, r_v = z_p - self.p, z_v - self.v
+        self.p += k_pp * r_p + k_pv * r_v
+        self.v += k_vp * r_p + k_vv * r_v
+        # P = (I - K) · P
+        pp, pv, vv = self.pp, self.pv, self.vv
+        self.pp = (1 - k_pp) * pp - k_pv * pv
+        self.pv = (1 - k_pp) * pv - k_pv * vv
+        self.vv = -k_vp * pv + (1 - k_vv) * vv
+
+
+class MotionEstimator:
+    """Filtre position + vitesse du kart ; les instants sont en `time.monotonic_ns`."""
+
+    def __init__(
+        self,
+        position_sigma_m: float = 3.0,
+        speed_sigma_ms: float = 0.5,
+        accel_sigma_ms2: float = 4.0,
+        max_extrapolation_s: float = 1.0,
+    ) -> None:
+        self._position_var = position_sigma_m**2
+        self._speed_var = speed_sigma_ms**2
+        self._accel_var = accel_sigma_ms2**2
+        self._max_extrapolation_s = max_extrapolation_s
+        self.reset()
+
+    def reset(self) -> None:
+        self._east: _Axis | None = None
+        self._north: _Axis | None = None
+        self._at_ns = 0
+        self._ref_lat = 0.0
+        self._ref_lon = 0.0
+        self._m_per_deg_lon = 0.0
+        self._heading = 0.0
+
+    @property
+    def has_fix(self) -> bool:
+        return self._east is not None
+
+    def update(self, gps: GpsData, speed_kmh: float, at_ns: int) -> None:
+        """Intègre une mesure ; sans fix GPS, seul le cap est retenu et l'état continue d'être extrapolé."""
+        self._heading = gps.heading_deg
+        if gps.fix_state is GpsFixState.NO_FIX:
+            return
+        heading = math.radians(gps.heading_deg)
+        speed = speed_kmh / 3.6
+        v_east, v_north = speed * math.sin(heading), speed * math.cos(heading)
+        if self._east is None:
+            self._start(gps.latitude, gps.longitude, v_east, v_north, at_ns)
+            return
+        x, y = self._to_local(gps.latitude, gps.longitude)
+        dt = (at_ns - self._at_ns) / 1e9
+        jump = math.hypot(x - self._east.p, y - self._north.p)
+        if dt < 0 or dt > RESET_GAP_S or jump > RESET_DISTANCE_M + speed * dt:
+            self._start(gps.latitude, gps.longitude, v_east, v_north, at_ns)
+            return
+        for axis, z_p, z_v in ((self._east, x, v_east), (self._north, y, v_north)):
+            if dt > 0:
+                axis.predict(dt, self._accel_var)
+            axis.correct(z_p, z_v, self._position_var, self._speed_var)
+        self._at_ns = at_ns
+        if math.hypot(self._east.p, self._north.p) > REANCHOR_DISTANCE_M:
+            self._reanchor()
+
+    def position_at(self, at_ns: int) -> tuple[float, float] | None:
+        """(latitude, longitude) estimée à `at_ns` ; l'extrapolation est bornée à `max_extrapolation_s`."""
+        if self._east is None:
+            return None
+        dt = min(max(0.0, (at_ns - self._at_ns) / 1e9), self._max_extrapolation_s)
+        return self._to_geo(self._east.p + self._east.v * dt, self._north.p + self._north.v * dt)
+
+    def is_moving(self, at_ns: int) -> bool:
+        """Faux à l'arrêt ou une fois l'extrapolation épuisée : la position estimée ne change plus."""
+        return (
+            self._east is not None
+            and self.speed_ms() >= MIN_MOVING_SPEED_MS
+            and (at_ns - self._at_ns) / 1e9 < self._max_extrapolation_s
+        )
+
+    def speed_ms(self) -> float:
+        return math.hypot(self._east.v, self._north.v) if self._east is not None else 0.0
+
+    def heading_deg(self) -> float:
+        """Cap du vecteur vitesse filtré, ou cap mesuré à l'arrêt."""
+        if self._east is None or self.speed_ms() < MIN_HEADING_SPEED_MS:
+            return self._heading
+        return math.degrees(math.atan2(self._east.v, self._north.v)) % 360.0
+
+    def _start(self, latitude: float, longitude: float, v_east: float, v_north: float, at_ns: int) -> None:
+        self._anchor(latitude, longitude)
+        self._east = _Axis(0.0, v_east, self._position_var, self._speed_var)
+        self._north = _Axis(0.0, v_north, self._position_var, self._speed_var)
+        self._at_ns = at_ns
+
+    def _anchor(self, latitude: float, longitude: float) -> None:
+        self._ref_lat, self._ref_lon = latitude, longitude
+        self._m_per_deg_lon = math.radians(EARTH_RADIUS_M) * math.cos(math.radians(latitude))
+
+    def _reanchor(self) -> None:
+        latitude, longitude = self._to_geo(self._east.p, self._north.p)
+        self._anchor(latitude, longitude)
+        self._east.p = self._north.p = 0.0
+
+    def _to_local(self, latitude: float, longitude: float) -> tuple[float, float]:
+        return (
+            (longitude - self._ref_lon) * self._m_per_deg_lon,
+            (latitude - self._ref_lat) * math.radians(EARTH_RADIUS_M),
+        )
+
+    def _to_geo(self, x: float, y: float) -> tuple[float, float]:
+        return self._ref_lat + y / math.radians(EARTH_RADIUS_M), self._ref_lon + x / self._m_per_deg_lon
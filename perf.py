@@ -0,0 +1,200 @@
+"""Instrumentation du chemin critique : latences par étape, retard de la boucle Qt et FPS.
+
+Les latences sont enregistrées dans des histogrammes log-linéaires de type HDR
+(précision relative ~3 %, mémoire fixe, enregistrement O(1)).
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from array import array
+from pathlib import Path
+
+from PySide6.QtCore import QEvent, QObject, Qt, QTimer
+
+from models import PerfSnapshot, TelemetryFrame
+
+
+class LatencyHistogram:
+    """Histogramme HDR simplifié sur des entiers (µs), de 0 à `max_value`."""
+
+    def __init__(self, significant_bits: int = 5, max_value: int = 60_000_000) -> None:
+        self._bits = significant_bits
+        self._sub_count = 1 << significant_bits
+        self._half = self._sub_count >> 1
+        self._max_value = max_value
+        self._counts = array("Q", bytes(8 * (self._index(max_value) + 1)))
+        self._total = 0
+        self._sum = 0
+        self._max = 0
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_count:
+            return value
+        shift = value.bit_length() - self._bits
+        return self._sub_count + (shift - 1) * self._half + ((value >> shift) - self._half)
+
+    def _value_at(self, index: int) -> int:
+        if index < self._sub_count:
+            return index
+        shift, offset = divmod(index - self._sub_count, self._half)
+        shift += 1
+        # Borne haute du seau : les percentiles ne sous-estiment jamais.
+        return ((offset + self._half + 1) << shift) - 1
+
+    @property
+    def count(self) -> int:
+        return self._total
+
+    def record(self, value: int) -> None:
+        value = min(max(0, value), self._max_value)
+        self._counts[self._index(value)] += 1
+        self._total += 1
+        self._sum += value
+        if value > self._max:
+            self._max = value
+
+    def percentile(self, p: float) -> int:
+        if self._total == 0:
+            return 0
+        threshold = max(1, round(self._total * p / 100.0))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            if count:
+                seen += count
+                if seen >= threshold:
+                    return min(self._value_at(index), self._max)
+        return self._max
+
+    def mean(self) -> float:
+        return self._sum / self._total if self._total else 0.0
+
+    def reset(self) -> None:
+        for index in range(len(self._counts)):
+            self._counts[index] = 0
+        self._total = 0
+        self._sum = 0
+        self._max = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self._total,
+            "mean_us": self.mean(),
+            "p50_us": self.percentile(50),
+            "p90_us": self.percentile(90),
+            "p99_us": self.percentile(99),
+            "p999_us": self.percentile(99.9),
+            "max_us": self._max,
+            "buckets": {
+                str(self._value_at(index)): count for index, count in enumerate(self._counts) if count
+            },
+        }
+
+
+class PerfMonitor(QObject):
+    """Horodate chaque étape (production, réception, rendu, peinture) et mesure le retard de la boucle."""
+
+    STAGES = ("produce_to_intake", "produce_to_render", "produce_to_paint", "render_cost", "loop_lag")
+
+    def __init__(self, lag_interval_ms: int = 50, parent=None) -> None:
+        super().__init__(parent)
+        self._histograms = {stage: LatencyHistogram() for stage in self.STAGES}
+        self._pending_paint_ns: int | None = None
+        self._frames = 0
+        self._renders = 0
+        self._paints = 0
+        self._window = None
+        self._window_start_ns = time.monotonic_ns()
+        self._fps = 0.0
+        self._frame_rate_hz = 0.0
+        self._lag_interval_ns = lag_interval_ms * 1_000_000
+        self._lag_expected_ns = 0
+        self._lag_timer = QTimer(self)
+        self._lag_timer.setTimerType(Qt.PreciseTimer)
+        self._lag_timer.setInterval(lag_interval_ms)
+        self._lag_timer.timeout.connect(self._on_lag_tick)
+
+    def start(self) -> None:
+        self._lag_expected_ns = time.monotonic_ns() + self._lag_interval_ns
+        self._lag_timer.start()
+
+    def stop(self) -> None:
+        self._lag_timer.stop()
+
+    def watch_paint(self, widget) -> None:
+        """Widget dont la peinture date `produce_to_paint` (après un rendu qui l'a modifié)."""
+        widget.installEventFilter(self)
+
+    def watch_window(self, window) -> None:
+        """Fenêtre dont les passes de peinture (`UpdateRequest`, une par vidage du backing store) font les FPS."""
+        self._window = window
+        window.installEventFilter(self)
+
+    def eventFilter(self, watched, event) -> bool:
+        kind = event.type()
+        if kind == QEvent.UpdateRequest and watched is self._window:
+            self._paints += 1
+        elif kind == QEvent.Paint and self._pending_paint_ns is not None and watched is not self._window:
+            self._record("produce_to_paint", time.monotonic_ns() - self._pending_paint_ns)
+            self._pending_paint_ns = None
+        return False
+
+    def on_intake(self, frame: TelemetryFrame) -> None:
+        self._frames += 1
+        self._record("produce_to_intake", time.monotonic_ns() - frame.produced_ns)
+
+    def on_rendered(self, frame: TelemetryFrame, started_ns: int, awaiting_paint: bool = True) -> None:
+        """`awaiting_paint` indique que le rendu a modifié un widget surveillé par `watch_paint`."""
+        now = time.monotonic_ns()
+        self._renders += 1
+        self._record("render_cost", now - started_ns)
+        self._record("produce_to_render", now - frame.produced_ns)
+        if awaiting_paint:
+            self._pending_paint_ns = frame.produced_ns
+
+    def _record(self, stage: str, elapsed_ns: int) -> None:
+        self._histograms[stage].record(elapsed_ns // 1000)
+
+    def _on_lag_tick(self) -> None:
+        now = time.monotonic_ns()
+        self._record("loop_lag", max(0, now - self._lag_expected_ns))
+        self._lag_expected_ns = now + self._lag_interval_ns
+        elapsed = now - self._window_start_ns
+        if elapsed >= 1_000_000_000:
+            self._fps = self._paints * 1e9 / elapsed
+            self._frame_rate_hz = self._frames * 1e9 / elapsed
+            self._paints = 0
+            self._frames = 0
+            self._window_start_ns = now
+
+    def histogram(self, stage: str) -> LatencyHistogram:
+        return self._histograms[stage]
+
+    def snapshot(self) -> PerfSnapshot:
+        h = self._histograms
+        return PerfSnapshot(
+            intake_p50_us=h["produce_to_intake"].percentile(50),
+            intake_p99_us=h["produce_to_intake"].percentile(99),
+            render_p50_us=h["produce_to_render"].percentile(50),
+            render_p99_us=h["produce_to_render"].percentile(99),
+            paint_p50_us=h["produce_to_paint"].percentile(50),
+            paint_p99_us=h["produce_to_paint"].percentile(99),
+            loop_lag_p99_us=h["loop_lag"].percentile(99),
+            fps=self._fps,
+            frame_rate_hz=self._frame_rate_hz,
+        )
+
+    def reset(self) -> None:
+        for histogram in self._histograms.values():
+            histogram.reset()
+
+    def dump(self, path: Path) -> None:
+        payload = {
+            "created_monotonic_ns": time.monotonic_ns(),
+            "fps": self._fps,
+            "frame_rate_hz": self._frame_rate_hz,
+            "renders": self._renders,
+            "stages": {stage: histogram.to_dict() for stage, histogram in self._histograms.items()},
+        }
+        Path(path).write_text(json.dumps(payload, indent=2), encoding="utf-8")
@@ -0,0 +1,272 @@
+"""Protocole binaire compact de la liaison ECU du kart.
+
+Trame v1, little-endian :
+
+    en-tête   "KT" | version u8 | flags u8 | longueur charge utile u16 | seq u32
+    charge    horodatage µs u64 | vitesse f32 | batterie u8 | état u8
+              | lat i32 (1e-7°) | lon i32 (1e-7°) | cap u16 (1/100°) | nb alertes u8
+              puis par alerte : niveau u8 | ack u8 | len id u8 | len message u16 | id | message
+    CRC-32    u32 sur en-tête + charge utile
+
+Octet d'état : bit 0 marche arrière, bits 1-2 connectivité, bits 3-4 fix GPS.
+Le décodage lit directement le tampon de réception via `memoryview` et
+`struct.unpack_from`, sans tranche intermédiaire.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from datetime import datetime, timedelta
+
+from models import (
+    Alert,
+    AlertLevel,
+    ConnectivityState,
+    DecoderStats,
+    GpsData,
+    GpsFixState,
+    TelemetryFrame,
+)
+
+MAGIC = b"KT"
+VERSION = 1
+
+_HEADER = struct.Struct("<2sBBHI")
+_BODY = struct.Struct("<QfBBiiHB")
+_ALERT = struct.Struct("<BBBH")
+_CRC = struct.Struct("<I")
+_TIMESTAMP = struct.Struct("<Q")
+
+HEADER_SIZE = _HEADER.size
+MIN_FRAME_SIZE = _HEADER.size + _BODY.size + _CRC.size
+MAX_PAYLOAD = 0xFFFF
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_COORD_SCALE = 1e7
+
+_CONNECTIVITY = (ConnectivityState.DISCONNECTED, ConnectivityState.CONNECTING, ConnectivityState.CONNECTED)
+_FIX = (GpsFixState.NO_FIX, GpsFixState.FIX_2D, GpsFixState.FIX_3D)
+_LEVELS = (AlertLevel.INFO, AlertLevel.WARNING, AlertLevel.CRITICAL)
+_CONNECTIVITY_CODE = {state: code for code, state in enumerate(_CONNECTIVITY)}
+_FIX_CODE = {state: code for code, state in enumerate(_FIX)}
+_LEVEL_CODE = {level: code for code, level in enumerate(_LEVELS)}
+
+
+class ProtocolError(ValueError):
+    pass
+
+
+def encode_into(buffer: bytearray, frame: TelemetryFrame, seq: int = 0) -> int:
+    """Ajoute la trame encodée à `buffer` et retourne le nombre d'octets écrits.
+
+    Le tampon est souvent partagé (enregistreur, relais) : en cas d'erreur, rien
+    n'y reste de la trame et l'erreur est levée en `ProtocolError`.
+    """
+    if len(frame.alerts) > 0xFF:
+        raise ProtocolError(f"too many alerts: {len(frame.alerts)}")
+    alerts = []
+    for alert in frame.alerts:
+        alert_id = alert.alert_id.encode("utf-8")
+        message = alert.message.encode("utf-8")
+        if len(alert_id) > 0xFF:
+            raise ProtocolError(f"alert id too long: {alert.alert_id!r}")
+        if len(message) > 0xFFFF:
+            raise ProtocolError(f"alert message too long: {len(message)} bytes")
+        alerts.append((alert, alert_id, message))
+    start = len(buffer)
+    try:
+        buffer += bytes(_HEADER.size)
+        state = (
+            int(frame.reverse)
+            | _CONNECTIVITY_CODE[frame.connectivity] << 1
+            | _FIX_CODE[frame.gps.fix_state] << 3
+        )
+        buffer += _BODY.pack(
+            to_epoch_us(frame.timestamp),
+            frame.speed_kmh,
+            max(0, min(255, frame.battery_percent)),
+            state,
+            round(frame.gps.latitude * _COORD_SCALE),
+            round(frame.gps.longitude * _COORD_SCALE),
+            round(frame.gps.heading_deg % 360 * 100) % 36000,
+            len(alerts),
+        )
+        for alert, alert_id, message in alerts:
+            buffer += _ALERT.pack(_LEVEL_CODE[alert.level], int(alert.ack_required), len(alert_id), len(message))
+            buffer += alert_id
+            buffer += message
+        payload_len = len(buffer) - start - _HEADER.size
+        if payload_len > MAX_PAYLOAD:
+            raise ProtocolError(f"payload too large: {payload_len} bytes")
+        _HEADER.pack_into(buffer, start, MAGIC, VERSION, 0, payload_len, seq & 0xFFFFFFFF)
+        buffer += _CRC.pack(zlib.crc32(memoryview(buffer)[start:]))
+    except (struct.error, OverflowError) as exc:
+        # Valeur hors du domaine de son champ (vitesse, coordonnées, horodatage).
+        del buffer[start:]
+        raise ProtocolError(f"frame not encodable: {exc}") from exc
+    except BaseException:
+        del buffer[start:]
+        raise
+    return len(buffer) - start
+
+
+def encode_frame(frame: TelemetryFrame, seq: int = 0) -> bytes:
+    buffer = bytearray()
+    encode_into(buffer, frame, seq)
+    return bytes(buffer)
+
+
+def decode_frames(
+    data: bytes | bytearray | memoryview,
+    stats: DecoderStats | None = None,
+) -> tuple[list[TelemetryFrame], int]:
+    """Décode toutes les trames complètes de `data`.
+
+    Retourne les trames et le nombre d'octets consommés ; une trame incomplète
+    en fin de tampon n'est pas consommée. Les octets invalides (magic, version
+    ou CRC) sont sautés jusqu'au prochain magic.
+    """
+    view = data if isinstance(data, memoryview) else memoryview(data)
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    end = len(view)
+    offset = 0
+    frames: list[TelemetryFrame] = []
+    unpack_header = _HEADER.unpack_from
+    try:
+        while end - offset >= MIN_FRAME_SIZE:
+            magic, version, _flags, payload_len, _seq = unpack_header(view, offset)
+            if magic != MAGIC or version != VERSION or payload_len < _BODY.size:
+                offset = _resync(view, offset + 1, end, stats)
+                continue
+            crc_at = offset + _HEADER.size + payload_len
+            if crc_at + _CRC.size > end:
+                break
+            if zlib.crc32(view[offset:crc_at]) != _CRC.unpack_from(view, crc_at)[0]:
+                if stats is not None:
+                    stats.crc_errors += 1
+                offset = _resync(view, offset + 1, end, stats)
+                continue
+            try:
+                frames.append(_decode_payload(view, offset + _HEADER.size, crc_at))
+            except (IndexError, struct.error, UnicodeDecodeError):
+                if stats is not None:
+                    stats.malformed += 1
+            offset = crc_at + _CRC.size
+    finally:
+        if view is not data:
+            view.release()
+    if stats is not None:
+        stats.frames += len(frames)
+        stats.bytes += offset
+    return frames, offset
+
+
+def peek_frame(view: memoryview, offset: int) -> tuple[int, int] | None:
+    """Retourne (taille totale, horodatage µs) de la trame à `offset` sans la décoder ni vérifier le CRC."""
+    if len(view) - offset < MIN_FRAME_SIZE:
+        return None
+    magic, version, _flags, payload_len, _seq = _HEADER.unpack_from(view, offset)
+    if magic != MAGIC or version != VERSION:
+        return None
+    size = _HEADER.size + payload_len + _CRC.size
+    if offset + size > len(view):
+        return None
+    return size, _TIMESTAMP.unpack_from(view, offset + _HEADER.size)[0]
+
+
+def to_epoch_us(moment: datetime) -> int:
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+def _resync(view: memoryview, start: int, end: int, stats: DecoderStats | None) -> int:
+    if stats is not None:
+        stats.resyncs += 1
+    index = bytes(view[start:end]).find(MAGIC)
+    if index < 0:
+        # Garde le dernier octet : il peut être le début d'un magic coupé.
+        return max(start, end - 1)
+    return start + index
+
+
+def _decode_payload(view: memoryview, offset: int, end: int) -> TelemetryFrame:
+    (
+        timestamp_us,
+        speed,
+        battery,
+        state,
+        lat,
+        lon,
+        heading,
+        alert_count,
+    ) = _BODY.unpack_from(view, offset)
+    offset += _BODY.size
+    alerts: list[Alert] = []
+    for _ in range(alert_count):
+        level, ack, id_len, msg_len = _ALERT.unpack_from(view, offset)
+        offset += _ALERT.size
+        id_end = offset + id_len
+        msg_end = id_end + msg_len
+        if msg_end > end:
+            raise IndexError("alert overruns payload")
+        alerts.append(
+            Alert(
+                alert_id=str(view[offset:id_end], "utf-8"),
+                level=_LEVELS[level],
+                message=str(view[id_end:msg_end], "utf-8"),
+                ack_required=bool(ack),
+            )
+        )
+        offset = msg_end
+    timestamp = _EPOCH + timedelta(microseconds=timestamp_us)
+    return TelemetryFrame(
+        speed_kmh=speed,
+        battery_percent=battery,
+        reverse=bool(state & 0x01),
+        connectivity=_CONNECTIVITY[(state >> 1) & 0x03],
+        gps=GpsData(
+            latitude=lat / _COORD_SCALE,
+            longitude=lon / _COORD_SCALE,
+            heading_deg=heading / 100.0,
+            fix_state=_FIX[(state >> 3) & 0x03],
+        ),
+        alerts=alerts,
+        timestamp=timestamp,
+    )
+
+
+class FrameDecoder:
+    """Réassemble un flux d'octets et décode les trames par lots."""
+
+    def __init__(self, max_buffer: int = 1 << 20) -> None:
+        self._buffer = bytearray()
+        self._max_buffer = max_buffer
+        self._stats = DecoderStats()
+
+    @property
+    def stats(self) -> DecoderStats:
+        return self._stats
+
+    def pending_bytes(self) -> int:
+        return len(self._buffer)
+
+    def clear(self) -> None:
+        """Abandonne les octets en attente (début de trame d'un flux interrompu)."""
+        self._buffer.clear()
+
+    def feed(self, data: bytes | bytearray | memoryview) -> list[TelemetryFrame]:
+        if not self._buffer:
+            # Cas courant : on décode directement le tampon de réception, seul le reste est copié.
+            frames, consumed = decode_frames(data, self._stats)
+            if consumed < len(data):
+                self._buffer += data[consumed:]
+            return frames
+        self._buffer += data
+        frames, consumed = decode_frames(self._buffer, self._stats)
+        del self._buffer[:consumed]
+        if len(self._buffer) > self._max_buffer:
+            self._stats.resyncs += 1
+            self._buffer.clear()
+        return frames
@@ -0,0 +1,256 @@
+"""Enregistrement de session et relecture rapide de la télémétrie.
+
+Le journal est un en-tête fixe suivi des trames du protocole binaire, mises
+bout à bout. Un fichier d'index creux (`<journal>.idx`) reçoit un couple
+(horodatage µs, position) toutes les `index_stride` trames ; il est reconstruit
+par un parcours des en-têtes s'il manque.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from datetime import datetime
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from models import OverflowPolicy, TelemetryFrame
+from protocol import decode_frames, encode_into, peek_frame, to_epoch_us
+from services import TelemetryService, ThreadedTelemetryService
+
+LOG_MAGIC = b"KTLG"
+LOG_VERSION = 1
+_LOG_HEADER = struct.Struct("<4sHH")
+_INDEX_ENTRY = struct.Struct("<qQ")
+_REPLAY_CHUNK = 256 * 1024
+
+
+def index_path_for(path: Path) -> Path:
+    return path.with_name(path.name + ".idx")
+
+
+def read_session(path: Path) -> list[TelemetryFrame]:
+    """Décode d'un bloc toutes les trames d'un journal (recalculs hors ligne)."""
+    data = Path(path).read_bytes()
+    if len(data) < _LOG_HEADER.size:
+        raise ValueError(f"not a telemetry log: {path}")
+    magic, version, _reserved = _LOG_HEADER.unpack_from(data, 0)
+    if magic != LOG_MAGIC or version != LOG_VERSION:
+        raise ValueError(f"not a telemetry log: {path}")
+    with memoryview(data) as view:
+        frames, _consumed = decode_frames(view[_LOG_HEADER.size :])
+    return frames
+
+
+class SessionRecorder(QObject):
+    """Ajoute chaque trame de `telemetry_updated` au journal par écritures groupées."""
+
+    def __init__(
+        self,
+        path: Path,
+        batch_frames: int = 64,
+        flush_interval_ms: int = 1000,
+        index_stride: int = 256,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self._path = Path(path)
+        self._batch_frames = max(1, batch_frames)
+        self._index_stride = max(1, index_stride)
+        self._file = self._path.open("ab")
+        self._index_file = index_path_for(self._path).open("ab")
+        if self._file.tell() == 0:
+            self._file.write(_LOG_HEADER.pack(LOG_MAGIC, LOG_VERSION, 0))
+        self._offset = self._file.tell()
+        self._pending = bytearray()
+        self._pending_index = bytearray()
+        self._pending_frames = 0
+        self._seq = 0
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(flush_interval_ms)
+        self._flush_timer.timeout.connect(self.flush)
+        self._flush_timer.start()
+
+    @property
+    def frames_recorded(self) -> int:
+        return self._seq
+
+    def attach(self, service: TelemetryService) -> None:
+        service.telemetry_updated.connect(self.record)
+
+    def detach(self, service: TelemetryService) -> None:
+        service.telemetry_updated.disconnect(self.record)
+
+    def record(self, frame: TelemetryFrame) -> None:
+        if self._seq % self._index_stride == 0:
+            position = self._offset + len(self._pending)
+            self._pending_index += _INDEX_ENTRY.pack(to_epoch_us(frame.timestamp), position)
+        encode_into(self._pending, frame, self._seq)
+        self._seq += 1
+        self._pending_frames += 1
+        if self._pending_frames >= self._batch_frames:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self._file.write(self._pending)
+            self._file.flush()
+            self._offset += len(self._pending)
+            self._pending.clear()
+            self._pending_frames = 0
+        if self._pending_index:
+            self._index_file.write(self._pending_index)
+            self._index_file.flush()
+            self._pending_index.clear()
+
+    def close(self) -> None:
+        self._flush_timer.stop()
+        self.flush()
+        self._file.close()
+        self._index_file.close()
+
+
+class ReplayTelemetryService(ThreadedTelemetryService):
+    """Relit un journal via `mmap` à 1x, Nx (`speed`) ou aussi vite que possible (`speed=0`)."""
+
+    replay_finished = Signal()
+
+    def __init__(
+        self,
+        path: Path,
+        speed: float = 1.0,
+        loop: bool = False,
+        mailbox_capacity: int = 4,
+        overflow_policy: OverflowPolicy = OverflowPolicy.COALESCE,
+    ) -> None:
+        super().__init__(mailbox_capacity, overflow_policy)
+        self._path = Path(path)
+        self._speed = max(0.0, speed)
+        self._loop = loop
+        self._seek_lock = threading.Lock()
+        self._seek_to_us: int | None = None
+        self._position_us = 0
+        with self._path.open("rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _reserved = _LOG_HEADER.unpack_from(self._mmap, 0)
+        if magic != LOG_MAGIC or version != LOG_VERSION:
+            self._mmap.close()
+            raise ValueError(f"not a telemetry log: {self._path}")
+        self._index_ts, self._index_offsets = self._load_index()
+
+    @property
+    def start_us(self) -> int:
+        return self._index_ts[0] if self._index_ts else 0
+
+    @property
+    def position_us(self) -> int:
+        return self._position_us
+
+    def set_speed(self, speed: float) -> None:
+        self._speed = max(0.0, speed)
+
+    def seek(self, when: datetime | int) -> None:
+        """Repositionne la relecture sur la première trame à partir de `when` (datetime UTC ou µs)."""
+        target = when if isinstance(when, int) else to_epoch_us(when)
+        with self._seek_lock:
+            self._seek_to_us = target
+
+    def close(self) -> None:
+        self.stop()
+        self._mmap.close()
+
+    def _load_index(self) -> tuple[array, array]:
+        timestamps = array("q")
+        offsets = array("Q")
+        index_path = index_path_for(self._path)
+        if index_path.exists():
+            data = index_path.read_bytes()
+            usable = len(data) - len(data) % _INDEX_ENTRY.size
+            for ts, offset in _INDEX_ENTRY.iter_unpack(data[:usable]):
+                if offset < len(self._mmap):
+                    timestamps.append(ts)
+                    offsets.append(offset)
+            if timestamps:
+                return timestamps, offsets
+        # Pas d'index : parcours des seuls en-têtes, une entrée toutes les 256 trames.
+        with memoryview(self._mmap) as view:
+            offset = _LOG_HEADER.size
+            count = 0
+            while (peeked := peek_frame(view, offset)) is not None:
+                size, ts = peeked
+                if count % 256 == 0:
+                    timestamps.append(ts)
+                    offsets.append(offset)
+                offset += size
+                count += 1
+        return timestamps, offsets
+
+    def _offset_for(self, target_us: int) -> int:
+        slot = bisect_right(self._index_ts, target_us) - 1
+        return self._index_offsets[slot] if slot >= 0 else _LOG_HEADER.size
+
+    def _take_seek(self) -> int | None:
+        with self._seek_lock:
+            target, self._seek_to_us = self._seek_to_us, None
+            return target
+
+    def produce(self) -> None:
+        view = memoryview(self._mmap)
+        try:
+            self._replay(view)
+        finally:
+            view.release()
+        self.replay_finished.emit()
+
+    def _replay(self, view: memoryview) -> None:
+        offset = _LOG_HEADER.size
+        skip_before_us: int | None = None
+        base_wall: float | None = None
+        base_us = 0
+        base_speed = self._speed
+        # Passe entière depuis le début du journal sans aucune trame publiée : rien à rejouer.
+        from_start, published = True, False
+        while not self._stop_requested.is_set():
+            target = self._take_seek()
+            if target is not None:
+                offset = self._offset_for(target)
+                skip_before_us = target
+                base_wall = None
+                from_start = False
+
+            chunk = view[offset : offset + _REPLAY_CHUNK]
+            frames, consumed = decode_frames(chunk)
+            chunk.release()
+            if consumed == 0:
+                if not self._loop or (from_start and not published):
+                    return
+                offset = _LOG_HEADER.size
+                skip_before_us = None
+                base_wall = None
+                from_start, published = True, False
+                continue
+            offset += consumed
+
+            for frame in frames:
+                frame_us = to_epoch_us(frame.timestamp)
+                if skip_before_us is not None:
+                    if frame_us < skip_before_us:
+                        continue
+                    skip_before_us = None
+                speed = self._speed
+                if base_wall is None or speed != base_speed:
+                    base_wall, base_us, base_speed = time.monotonic(), frame_us, speed
+                if speed > 0:
+                    delay = base_wall + (frame_us - base_us) / 1e6 / speed - time.monotonic()
+                    if delay > 0 and self._stop_requested.wait(delay):
+                        return
+                self._position_us = frame_us
+                self.publish(frame)
+                published = True
+                if self._seek_to_us is not None or self._stop_requested.is_set():
+                    break
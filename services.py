@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import heapq
 import json
+import logging
 import math
-from dataclasses import asdict
+import os
+import socket
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import asdict, replace
 from datetime import datetime
 from pathlib import Path
 
-from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtCore import QObject, Qt, QThread, QTimer, Signal
 from PySide6.QtWidgets import QApplication
 
 from models import (
@@ -18,10 +26,20 @@ from models import (
     ConnectivityState,
     GpsData,
     GpsFixState,
+    MailboxStats,
+    OverflowPolicy,
     PageId,
+    RenderStats,
+    SettingsStats,
     TelemetryFrame,
     ThemeMode,
 )
+from protocol import FrameDecoder, encode_into
+
+_LOG = logging.getLogger(__name__)
+
+SAVE_DEBOUNCE_S = 0.5
+SAVE_MAX_DELAY_S = 2.0
 
 
 class TelemetryService(QObject):
@@ -34,24 +52,136 @@ class TelemetryService(QObject):
         raise NotImplementedError
 
 
-class MockTelemetryService(TelemetryService):
-    def __init__(self, update_ms: int = 80) -> None:
+class FrameMailbox:
+    """Boîte aux lettres bornée entre le thread producteur et le thread GUI.
+
+    En cas de débordement la plus ancienne trame est jetée. À la livraison,
+    `COALESCE` ne rend que la plus récente ; `DROP_OLDEST` rend toutes les
+    trames encore en file, dans l'ordre.
+    """
+
+    def __init__(self, capacity: int = 4, policy: OverflowPolicy = OverflowPolicy.COALESCE) -> None:
+        self._capacity = max(1, capacity)
+        self._policy = policy
+        self._frames: deque[TelemetryFrame] = deque()
+        self._lock = threading.Lock()
+        self._stats = MailboxStats()
+
+    def post(self, frame: TelemetryFrame) -> bool:
+        """Dépose une trame ; retourne True si la boîte était vide (réveil nécessaire)."""
+        with self._lock:
+            was_empty = not self._frames
+            if len(self._frames) >= self._capacity:
+                self._frames.popleft()
+                self._stats.dropped += 1
+            self._frames.append(frame)
+            self._stats.posted += 1
+            return was_empty
+
+    def take_latest(self) -> TelemetryFrame | None:
+        with self._lock:
+            if not self._frames:
+                return None
+            frame = self._frames.pop()
+            self._stats.coalesced += len(self._frames)
+            self._stats.delivered += 1
+            self._frames.clear()
+            return frame
+
+    def take_pending(self) -> list[TelemetryFrame]:
+        if self._policy == OverflowPolicy.COALESCE:
+            frame = self.take_latest()
+            return [] if frame is None else [frame]
+        with self._lock:
+            frames = list(self._frames)
+            self._frames.clear()
+            self._stats.delivered += len(frames)
+            return frames
+
+    def depth(self) -> int:
+        with self._lock:
+            return len(self._frames)
+
+    def stats(self) -> MailboxStats:
+        with self._lock:
+            return replace(self._stats)
+
+
+class _ProducerThread(QThread):
+    def __init__(self, service: ThreadedTelemetryService) -> None:
         super().__init__()
-        self._timer = QTimer(self)
-        self._timer.setInterval(update_ms)
-        self._timer.timeout.connect(self._tick)
-        self._phase = 0.0
-        self._battery = 100.0
-        self._lat = 37.7749
-        self._lon = -122.4194
+        self._service = service
+
+    def run(self) -> None:
+        self._service.produce()
+
+
+class ThreadedTelemetryService(TelemetryService):
+    """Base des services qui lisent et décodent les trames hors du thread GUI.
+
+    Les sous-classes implémentent `read_frame` (appelée en boucle dans le thread
+    producteur). Les trames passent par une `FrameMailbox` et sont émises sur
+    `telemetry_updated` dans le thread GUI, selon la politique de débordement.
+    """
+
+    _frame_posted = Signal()
+
+    def __init__(
+        self,
+        mailbox_capacity: int = 4,
+        overflow_policy: OverflowPolicy = OverflowPolicy.COALESCE,
+    ) -> None:
+        super().__init__()
+        self._mailbox = FrameMailbox(mailbox_capacity, overflow_policy)
+        self._stop_requested = threading.Event()
+        self._thread: _ProducerThread | None = None
+        self._frame_posted.connect(self._deliver_pending, Qt.QueuedConnection)
 
     def start(self) -> None:
-        self._timer.start()
+        if self._thread is not None and self._thread.isRunning():
+            return
+        self._stop_requested.clear()
+        self._thread = _ProducerThread(self)
+        self._thread.start()
 
     def stop(self) -> None:
-        self._timer.stop()
+        self._stop_requested.set()
+        if self._thread is not None:
+            self._thread.wait()
+            self._thread = None
 
-    def _tick(self) -> None:
+    def is_stopping(self) -> bool:
+        return self._stop_requested.is_set()
+
+    def mailbox_stats(self) -> MailboxStats:
+        return self._mailbox.stats()
+
+    def produce(self) -> None:
+        while not self._stop_requested.is_set():
+            frame = self.read_frame()
+            if frame is not None:
+                self.publish(frame)
+
+    def read_frame(self) -> TelemetryFrame | None:
+        raise NotImplementedError
+
+    def publish(self, frame: TelemetryFrame) -> None:
+        if self._mailbox.post(frame):
+            self._frame_posted.emit()
+
+    def _deliver_pending(self) -> None:
+        for frame in self._mailbox.take_pending():
+            self.telemetry_updated.emit(frame)
+
+
+class MockFrameGenerator:
+    def __init__(self, phase: float = 0.0) -> None:
+        self._phase = phase
+        self._battery = 100.0
+        self._lat = 37.7749
+        self._lon = -122.4194
+
+    def next_frame(self) -> TelemetryFrame:
         self._phase += 0.07
         speed = max(0.0, 28 + 16 * math.sin(self._phase))
         self._battery = max(5.0, self._battery - 0.006)
@@ -79,7 +209,7 @@ class MockTelemetryService(TelemetryService):
                 )
             )
 
-        frame = TelemetryFrame(
+        return TelemetryFrame(
             speed_kmh=speed,
             battery_percent=int(self._battery),
             reverse=reverse,
@@ -93,71 +223,513 @@ class MockTelemetryService(TelemetryService):
             alerts=alerts,
             timestamp=datetime.utcnow(),
         )
-        self.telemetry_updated.emit(frame)
+
+
+class MockTelemetryService(TelemetryService):
+    def __init__(self, update_ms: int = 80) -> None:
+        super().__init__()
+        self._timer = QTimer(self)
+        self._timer.setInterval(update_ms)
+        self._timer.timeout.connect(self._tick)
+        self._generator = MockFrameGenerator()
+
+    def start(self) -> None:
+        self._timer.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    def _tick(self) -> None:
+        self.telemetry_updated.emit(self._generator.next_frame())
+
+
+class ThreadedMockTelemetryService(ThreadedTelemetryService):
+    def __init__(self, rate_hz: float = 12.5, mailbox_capacity: int = 4) -> None:
+        super().__init__(mailbox_capacity)
+        self._period = 1.0 / max(0.1, rate_hz)
+        self._generator = MockFrameGenerator()
+        self._next_at = 0.0
+
+    def read_frame(self) -> TelemetryFrame | None:
+        now = time.monotonic()
+        self._next_at = max(self._next_at + self._period, now)
+        delay = self._next_at - now
+        if delay > 0 and self._stop_requested.wait(delay):
+            return None
+        return self._generator.next_frame()
+
+
+class LoopbackTelemetryService(ThreadedTelemetryService):
+    """Banc local : encode des trames simulées, les fait transiter par une socketpair et les décode."""
+
+    def __init__(self, rate_hz: float = 100.0, batch_size: int = 4, mailbox_capacity: int = 4) -> None:
+        super().__init__(mailbox_capacity)
+        self._period = batch_size / max(0.1, rate_hz)
+        self._batch_size = max(1, batch_size)
+        self._generator = MockFrameGenerator()
+        self._decoder = FrameDecoder()
+        self._tx_buffer = bytearray()
+        self._rx_buffer = bytearray(64 * 1024)
+        self._seq = 0
+
+    @property
+    def decoder(self) -> FrameDecoder:
+        return self._decoder
+
+    def produce(self) -> None:
+        tx, rx = socket.socketpair()
+        rx_view = memoryview(self._rx_buffer)
+        next_at = time.monotonic()
+        try:
+            while not self._stop_requested.is_set():
+                self._tx_buffer.clear()
+                for _ in range(self._batch_size):
+                    encode_into(self._tx_buffer, self._generator.next_frame(), self._seq)
+                    self._seq += 1
+                tx.sendall(self._tx_buffer)
+                received = 0
+                while received < len(self._tx_buffer):
+                    count = rx.recv_into(rx_view)
+                    received += count
+                    for frame in self._decoder.feed(rx_view[:count]):
+                        self.publish(frame)
+                next_at = max(next_at + self._period, time.monotonic())
+                self._stop_requested.wait(max(0.0, next_at - time.monotonic()))
+        finally:
+            rx_view.release()
+            tx.close()
+            rx.close()
+
+
+class RenderScheduler(QObject):
+    """Découple la cadence de télémétrie de la cadence de rafraîchissement de l'UI.
+
+    Les trames reçues entre deux rendus sont fusionnées : valeurs les plus
+    récentes, `reverse` collant et alertes accumulées. Le rendu est sauté si
+    `visible_key` indique que rien d'affiché n'a changé.
+    """
+
+    render_requested = Signal(object)
+
+    def __init__(
+        self,
+        max_hz: float = 30.0,
+        visible_key: Callable[[TelemetryFrame], Hashable] | None = None,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self._interval_s = 1.0 / 30.0
+        self._visible_key = visible_key
+        self._pending: TelemetryFrame | None = None
+        self._pending_count = 0
+        self._pending_reverse = False
+        self._pending_alerts: dict[str, Alert] = {}
+        self._last_key: Hashable | None = None
+        self._last_render_at = -math.inf
+        self._stats = RenderStats()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._flush)
+        self.set_max_hz(max_hz)
+
+    def set_max_hz(self, max_hz: float) -> None:
+        self._interval_s = 1.0 / max(1.0, min(240.0, float(max_hz)))
+
+    def stats(self) -> RenderStats:
+        return replace(self._stats)
+
+    def invalidate(self) -> None:
+        self._last_key = None
+
+    def submit(self, frame: TelemetryFrame) -> None:
+        self._stats.submitted += 1
+        self._pending = frame
+        self._pending_count += 1
+        self._pending_reverse = self._pending_reverse or frame.reverse
+        for alert in frame.alerts:
+            self._pending_alerts[alert.alert_id] = alert
+        if self._timer.isActive():
+            return
+        wait_s = self._last_render_at + self._interval_s - time.monotonic()
+        if wait_s <= 0:
+            self._flush()
+        else:
+            self._timer.start(max(1, math.ceil(wait_s * 1000)))
+
+    def flush(self) -> None:
+        self._timer.stop()
+        self._flush()
+
+    def _flush(self) -> None:
+        frame = self._pending
+        if frame is None:
+            return
+        if self._pending_count > 1 or self._pending_alerts:
+            frame = replace(
+                frame,
+                reverse=self._pending_reverse,
+                alerts=list(self._pending_alerts.values()),
+            )
+        self._stats.coalesced += self._pending_count - 1
+        self._pending = None
+        self._pending_count = 0
+        self._pending_reverse = False
+        self._pending_alerts = {}
+
+        if self._visible_key is not None:
+            key = self._visible_key(frame)
+            if key == self._last_key and not frame.alerts:
+                self._stats.skipped += 1
+                return
+            self._last_key = key
+        self._last_render_at = time.monotonic()
+        self._stats.rendered += 1
+        self.render_requested.emit(frame)
 
 
 class SettingsRepository:
-    def __init__(self, path: Path | None = None) -> None:
+    """Réglages en JSON, lus une fois puis servis depuis le cache, écrits en différé.
+
+    `save_settings` ne fait que mémoriser une copie et réveiller le thread
+    d'écriture : celui-ci attend `debounce_s` sans nouveau changement (au plus
+    `max_delay_s` après le premier), si bien qu'une rafale de zooms ou de
+    réglages ne produit qu'une écriture. L'écriture est atomique (fichier
+    temporaire, `fsync`, `os.replace`) : une coupure d'alimentation laisse
+    l'ancien fichier ou le nouveau, jamais un JSON tronqué.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        debounce_s: float = SAVE_DEBOUNCE_S,
+        max_delay_s: float = SAVE_MAX_DELAY_S,
+    ) -> None:
         self._path = path or Path(__file__).resolve().parent / "user_settings.json"
+        self._debounce_s = debounce_s
+        self._max_delay_s = max(debounce_s, max_delay_s)
+        self._cached: AppSettings | None = None
+        self._written: str | None = None
+        self._pending: str | None = None
+        self._first_change_at = 0.0
+        self._last_change_at = 0.0
+        self._writing = False
+        self._closed = False
+        self._stats = SettingsStats()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def path(self) -> Path:
+        return self._path
 
     def load_settings(self) -> AppSettings:
+        with self._condition:
+            if self._cached is None:
+                self._cached = self._read()
+            return replace(self._cached)
+
+    def _read(self) -> AppSettings:
         if not self._path.exists():
             return AppSettings()
         try:
-            payload = json.loads(self._path.read_text(encoding="utf-8"))
+            text = self._path.read_text(encoding="utf-8")
+            payload = json.loads(text)
             defaults = AppSettings()
-            return AppSettings(
+            settings = AppSettings(
                 theme_mode=ThemeMode(payload.get("theme_mode", defaults.theme_mode.value)),
                 brightness=int(payload.get("brightness", defaults.brightness)),
                 default_page=PageId(payload.get("default_page", defaults.default_page.value)),
                 map_follow=bool(payload.get("map_follow", defaults.map_follow)),
                 map_zoom=int(payload.get("map_zoom", defaults.map_zoom)),
+                max_render_hz=int(payload.get("max_render_hz", defaults.max_render_hz)),
+                perf_overlay=bool(payload.get("perf_overlay", defaults.perf_overlay)),
             )
-        except (ValueError, TypeError, json.JSONDecodeError):
+        except (OSError, ValueError, TypeError, AttributeError) as exc:
+            _LOG.warning("settings file %s unreadable, using defaults: %s", self._path, exc)
             return AppSettings()
+        self._written = text
+        return settings
 
     def save_settings(self, settings: AppSettings) -> None:
+        """Non bloquant : l'écriture sur disque a lieu plus tard, dans le thread d'écriture."""
         payload = asdict(settings)
         payload["theme_mode"] = settings.theme_mode.value
         payload["default_page"] = settings.default_page.value
-        self._path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        text = json.dumps(payload, indent=2)
+        now = time.monotonic()
+        with self._condition:
+            self._cached = replace(settings)
+            self._stats.saves += 1
+            if self._pending is not None:
+                self._stats.coalesced += 1
+            else:
+                self._first_change_at = now
+            self._pending = text
+            self._last_change_at = now
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._write_loop, name="settings-writer", daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Écrit sans attendre la fin du délai ; retourne faux si l'écriture n'est pas finie à `timeout`."""
+        with self._condition:
+            if self._pending is not None:
+                self._first_change_at = self._last_change_at = -float("inf")
+                self._condition.notify_all()
+            return self._condition.wait_for(lambda: self._pending is None and not self._writing, timeout)
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> SettingsStats:
+        with self._condition:
+            return replace(self._stats)
+
+    def _write_loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._pending is None:
+                        self._condition.wait()
+                        continue
+                    now = time.monotonic()
+                    due = min(self._last_change_at + self._debounce_s, self._first_change_at + self._max_delay_s)
+                    if now >= due:
+                        break
+                    self._condition.wait(due - now)
+                if self._pending is None:
+                    return
+                text, self._pending = self._pending, None
+                skip = text == self._written
+                self._writing = not skip
+                if skip:
+                    self._stats.unchanged += 1
+                    self._condition.notify_all()
+                    continue
+            try:
+                self._write_atomic(text)
+            except OSError as exc:
+                _LOG.warning("could not save settings to %s: %s", self._path, exc)
+                written = False
+            else:
+                written = True
+            with self._condition:
+                self._writing = False
+                if written:
+                    self._written = text
+                    self._stats.writes += 1
+                else:
+                    self._stats.errors += 1
+                self._condition.notify_all()
+
+    def _write_atomic(self, text: str) -> None:
+        tmp = self._path.with_name(self._path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp, self._path)
+        # Le renommage lui-même n'est durable qu'une fois le répertoire synchronisé.
+        if hasattr(os, "O_DIRECTORY"):
+            fd = os.open(self._path.parent, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+
+def brightness_overlay_opacity(brightness: int) -> float:
+    return (100 - max(0, min(100, brightness))) / 130.0
 
 
 class ThemeManager:
-    def __init__(self, application: QApplication) -> None:
+    """Charge `day.qss`/`night.qss` une seule fois et met en cache les feuilles compilées.
+
+    Sans overlay de luminosité, la feuille compilée inclut une règle de
+    luminosité arrondie à `brightness_step` (clé de cache : mode, palier). Avec
+    un overlay attaché, la feuille ne dépend plus que du mode et la luminosité
+    passe par `set_brightness`, sans re-polish de l'application.
+    """
+
+    def __init__(
+        self,
+        application: QApplication,
+        styles_dir: Path | None = None,
+        brightness_step: int = 5,
+    ) -> None:
         self._application = application
+        self._styles_dir = styles_dir or Path(__file__).resolve().parent / "styles"
+        self._brightness_step = max(1, brightness_step)
+        self._sources = {mode: self._load_source(mode) for mode in ThemeMode}
+        self._compiled: dict[tuple[ThemeMode, int | None], str] = {}
+        self._applied_key: tuple[ThemeMode, int | None] | None = None
+        self._overlay = None
+        self._theme_mode: ThemeMode | None = None
+        self._brightness = 100
+        self._stylesheet_applies = 0
+
+    @property
+    def theme_mode(self) -> ThemeMode | None:
+        return self._theme_mode
+
+    @property
+    def brightness(self) -> int:
+        return self._brightness
+
+    @property
+    def stylesheet_applies(self) -> int:
+        return self._stylesheet_applies
+
+    def attach_brightness_overlay(self, overlay) -> None:
+        """`overlay` expose `set_dim_opacity(float)` ; il remplace la règle de luminosité du QSS."""
+        self._overlay = overlay
+        if self._theme_mode is not None:
+            self.apply_theme(self._theme_mode, self._brightness)
 
     def apply_theme(self, theme_mode: ThemeMode, brightness: int) -> None:
-        stylesheet_name = "day.qss" if theme_mode == ThemeMode.DAY else "night.qss"
-        stylesheet_path = Path(__file__).resolve().parent / "styles" / stylesheet_name
-        base_qss = stylesheet_path.read_text(encoding="utf-8")
+        self._theme_mode = theme_mode
+        if self._overlay is not None:
+            key = (theme_mode, None)
+        else:
+            key = (theme_mode, self._bucket(brightness))
+        if key != self._applied_key:
+            self._application.setStyleSheet(self._compile(key))
+            self._applied_key = key
+            self._stylesheet_applies += 1
+        self.set_brightness(brightness)
+
+    def set_brightness(self, brightness: int) -> None:
+        self._brightness = max(0, min(100, brightness))
+        if self._overlay is not None:
+            self._overlay.set_dim_opacity(brightness_overlay_opacity(self._brightness))
+
+    def _bucket(self, brightness: int) -> int:
         clamped = max(0, min(100, brightness))
-        overlay_opacity = (100 - clamped) / 130.0
-        brightness_qss = (
-            "QWidget#RootWindow {"
-            f"background-color: rgba(0, 0, 0, {overlay_opacity:.2f});"
-            "}"
-        )
-        self._application.setStyleSheet(base_qss + "\n" + brightness_qss)
+        return min(100, round(clamped / self._brightness_step) * self._brightness_step)
+
+    def _load_source(self, theme_mode: ThemeMode) -> str:
+        stylesheet_name = "day.qss" if theme_mode == ThemeMode.DAY else "night.qss"
+        return (self._styles_dir / stylesheet_name).read_text(encoding="utf-8")
+
+    def _compile(self, key: tuple[ThemeMode, int | None]) -> str:
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            theme_mode, brightness = key
+            compiled = self._sources[theme_mode]
+            if brightness is not None:
+                compiled += (
+                    "\nQWidget#RootWindow {"
+                    f"background-color: rgba(0, 0, 0, {brightness_overlay_opacity(brightness):.2f});"
+                    "}"
+                )
+            self._compiled[key] = compiled
+        return compiled
 
 
 class AlertManager:
+    """Alertes actives indexées par niveau, avec expiration (TTL) et ré-armement des acquittements.
+
+    Chaque niveau garde un dict ordonné des alertes actives non acquittées : la
+    bannière est la première alerte du niveau le plus élevé non vide (O(1)).
+    Les échéances sont dans un tas à une entrée par alerte, prolongée
+    paresseusement quand l'alerte est ré-émise. Une alerte `ack_required` ne
+    expire pas tant qu'elle n'est pas acquittée. Quand une alerte disparaît
+    (TTL ou `clear`), son acquittement est oublié : si elle revient, elle
+    s'affiche à nouveau.
+    """
+
     _priority = {AlertLevel.INFO: 0, AlertLevel.WARNING: 1, AlertLevel.CRITICAL: 2}
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        default_ttl_s: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._default_ttl_s = default_ttl_s
+        self._clock = clock
         self._active: dict[str, Alert] = {}
         self._acked: set[str] = set()
+        self._pending: dict[AlertLevel, dict[str, Alert]] = {
+            level: {} for level in sorted(self._priority, key=self._priority.get, reverse=True)
+        }
+        self._expires_at: dict[str, float] = {}
+        self._scheduled: set[str] = set()
+        self._expiry_heap: list[tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._active)
 
-    def ingest(self, alerts: list[Alert]) -> None:
+    def ingest(self, alerts: Iterable[Alert], now: float | None = None) -> None:
+        now = self._clock() if now is None else now
         for alert in alerts:
-            self._active[alert.alert_id] = alert
+            self._upsert(alert, now)
 
     def acknowledge(self, alert_id: str) -> None:
+        alert = self._active.get(alert_id)
+        if alert is None:
+            return
         self._acked.add(alert_id)
+        self._pending[alert.level].pop(alert_id, None)
+        if alert_id in self._expires_at:
+            self._schedule(alert_id, self._expires_at[alert_id])
 
-    def get_banner_alert(self) -> Alert | None:
-        candidates = [a for a in self._active.values() if a.alert_id not in self._acked]
-        if not candidates:
-            return None
-        candidates.sort(key=lambda a: self._priority[a.level], reverse=True)
-        return candidates[0]
+    def clear(self, alert_id: str) -> None:
+        alert = self._active.pop(alert_id, None)
+        if alert is not None:
+            self._pending[alert.level].pop(alert_id, None)
+        self._acked.discard(alert_id)
+        self._expires_at.pop(alert_id, None)
+
+    def expire(self, now: float | None = None) -> None:
+        now = self._clock() if now is None else now
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, alert_id = heapq.heappop(heap)
+            self._scheduled.discard(alert_id)
+            expires_at = self._expires_at.get(alert_id)
+            if expires_at is None:
+                continue
+            if expires_at > now:
+                self._schedule(alert_id, expires_at)
+                continue
+            alert = self._active[alert_id]
+            if alert.ack_required and alert_id not in self._acked:
+                # Verrouillée jusqu'à l'acquittement, qui replanifie l'expiration.
+                continue
+            self.clear(alert_id)
+
+    def get_banner_alert(self, now: float | None = None) -> Alert | None:
+        if self._expiry_heap:
+            self.expire(now)
+        for alerts in self._pending.values():
+            if alerts:
+                return next(iter(alerts.values()))
+        return None
+
+    def _upsert(self, alert: Alert, now: float) -> None:
+        alert_id = alert.alert_id
+        previous = self._active.get(alert_id)
+        if previous is not None and previous.level != alert.level:
+            self._pending[previous.level].pop(alert_id, None)
+        self._active[alert_id] = alert
+        if alert_id not in self._acked:
+            self._pending[alert.level][alert_id] = alert
+        ttl_s = alert.ttl_s if alert.ttl_s is not None else self._default_ttl_s
+        if ttl_s is None:
+            self._expires_at.pop(alert_id, None)
+            return
+        self._expires_at[alert_id] = now + ttl_s
+        self._schedule(alert_id, now + ttl_s)
+
+    def _schedule(self, alert_id: str, expires_at: float) -> None:
+        if alert_id not in self._scheduled:
+            self._scheduled.add(alert_id)
+            heapq.heappush(self._expiry_heap, (expires_at, alert_id))
@@ -0,0 +1,109 @@
+"""Démarrage rapide : vue vitesse minimale et profilage des phases de démarrage.
+
+La vue `SpeedView` ne dépend que de Qt et du signal `telemetry_updated` ; elle
+s'affiche avant l'import de l'UI complète, le chargement des réglages et
+l'application du thème. `StartupProfiler` chronomètre chaque phase et journalise
+le détail une fois la fenêtre principale affichée.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QLabel, QVBoxLayout, QWidget
+
+from models import TelemetryFrame
+
+_LOG = logging.getLogger(__name__)
+
+# Feuille locale volontairement minimale : le thème complet n'est pas encore chargé.
+_SPEED_VIEW_STYLE = """
+QWidget#SpeedView { background-color: #0b1220; }
+QLabel { color: #e8eef7; background: transparent; }
+QLabel#SpeedValue { font-size: 160px; font-weight: 700; }
+QLabel#SpeedUnit { font-size: 36px; color: #9fb2ce; }
+"""
+
+
+class StartupProfiler:
+    """Durées par phase (ms) et jalons mesurés depuis `origin`."""
+
+    def __init__(self, origin: float | None = None, clock=time.perf_counter) -> None:
+        self._clock = clock
+        self._origin = clock() if origin is None else origin
+        self._phases: dict[str, float] = {}
+        self._marks: dict[str, float] = {}
+
+    def record(self, name: str, started: float) -> float:
+        elapsed_ms = (self._clock() - started) * 1000
+        self._phases[name] = self._phases.get(name, 0.0) + elapsed_ms
+        return elapsed_ms
+
+    @contextmanager
+    def phase(self, name: str):
+        started = self._clock()
+        try:
+            yield
+        finally:
+            self.record(name, started)
+
+    def mark(self, name: str) -> None:
+        """Jalon (ms depuis l'origine) ; seul le premier passage compte."""
+        self._marks.setdefault(name, (self._clock() - self._origin) * 1000)
+
+    def phases(self) -> dict[str, float]:
+        return dict(self._phases)
+
+    def marks(self) -> dict[str, float]:
+        return dict(self._marks)
+
+    def report(self) -> dict:
+        return {"phases_ms": self.phases(), "marks_ms": self.marks()}
+
+    def log(self, logger: logging.Logger = _LOG) -> None:
+        for name, elapsed_ms in self._phases.items():
+            logger.info("phase %-22s %8.1f ms", name, elapsed_ms)
+        for name, at_ms in sorted(self._marks.items(), key=lambda item: item[1]):
+            logger.info("mark  %-22s %8.1f ms", name, at_ms)
+
+    def dump(self, path: Path) -> None:
+        Path(path).write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
+
+
+class SpeedView(QWidget):
+    """Vue de démarrage : uniquement la vitesse, sans thème ni pages."""
+
+    first_frame_shown = Signal()
+
+    def __init__(self, profiler: StartupProfiler | None = None, parent=None) -> None:
+        super().__init__(parent)
+        self.setObjectName("SpeedView")
+        self.setAttribute(Qt.WA_StyledBackground)
+        self.setStyleSheet(_SPEED_VIEW_STYLE)
+        self._profiler = profiler
+        self._seen_frame = False
+        self._speed = QLabel("--")
+        self._speed.setObjectName("SpeedValue")
+        unit = QLabel("km/h")
+        unit.setObjectName("SpeedUnit")
+
+        layout = QVBoxLayout(self)
+        layout.addStretch(1)
+        layout.addWidget(self._speed, alignment=Qt.AlignHCenter)
+        layout.addWidget(unit, alignment=Qt.AlignHCenter)
+        layout.addStretch(1)
+
+    def on_telemetry(self, frame: TelemetryFrame) -> None:
+        text = f"{frame.speed_kmh:0.0f}"
+        if text != self._speed.text():
+            self._speed.setText(text)
+        if not self._seen_frame:
+            self._seen_frame = True
+            if self._profiler is not None:
+                self._profiler.mark("first_telemetry_frame")
+            self.first_frame_shown.emit()
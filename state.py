@@ -0,0 +1,195 @@
+"""État de télémétrie partagé, avec abonnements par champ.
+
+`TelemetryState.update` compare la trame rendue à la précédente champ par
+champ (valeurs arrondies à la précision affichée, comme la clé de rendu de
+`RenderScheduler`) et obtient un masque `Field` des champs modifiés. Chaque
+widget s'abonne aux seuls champs qu'il affiche ; la diffusion ne parcourt que
+les listes d'abonnés des champs modifiés, si bien que son coût dépend du
+nombre de champs qui changent et non du nombre de widgets. Un abonné inscrit
+à plusieurs champs modifiés n'est appelé qu'une fois.
+
+Les widgets d'une page cachée sont regroupés dans un `SubscriberGroup`
+suspendu : ses abonnements sont retirés des listes et ne coûtent rien par
+trame. `resume` (à l'affichage de la page) rattrape en un seul appel par
+abonné ceux dont un champ a changé depuis la suspension.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import replace
+from enum import IntFlag
+
+from models import DispatchStats, TelemetryFrame
+
+
+class Field(IntFlag):
+    SPEED = 1
+    BATTERY = 2
+    REVERSE = 4
+    LINK = 8
+    GPS_FIX = 16
+    HEADING = 32
+    POSITION = 64
+
+
+ALL_FIELDS = Field(sum(Field))
+_FIELD_COUNT = len(Field)
+# Valeur impossible : le prochain `update` signale le champ comme modifié.
+_UNSET = object()
+
+
+def field_values(frame: TelemetryFrame) -> tuple:
+    """Valeurs de chaque champ à la précision affichée, dans l'ordre des bits de `Field`."""
+    gps = frame.gps
+    return (
+        round(frame.speed_kmh),
+        frame.battery_percent,
+        frame.reverse,
+        frame.connectivity,
+        gps.fix_state,
+        round(gps.heading_deg),
+        (round(gps.latitude, 5), round(gps.longitude, 5)),
+    )
+
+
+def _bits(mask: int):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class Subscription:
+    __slots__ = ("fields", "callback", "group")
+
+    def __init__(self, fields: Field, callback: Callable[[TelemetryFrame], object], group: SubscriberGroup | None):
+        self.fields = fields
+        self.callback = callback
+        self.group = group
+
+
+class SubscriberGroup:
+    """Abonnements d'une page : actifs entre `resume` et `suspend` seulement."""
+
+    def __init__(self, state: TelemetryState) -> None:
+        self._state = state
+        self._subscriptions: list[Subscription] = []
+        self._active = False
+        # Version de l'état au moment de la suspension ; 0 : rien n'a encore été livré.
+        self._suspended_at = 0
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def subscribe(self, fields: Field, callback: Callable[[TelemetryFrame], object]) -> Subscription:
+        subscription = Subscription(fields, callback, self)
+        self._subscriptions.append(subscription)
+        if self._active:
+            self._state._attach(subscription)
+            self._state._catch_up([subscription], 0)
+        return subscription
+
+    def resume(self) -> None:
+        if self._active:
+            return
+        self._active = True
+        for subscription in self._subscriptions:
+            self._state._attach(subscription)
+        self._state._catch_up(self._subscriptions, self._suspended_at)
+
+    def suspend(self) -> None:
+        if not self._active:
+            return
+        self._active = False
+        for subscription in self._subscriptions:
+            self._state._detach(subscription)
+        self._suspended_at = self._state.version
+
+
+class TelemetryState:
+    """Dernière trame rendue et abonnés par champ ; utilisé depuis le thread GUI uniquement."""
+
+    def __init__(self) -> None:
+        self._frame: TelemetryFrame | None = None
+        self._values: list = [_UNSET] * _FIELD_COUNT
+        self._changed_at = [0] * _FIELD_COUNT
+        self._version = 0
+        self._subscribers: list[list[Subscription]] = [[] for _ in range(_FIELD_COUNT)]
+        self._stats = DispatchStats()
+
+    @property
+    def frame(self) -> TelemetryFrame | None:
+        return self._frame
+
+    @property
+    def version(self) -> int:
+        """Incrémenté à chaque `update` qui modifie au moins un champ."""
+        return self._version
+
+    def stats(self) -> DispatchStats:
+        return replace(self._stats)
+
+    def subscribe(self, fields: Field, callback: Callable[[TelemetryFrame], object]) -> Subscription:
+        """Abonnement toujours actif (widgets visibles en permanence, comme la barre d'état)."""
+        subscription = Subscription(fields, callback, None)
+        self._attach(subscription)
+        self._catch_up([subscription], 0)
+        return subscription
+
+    def group(self) -> SubscriberGroup:
+        """Nouveau groupe, suspendu jusqu'au premier `resume`."""
+        return SubscriberGroup(self)
+
+    def invalidate(self, fields: Field = ALL_FIELDS) -> None:
+        """Oublie les valeurs connues : le prochain `update` redonne ces champs aux abonnés."""
+        for bit in _bits(fields):
+            self._values[bit] = _UNSET
+
+    def update(self, frame: TelemetryFrame) -> Field:
+        """Enregistre la trame, notifie les abonnés des champs modifiés et retourne leur masque."""
+        self._frame = frame
+        self._stats.updates += 1
+        values = self._values
+        mask = 0
+        for bit, value in enumerate(field_values(frame)):
+            if values[bit] != value:
+                values[bit] = value
+                mask |= 1 << bit
+        if not mask:
+            return Field(0)
+        self._version += 1
+        version = self._version
+        subscribers = self._subscribers
+        notified: dict[Subscription, None] = {}
+        for bit in _bits(mask):
+            self._changed_at[bit] = version
+            self._stats.fields_changed += 1
+            for subscription in subscribers[bit]:
+                notified[subscription] = None
+        self._stats.notifications += len(notified)
+        for subscription in notified:
+            subscription.callback(frame)
+        return Field(mask)
+
+    def _attach(self, subscription: Subscription) -> None:
+        for bit in _bits(subscription.fields):
+            self._subscribers[bit].append(subscription)
+
+    def _detach(self, subscription: Subscription) -> None:
+        for bit in _bits(subscription.fields):
+            self._subscribers[bit].remove(subscription)
+
+    def _catch_up(self, subscriptions: list[Subscription], since: int) -> None:
+        frame = self._frame
+        if frame is None:
+            return
+        changed = 0
+        for bit, changed_at in enumerate(self._changed_at):
+            if changed_at > since:
+                changed |= 1 << bit
+        for subscription in subscriptions:
+            if subscription.fields & changed:
+                self._stats.catch_ups += 1
+                subscription.callback(frame)
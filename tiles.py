@@ -0,0 +1,582 @@
+"""Carte hors ligne : tuiles MBTiles (SQLite), décodage en pool de threads et cache LRU.
+
+Les tuiles sont lues dans un fichier MBTiles local (schéma TMS, y inversé) et
+décodées en `QImage` par un pool de threads ; le thread GUI ne fait que
+consulter le cache borné. `MapView` déplace les pixels déjà peints avec
+`QWidget.scroll` quand le suivi du kart fait glisser la carte, si bien que
+seule la bande découverte est repeinte. Entre deux trames, la position du kart
+est estimée par `motion.MotionEstimator` et la vue avance au rythme de
+l'affichage (`ANIMATION_HZ`) plutôt qu'à celui de la télémétrie.
+
+Un jeu de tuiles de test se génère sans réseau :
+
+    python -m tiles maps/demo.mbtiles
+"""
+
+from __future__ import annotations
+
+import math
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QObject, QPointF, QRect, Qt, QTimer, Signal
+from PySide6.QtGui import QColor, QImage, QPainter, QPen, QPolygonF
+from PySide6.QtWidgets import QWidget
+
+from models import GpsData, TileStats
+from motion import MotionEstimator
+
+TILE_SIZE = 256
+DEFAULT_TILESET = Path(__file__).resolve().parent / "maps" / "demo.mbtiles"
+PREFETCH_HORIZON_S = 8.0
+ANIMATION_HZ = 60
+
+_MAX_LATITUDE = 85.05112878
+_EQUATOR_M_PER_PX = 40075016.686 / TILE_SIZE
+
+TileKey = tuple[int, int, int]
+
+_STALE = object()
+
+
+def world_pixel(latitude: float, longitude: float, zoom: int) -> tuple[float, float]:
+    """Position en pixels « monde » (Web Mercator) au niveau `zoom`."""
+    scale = TILE_SIZE * (1 << zoom)
+    lat = math.radians(max(-_MAX_LATITUDE, min(_MAX_LATITUDE, latitude)))
+    x = (longitude + 180.0) / 360.0 * scale
+    y = (1.0 - math.log(math.tan(lat) + 1.0 / math.cos(lat)) / math.pi) / 2.0 * scale
+    return x, y
+
+
+def meters_per_pixel(latitude: float, zoom: int) -> float:
+    return _EQUATOR_M_PER_PX * math.cos(math.radians(latitude)) / (1 << zoom)
+
+
+def tiles_in_rect(zoom: int, left: float, top: float, right: float, bottom: float) -> list[TileKey]:
+    """Tuiles couvrant le rectangle en pixels monde ; x boucle autour du globe, y est borné."""
+    count = 1 << zoom
+    x0, x1 = math.floor(left / TILE_SIZE), math.floor((right - 1) / TILE_SIZE)
+    y0, y1 = max(0, math.floor(top / TILE_SIZE)), min(count - 1, math.floor((bottom - 1) / TILE_SIZE))
+    return [(zoom, x % count, y) for y in range(y0, y1 + 1) for x in range(x0, x1 + 1)]
+
+
+class MBTilesReader:
+    """Lecture seule d'un fichier MBTiles ; une connexion SQLite par thread lecteur."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = Path(path)
+        if not self._path.exists():
+            raise FileNotFoundError(self._path)
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                f"file:{self._path}?mode=ro&immutable=1", uri=True, check_same_thread=False
+            )
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def read(self, zoom: int, x: int, y: int) -> bytes | None:
+        row = self._connection().execute(
+            "SELECT tile_data FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?",
+            (zoom, x, (1 << zoom) - 1 - y),
+        ).fetchone()
+        return bytes(row[0]) if row is not None else None
+
+    def metadata(self) -> dict[str, str]:
+        return dict(self._connection().execute("SELECT name, value FROM metadata").fetchall())
+
+    def close(self) -> None:
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+class TileCache:
+    """LRU borné de `QImage` décodées ; `None` mémorise une tuile absente du fichier."""
+
+    def __init__(self, capacity: int = 128) -> None:
+        self._capacity = max(1, capacity)
+        self._images: OrderedDict[TileKey, QImage | None] = OrderedDict()
+        self._stats = TileStats()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def __contains__(self, key: TileKey) -> bool:
+        return key in self._images
+
+    def get(self, key: TileKey) -> QImage | None:
+        """Retourne l'image et la marque comme récente (None si absente ou inconnue)."""
+        if key not in self._images:
+            self._stats.misses += 1
+            return None
+        self._stats.hits += 1
+        self._images.move_to_end(key)
+        return self._images[key]
+
+    def peek(self, key: TileKey) -> QImage | None:
+        return self._images.get(key)
+
+    def put(self, key: TileKey, image: QImage | None) -> None:
+        self._images[key] = image
+        self._images.move_to_end(key)
+        while len(self._images) > self._capacity:
+            self._images.popitem(last=False)
+            self._stats.evicted += 1
+
+    def retain(self, keys: Iterable[TileKey]) -> None:
+        keep = set(keys)
+        for key in [key for key in self._images if key not in keep]:
+            del self._images[key]
+
+    def clear(self) -> None:
+        self._images.clear()
+
+    def stats(self) -> TileStats:
+        stats = replace(self._stats)
+        stats.cached = len(self._images)
+        return stats
+
+
+class TileLoader(QObject):
+    """Lit et décode les tuiles en arrière-plan ; `tile_ready` est émis dans le thread GUI."""
+
+    tile_ready = Signal(object)
+    _decoded = Signal(object, object)
+
+    def __init__(self, reader: MBTilesReader, cache_capacity: int = 128, workers: int = 2, parent=None) -> None:
+        super().__init__(parent)
+        self._reader = reader
+        self._cache = TileCache(cache_capacity)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tiles")
+        self._inflight: set[TileKey] = set()
+        self._stats = TileStats()
+        # Remplacé d'un bloc (jamais modifié en place) : lu sans verrou par les workers.
+        self._wanted: frozenset[TileKey] = frozenset()
+        self._decoded.connect(self._on_decoded, Qt.QueuedConnection)
+
+    @property
+    def cache(self) -> TileCache:
+        return self._cache
+
+    def stats(self) -> TileStats:
+        stats = self._cache.stats()
+        stats.decoded = self._stats.decoded
+        stats.missing = self._stats.missing
+        stats.prefetched = self._stats.prefetched
+        stats.stale_skipped = self._stats.stale_skipped
+        return stats
+
+    def tile(self, key: TileKey) -> QImage | None:
+        return self._cache.peek(key)
+
+    def request(self, visible: list[TileKey], prefetch: list[TileKey] = ()) -> None:
+        """Demande les tuiles visibles puis celles à précharger ; les anciennes demandes non servies sont abandonnées."""
+        self._wanted = frozenset(visible) | frozenset(prefetch)
+        for key in visible:
+            if self._cache.get(key) is None and key not in self._cache:
+                self._submit(key)
+        for key in prefetch:
+            if key not in self._cache and key not in self._inflight:
+                self._stats.prefetched += 1
+                self._submit(key)
+
+    def release(self, keep: Iterable[TileKey] = ()) -> None:
+        """Abandonne les demandes en attente et ne garde en mémoire que `keep`."""
+        self._wanted = frozenset()
+        self._cache.retain(keep)
+
+    def close(self) -> None:
+        self._wanted = frozenset()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._reader.close()
+
+    def _submit(self, key: TileKey) -> None:
+        if key in self._inflight:
+            return
+        self._inflight.add(key)
+        self._executor.submit(self._load, key)
+
+    def _load(self, key: TileKey) -> None:
+        if key not in self._wanted:
+            self._decoded.emit(key, _STALE)
+            return
+        image = None
+        try:
+            data = self._reader.read(*key)
+        except sqlite3.Error:
+            data = None
+        if data is not None:
+            decoded = QImage.fromData(data)
+            if not decoded.isNull():
+                image = decoded.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        self._decoded.emit(key, image)
+
+    def _on_decoded(self, key: TileKey, image) -> None:
+        self._inflight.discard(key)
+        if image is _STALE:
+            self._stats.stale_skipped += 1
+            return
+        if image is None:
+            self._stats.missing += 1
+        else:
+            self._stats.decoded += 1
+        self._cache.put(key, image)
+        self.tile_ready.emit(key)
+
+
+class MapView(QWidget):
+    """Vue carte tuilée centrée sur le kart, avec préchargement devant lui."""
+
+    MARKER_RADIUS = 14
+
+    def __init__(self, loader: TileLoader | None, zoom: int, parent=None) -> None:
+        super().__init__(parent)
+        self.setObjectName("MapView")
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setMinimumHeight(160)
+        self._loader = loader
+        self._zoom = zoom
+        self._center: tuple[float, float] | None = None
+        self._kart: tuple[float, float] | None = None
+        self._gps: GpsData | None = None
+        self._speed_kmh = 0.0
+        self._heading = 0.0
+        self._follow = True
+        self._motion = MotionEstimator()
+        self._animation = QTimer(self)
+        self._animation.setTimerType(Qt.PreciseTimer)
+        self._animation.setInterval(round(1000 / ANIMATION_HZ))
+        self._animation.timeout.connect(self._advance)
+        self._active = True
+        self._requested: tuple | None = None
+        self._background = QColor("#1b2533")
+        self._grid = QColor("#243246")
+        self._marker = QColor("#ff5a36")
+        if loader is not None:
+            loader.tile_ready.connect(self._on_tile_ready)
+
+    @property
+    def zoom(self) -> int:
+        return self._zoom
+
+    def set_zoom(self, zoom: int) -> None:
+        if zoom == self._zoom:
+            return
+        self._zoom = zoom
+        if self._gps is not None:
+            self._kart = world_pixel(*self._estimated_position(time.monotonic_ns()), zoom)
+        self._center = self._kart
+        self._requested = None
+        self._request_tiles()
+        self.update()
+
+    def set_active(self, active: bool) -> None:
+        self._active = active
+        if not active:
+            self._animation.stop()
+        if self._loader is None:
+            return
+        if active:
+            self._requested = None
+            self._request_tiles()
+        else:
+            self._loader.release(self.visible_tiles())
+
+    def set_kart(self, gps: GpsData, speed_kmh: float, follow: bool, at_ns: int | None = None) -> None:
+        """Nouvelle mesure (`at_ns` : `time.monotonic_ns` de la trame) ; la vue suit ensuite l'estimation."""
+        now_ns = time.monotonic_ns()
+        self._gps = gps
+        self._speed_kmh = speed_kmh
+        self._follow = follow
+        self._motion.update(gps, speed_kmh, now_ns if at_ns is None else at_ns)
+        self._move_kart(now_ns)
+        if self._active and self._motion.has_fix and not self._animation.isActive():
+            self._animation.start()
+
+    def _advance(self) -> None:
+        """Tick d'animation : avance le kart sur sa trajectoire estimée, même sans nouvelle trame."""
+        now_ns = time.monotonic_ns()
+        if not self.isVisible() or not self._motion.is_moving(now_ns):
+            self._animation.stop()
+            return
+        self._move_kart(now_ns)
+
+    def _estimated_position(self, at_ns: int) -> tuple[float, float]:
+        position = self._motion.position_at(at_ns)
+        return position if position is not None else (self._gps.latitude, self._gps.longitude)
+
+    def _move_kart(self, at_ns: int) -> None:
+        heading = self._motion.heading_deg()
+        kart = world_pixel(*self._estimated_position(at_ns), self._zoom)
+        previous_marker = self._marker_rect()
+        moved = self._kart is None or self._marker_rect(kart) != previous_marker or round(heading) != round(self._heading)
+        self._heading = heading
+        self._kart = kart
+        if self._follow or self._center is None:
+            # Le défilement emporte l'ancien marqueur : sa copie décalée est à repeindre.
+            dx, dy = self._pan_to(kart)
+            if dx or dy:
+                self.update(previous_marker.translated(dx, dy))
+        elif moved:
+            self.update(previous_marker)
+        if moved:
+            self.update(self._marker_rect())
+        self._request_tiles()
+
+    def recenter(self) -> None:
+        if self._kart is not None:
+            self._pan_to(self._kart)
+            self._request_tiles()
+
+    def visible_tiles(self) -> list[TileKey]:
+        if self._center is None:
+            return []
+        left, top = self._origin()
+        return tiles_in_rect(self._zoom, left, top, left + self.width(), top + self.height())
+
+    def _origin(self, center: tuple[float, float] | None = None) -> tuple[int, int]:
+        cx, cy = center if center is not None else self._center
+        return round(cx - self.width() / 2), round(cy - self.height() / 2)
+
+    def _pan_to(self, center: tuple[float, float]) -> tuple[int, int]:
+        """Recentre la vue ; retourne le décalage appliqué aux pixels déjà peints."""
+        if self._center is None:
+            self._center = center
+            self.update()
+            return 0, 0
+        old_x, old_y = self._origin()
+        new_x, new_y = self._origin(center)
+        self._center = center
+        dx, dy = old_x - new_x, old_y - new_y
+        if dx == 0 and dy == 0:
+            return 0, 0
+        if abs(dx) < self.width() and abs(dy) < self.height() and self.isVisible():
+            # Les pixels déjà peints glissent ; Qt ne repeint que la bande découverte.
+            self.scroll(dx, dy)
+            return dx, dy
+        self.update()
+        return 0, 0
+
+    def _marker_rect(self, kart: tuple[float, float] | None = None) -> QRect:
+        kart = kart if kart is not None else self._kart
+        if kart is None or self._center is None:
+            return QRect()
+        left, top = self._origin()
+        r = self.MARKER_RADIUS + 2
+        x, y = round(kart[0] - left), round(kart[1] - top)
+        return QRect(x - r, y - r, 2 * r, 2 * r)
+
+    def _request_tiles(self) -> None:
+        if self._loader is None or not self._active or self._center is None:
+            return
+        left, top = self._origin()
+        key = (self._zoom, left // TILE_SIZE, top // TILE_SIZE, self.width(), self.height(), self._prefetch_origin())
+        if key == self._requested:
+            return
+        self._requested = key
+        visible = self.visible_tiles()
+        ahead_x, ahead_y = key[5]
+        ahead = tiles_in_rect(self._zoom, ahead_x, ahead_y, ahead_x + self.width(), ahead_y + self.height())
+        seen = set(visible)
+        self._loader.request(visible, [tile for tile in ahead if tile not in seen])
+
+    def _prefetch_origin(self) -> tuple[int, int]:
+        """Coin haut-gauche (en tuiles entières) de la fenêtre projetée à `PREFETCH_HORIZON_S` devant le kart."""
+        if self._gps is None:
+            left, top = self._origin()
+        else:
+            distance_px = self._speed_kmh / 3.6 * PREFETCH_HORIZON_S
+            distance_px /= meters_per_pixel(self._gps.latitude, self._zoom)
+            heading = math.radians(self._heading)
+            left, top = self._origin(
+                (self._center[0] + math.sin(heading) * distance_px, self._center[1] - math.cos(heading) * distance_px)
+            )
+        return left // TILE_SIZE * TILE_SIZE, top // TILE_SIZE * TILE_SIZE
+
+    def _on_tile_ready(self, key: TileKey) -> None:
+        if self._center is None or key[0] != self._zoom:
+            return
+        left, top = self._origin()
+        count = 1 << self._zoom
+        for tile_x in (key[1], key[1] - count, key[1] + count):
+            rect = QRect(tile_x * TILE_SIZE - left, key[2] * TILE_SIZE - top, TILE_SIZE, TILE_SIZE)
+            if rect.intersects(self.rect()):
+                self.update(rect)
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._requested = None
+        self._request_tiles()
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        dirty = event.rect()
+        painter.fillRect(dirty, self._background)
+        if self._center is None:
+            return
+        left, top = self._origin()
+        count = 1 << self._zoom
+        painter.setPen(QPen(self._grid, 1))
+        # Seules les tuiles qui touchent la zone sale sont dessinées.
+        y0 = max(0, (top + dirty.top()) // TILE_SIZE)
+        y1 = min(count - 1, (top + dirty.bottom()) // TILE_SIZE)
+        for tile_y in range(y0, y1 + 1):
+            for tile_x in range((left + dirty.left()) // TILE_SIZE, (left + dirty.right()) // TILE_SIZE + 1):
+                target = QRect(tile_x * TILE_SIZE - left, tile_y * TILE_SIZE - top, TILE_SIZE, TILE_SIZE)
+                image = self._loader.tile((self._zoom, tile_x % count, tile_y)) if self._loader is not None else None
+                if image is not None:
+                    painter.drawImage(target.topLeft(), image)
+                else:
+                    painter.drawRect(target.adjusted(0, 0, -1, -1))
+        if self._kart is not None:
+            self._paint_marker(painter, self._kart[0] - left, self._kart[1] - top)
+
+    def _paint_marker(self, painter: QPainter, x: float, y: float) -> None:
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(x, y)
+        painter.rotate(self._heading)
+        r = self.MARKER_RADIUS
+        painter.setPen(QPen(QColor("#ffffff"), 2))
+        painter.setBrush(self._marker)
+        painter.drawPolygon(QPolygonF([QPointF(0, -r), QPointF(r * 0.7, r * 0.8), QPointF(0, r * 0.4), QPointF(-r * 0.7, r * 0.8)]))
+
+
+def _render_test_tile(zoom: int, x: int, y: int) -> QImage:
+    """Tuile synthétique : îlots, rues et avenues alignés sur la grille monde, donc continus d'une tuile à l'autre."""
+    image = QImage(TILE_SIZE, TILE_SIZE, QImage.Format_RGB32)
+    image.fill(QColor("#dfe6d8"))
+    painter = QPainter(image)
+    origin_x, origin_y = x * TILE_SIZE, y * TILE_SIZE
+    spacing = max(32, 4096 >> max(0, zoom - 10))
+    spacing = min(spacing, 512)
+    painter.setPen(QPen(QColor("#ffffff"), max(2, zoom - 10)))
+    for world in range(origin_x - origin_x % spacing, origin_x + TILE_SIZE + 1, spacing):
+        painter.drawLine(world - origin_x, 0, world - origin_x, TILE_SIZE)
+    for world in range(origin_y - origin_y % spacing, origin_y + TILE_SIZE + 1, spacing):
+        painter.drawLine(0, world - origin_y, TILE_SIZE, world - origin_y)
+    avenue = spacing * 4
+    painter.setPen(QPen(QColor("#f2c14e"), max(3, zoom - 8)))
+    start = (origin_x + origin_y) - (origin_x + origin_y) % avenue
+    for diagonal in range(start, origin_x + origin_y + 2 * TILE_SIZE + 1, avenue):
+        offset = diagonal - origin_x - origin_y
+        painter.drawLine(offset, 0, offset - TILE_SIZE, TILE_SIZE)
+    painter.setPen(QPen(QColor("#b8c4b0"), 1))
+    painter.drawRect(0, 0, TILE_SIZE - 1, TILE_SIZE - 1)
+    painter.end()
+    return image
+
+
+def _encode_png(image: QImage) -> bytes:
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, "PNG")
+    buffer.close()
+    return bytes(data)
+
+
+def generate_test_tileset(
+    path: Path,
+    latitude: float = 37.7749,
+    longitude: float = -122.4194,
+    zooms: Iterable[int] = range(10, 18),
+    radius: int = 3,
+) -> int:
+    """Écrit un MBTiles de tuiles synthétiques autour d'un point ; retourne le nombre de tuiles."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    connection = sqlite3.connect(tmp)
+    count = 0
+    try:
+        connection.executescript(
+            """
+            CREATE TABLE metadata (name TEXT, value TEXT);
+            CREATE TABLE tiles (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB);
+            CREATE UNIQUE INDEX tile_index ON tiles (zoom_level, tile_column, tile_row);
+            """
+        )
+        zooms = list(zooms)
+        connection.executemany(
+            "INSERT INTO metadata VALUES (?, ?)",
+            [
+                ("name", "InterfaceKart test tiles"),
+                ("format", "png"),
+                ("minzoom", str(min(zooms))),
+                ("maxzoom", str(max(zooms))),
+                ("center", f"{longitude},{latitude},{zooms[len(zooms) // 2]}"),
+            ],
+        )
+        for zoom in zooms:
+            cx, cy = world_pixel(latitude, longitude, zoom)
+            tile_x, tile_y = int(cx // TILE_SIZE), int(cy // TILE_SIZE)
+            rows = []
+            for key in tiles_in_rect(
+                zoom,
+                (tile_x - radius) * TILE_SIZE,
+                (tile_y - radius) * TILE_SIZE,
+                (tile_x + radius + 1) * TILE_SIZE,
+                (tile_y + radius + 1) * TILE_SIZE,
+            ):
+                _, x, y = key
+                rows.append((zoom, x, (1 << zoom) - 1 - y, _encode_png(_render_test_tile(*key))))
+            connection.executemany("INSERT OR REPLACE INTO tiles VALUES (?, ?, ?, ?)", rows)
+            count += len(rows)
+        connection.commit()
+    finally:
+        connection.close()
+    tmp.replace(path)
+    return count
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    from PySide6.QtGui import QGuiApplication
+
+    parser = argparse.ArgumentParser(description="Génère un jeu de tuiles MBTiles de test (hors ligne).")
+    parser.add_argument("path", type=Path, nargs="?", default=DEFAULT_TILESET)
+    parser.add_argument("--lat", type=float, default=37.7749)
+    parser.add_argument("--lon", type=float, default=-122.4194)
+    parser.add_argument("--radius", type=int, default=3, help="rayon en tuiles autour du centre")
+    parser.add_argument("--min-zoom", type=int, default=10)
+    parser.add_argument("--max-zoom", type=int, default=17)
+    args = parser.parse_args(argv)
+
+    app = QGuiApplication.instance() or QGuiApplication(sys.argv[:1])
+    count = generate_test_tileset(
+        args.path, args.lat, args.lon, range(args.min_zoom, args.max_zoom + 1), args.radius
+    )
+    print(f"{count} tiles written to {args.path}")
+    del app
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
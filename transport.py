@@ -0,0 +1,304 @@
+"""Services de télémétrie asyncio (UDP, TCP et liaison série) exécutés dans leur propre thread.
+
+La boucle asyncio tourne dans le thread producteur de `ThreadedTelemetryService` ;
+les trames décodées passent par la boîte aux lettres bornée, dont la politique
+de débordement (`DROP_OLDEST` ou `COALESCE`) s'applique quand l'UI prend du retard.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+
+from models import ConnectivityState, OverflowPolicy, TelemetryFrame, TransportStats
+from protocol import FrameDecoder, decode_frames
+from services import ThreadedTelemetryService
+
+_LOG = logging.getLogger(__name__)
+
+_POLL_INTERVAL_S = 0.05
+_RATE_WINDOW_S = 1.0
+RECONNECT_DELAY_S = 1.0
+
+
+class AsyncioTelemetryService(ThreadedTelemetryService):
+    def __init__(
+        self,
+        queue_capacity: int = 8,
+        overflow_policy: OverflowPolicy = OverflowPolicy.COALESCE,
+    ) -> None:
+        super().__init__(queue_capacity, overflow_policy)
+        self._decoder = FrameDecoder()
+        self._rx_bytes = 0
+        self._rx_reads = 0
+        self._rate_hz = 0.0
+        self._ready = threading.Event()
+
+    def wait_ready(self, timeout: float | None = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def transport_stats(self) -> TransportStats:
+        decoder_stats = self._decoder.stats
+        mailbox_stats = self._mailbox.stats()
+        return TransportStats(
+            rx_bytes=self._rx_bytes,
+            rx_reads=self._rx_reads,
+            frames=decoder_stats.frames,
+            receive_rate_hz=self._rate_hz,
+            queue_depth=self._mailbox.depth(),
+            dropped=mailbox_stats.dropped,
+            coalesced=mailbox_stats.coalesced,
+            crc_errors=decoder_stats.crc_errors,
+            resyncs=decoder_stats.resyncs,
+        )
+
+    def produce(self) -> None:
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self._run())
+        finally:
+            loop.close()
+            self._ready.clear()
+
+    async def _run(self) -> None:
+        if not await self._open_until_stopped():
+            return
+        self._ready.set()
+        window_start = time.monotonic()
+        window_frames = self._decoder.stats.frames
+        try:
+            while not self._stop_requested.is_set():
+                await asyncio.sleep(_POLL_INTERVAL_S)
+                now = time.monotonic()
+                if now - window_start >= _RATE_WINDOW_S:
+                    frames = self._decoder.stats.frames
+                    self._rate_hz = (frames - window_frames) / (now - window_start)
+                    window_start, window_frames = now, frames
+        finally:
+            await self._close()
+
+    async def _open_until_stopped(self) -> bool:
+        """Ouvre la source ; en cas d'échec, publie DISCONNECTED et réessaie toutes les `RECONNECT_DELAY_S`.
+
+        Retourne faux si l'arrêt est demandé avant que l'ouverture réussisse.
+        """
+        failures = 0
+        while not self._stop_requested.is_set():
+            try:
+                await self._open()
+            except OSError:
+                if failures == 0:
+                    _LOG.exception(
+                        "%s: cannot open source, retrying every %.1f s", type(self).__name__, RECONNECT_DELAY_S
+                    )
+                    self.publish(TelemetryFrame(connectivity=ConnectivityState.DISCONNECTED))
+                else:
+                    _LOG.debug("%s: source still unavailable", type(self).__name__, exc_info=True)
+                failures += 1
+                await self._close()
+                deadline = time.monotonic() + RECONNECT_DELAY_S
+                while time.monotonic() < deadline and not self._stop_requested.is_set():
+                    await asyncio.sleep(_POLL_INTERVAL_S)
+            else:
+                if failures:
+                    _LOG.info("%s: source opened after %d failed attempts", type(self).__name__, failures)
+                return True
+        return False
+
+    async def _open(self) -> None:
+        """Ouvre la source ; lève `OSError` si elle est indisponible."""
+        raise NotImplementedError
+
+    async def _close(self) -> None:
+        """Libère la source ; appelée aussi après un `_open` en échec."""
+        raise NotImplementedError
+
+    def _ingest_datagram(self, data: bytes) -> None:
+        self._rx_bytes += len(data)
+        self._rx_reads += 1
+        frames, _ = decode_frames(data, self._decoder.stats)
+        for frame in frames:
+            self.publish(frame)
+
+    def _ingest_stream(self, data: memoryview) -> None:
+        self._rx_bytes += len(data)
+        self._rx_reads += 1
+        for frame in self._decoder.feed(data):
+            self.publish(frame)
+
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, service: UdpTelemetryService) -> None:
+        self._service = service
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        self._service._ingest_datagram(data)
+
+
+class UdpTelemetryService(AsyncioTelemetryService):
+    """Reçoit des datagrammes contenant une ou plusieurs trames complètes."""
+
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 5005,
+        queue_capacity: int = 8,
+        overflow_policy: OverflowPolicy = OverflowPolicy.COALESCE,
+    ) -> None:
+        super().__init__(queue_capacity, overflow_policy)
+        self._host = host
+        self._port = port
+        self._transport: asyncio.DatagramTransport | None = None
+
+    @property
+    def bound_port(self) -> int:
+        return self._port
+
+    async def _open(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: _DatagramProtocol(self), local_addr=(self._host, self._port)
+        )
+        self._port = self._transport.get_extra_info("sockname")[1]
+
+    async def _close(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+
+class _StreamProtocol(asyncio.Protocol):
+    def __init__(self, service: TcpTelemetryService) -> None:
+        self._service = service
+        self.closed = asyncio.get_running_loop().create_future()
+
+    def data_received(self, data: bytes) -> None:
+        with memoryview(data) as view:
+            self._service._ingest_stream(view)
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        if not self.closed.done():
+            self.closed.set_result(None)
+
+
+class TcpTelemetryService(AsyncioTelemetryService):
+    """Abonné d'un `fanout.FanoutServer` : lit le flux de trames relayé par le kart.
+
+    Kart injoignable au lancement ou connexion perdue : nouvel essai toutes les
+    `RECONNECT_DELAY_S` secondes, jusqu'à l'arrêt du service.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        queue_capacity: int = 8,
+        overflow_policy: OverflowPolicy = OverflowPolicy.COALESCE,
+    ) -> None:
+        super().__init__(queue_capacity, overflow_policy)
+        self._host = host
+        self._port = port
+        self._subscription: asyncio.Task | None = None
+
+    async def _open(self) -> None:
+        self._subscription = asyncio.get_running_loop().create_task(self._subscribe())
+
+    async def _close(self) -> None:
+        if self._subscription is not None:
+            self._subscription.cancel()
+            await asyncio.gather(self._subscription, return_exceptions=True)
+            self._subscription = None
+
+    async def _subscribe(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                transport, protocol = await loop.create_connection(
+                    lambda: _StreamProtocol(self), self._host, self._port
+                )
+            except OSError as exc:
+                _LOG.debug("relay unreachable at %s:%d: %s", self._host, self._port, exc)
+            else:
+                # Trame partielle de la connexion précédente : sans suite dans le nouveau flux.
+                self._decoder.clear()
+                try:
+                    await protocol.closed
+                finally:
+                    transport.close()
+            await asyncio.sleep(RECONNECT_DELAY_S)
+
+
+class SerialTelemetryService(AsyncioTelemetryService):
+    """Lit un flux d'octets (port série, pty) et réassemble les trames."""
+
+    def __init__(
+        self,
+        path: str,
+        baudrate: int | None = None,
+        queue_capacity: int = 8,
+        overflow_policy: OverflowPolicy = OverflowPolicy.COALESCE,
+    ) -> None:
+        super().__init__(queue_capacity, overflow_policy)
+        if baudrate is not None and not is_supported_baudrate(baudrate):
+            raise ValueError(f"unsupported baud rate: {baudrate}")
+        self._path = path
+        self._baudrate = baudrate
+        self._fd: int | None = None
+        self._rx_buffer = bytearray(16 * 1024)
+
+    async def _open(self) -> None:
+        fd = os.open(self._path, os.O_RDONLY | os.O_NOCTTY | os.O_NONBLOCK)
+        try:
+            if os.isatty(fd):
+                _configure_tty(fd, self._baudrate)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+        asyncio.get_running_loop().add_reader(fd, self._on_readable)
+
+    async def _close(self) -> None:
+        if self._fd is not None:
+            asyncio.get_running_loop().remove_reader(self._fd)
+            os.close(self._fd)
+            self._fd = None
+
+    def _on_readable(self) -> None:
+        try:
+            count = os.readv(self._fd, [self._rx_buffer])
+        except BlockingIOError:
+            return
+        except OSError:
+            count = 0
+        if count == 0:
+            # Extrémité fermée (EOF ou EIO sur un pty) : on arrête d'écouter.
+            asyncio.get_running_loop().remove_reader(self._fd)
+            return
+        with memoryview(self._rx_buffer) as view:
+            self._ingest_stream(view[:count])
+
+
+def is_supported_baudrate(baudrate: int) -> bool:
+    """Vrai si `termios` connaît la constante `B<baudrate>` (9600, 115200...)."""
+    import termios
+
+    return isinstance(getattr(termios, f"B{baudrate}", None), int)
+
+
+def _configure_tty(fd: int, baudrate: int | None) -> None:
+    import termios
+    import tty
+
+    try:
+        tty.setraw(fd)
+        if baudrate is not None:
+            speed = getattr(termios, f"B{baudrate}")
+            attrs = termios.tcgetattr(fd)
+            attrs[4] = attrs[5] = speed
+            termios.tcsetattr(fd, termios.TCSANOW, attrs)
+    except termios.error as exc:
+        # `termios.error` ne dérive pas d'`OSError` : même traitement qu'un port absent.
+        raise OSError(*exc.args) from exc
@@ -0,0 +1,189 @@
+"""Statistiques de trajet : distance, vitesses max/moyenne, énergie et temps en marche arrière.
+
+`TripComputer.update` est appelé pour chaque trame de `telemetry_updated` et
+ne fait qu'un nombre fixe d'opérations (O(1)). `compute_trip` refait le même
+calcul en une passe NumPy sur les colonnes d'une session enregistrée ; les
+deux chemins suivent les mêmes conventions :
+
+- le temps vient de `frame.timestamp` ; un intervalle de plus de
+  `MAX_GAP_S` (liaison perdue) ne compte ni dans la durée, ni dans la
+  moyenne, ni dans le temps en marche arrière ;
+- vitesse moyenne et marche arrière sont intégrées avec l'état de la trame
+  précédente (somme de Riemann à gauche) ;
+- la distance n'est cumulée qu'entre deux positions avec fix GPS ;
+- l'énergie est la somme des baisses de `battery_percent`, rapportée à
+  `battery_capacity_wh` (les remontées, recharge ou régénération, sont ignorées).
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from models import GpsFixState, TelemetryFrame, TripStats
+
+EARTH_RADIUS_M = 6_371_008.8
+BATTERY_CAPACITY_WH = 2000.0
+MAX_GAP_S = 5.0
+_EPOCH = datetime(1970, 1, 1)
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(min(1.0, a)))
+
+
+class TripComputer:
+    """Cumuls du trajet en cours, mis à jour trame par trame."""
+
+    def __init__(self, battery_capacity_wh: float = BATTERY_CAPACITY_WH, max_gap_s: float = MAX_GAP_S) -> None:
+        self._wh_per_percent = battery_capacity_wh / 100
+        self._max_gap_s = max_gap_s
+        self.reset()
+
+    def reset(self) -> None:
+        self._frames = 0
+        self._distance_m = 0.0
+        self._max_speed = 0.0
+        self._speed_integral = 0.0
+        self._energy_wh = 0.0
+        self._reverse_s = 0.0
+        self._elapsed_s = 0.0
+        self._last_t = 0.0
+        self._last_speed = 0.0
+        self._last_reverse = False
+        self._last_battery = 0
+        self._last_fix: tuple[float, float] | None = None
+
+    def update(self, frame: TelemetryFrame) -> None:
+        t = (frame.timestamp - _EPOCH).total_seconds()
+        speed = frame.speed_kmh
+        gps = frame.gps
+        fix = (gps.latitude, gps.longitude) if gps.fix_state is not GpsFixState.NO_FIX else None
+        if self._frames:
+            dt = t - self._last_t
+            if 0.0 < dt <= self._max_gap_s:
+                self._elapsed_s += dt
+                self._speed_integral += self._last_speed * dt
+                if self._last_reverse:
+                    self._reverse_s += dt
+            drop = self._last_battery - frame.battery_percent
+            if drop > 0:
+                self._energy_wh += drop * self._wh_per_percent
+            if fix is not None and self._last_fix is not None:
+                self._distance_m += haversine_m(*self._last_fix, *fix)
+        if speed > self._max_speed:
+            self._max_speed = speed
+        self._frames += 1
+        self._last_t = t
+        self._last_speed = speed
+        self._last_reverse = frame.reverse
+        self._last_battery = frame.battery_percent
+        self._last_fix = fix
+
+    def stats(self) -> TripStats:
+        elapsed = self._elapsed_s
+        return TripStats(
+            distance_m=self._distance_m,
+            max_speed_kmh=self._max_speed,
+            avg_speed_kmh=self._speed_integral / elapsed if elapsed > 0 else 0.0,
+            energy_wh=self._energy_wh,
+            reverse_s=self._reverse_s,
+            elapsed_s=elapsed,
+            frames=self._frames,
+        )
+
+
+def frame_columns(frames: list[TelemetryFrame]) -> dict[str, np.ndarray]:
+    """Colonnes NumPy utiles au calcul de trajet, à partir d'une liste de trames."""
+    count = len(frames)
+    return {
+        "t": np.fromiter(((f.timestamp - _EPOCH).total_seconds() for f in frames), np.float64, count),
+        "speed_kmh": np.fromiter((f.speed_kmh for f in frames), np.float64, count),
+        "battery_percent": np.fromiter((f.battery_percent for f in frames), np.float64, count),
+        "latitude": np.fromiter((f.gps.latitude for f in frames), np.float64, count),
+        "longitude": np.fromiter((f.gps.longitude for f in frames), np.float64, count),
+        "has_fix": np.fromiter((f.gps.fix_state is not GpsFixState.NO_FIX for f in frames), np.bool_, count),
+        "reverse": np.fromiter((f.reverse for f in frames), np.bool_, count),
+    }
+
+
+def compute_trip(
+    columns: dict[str, np.ndarray],
+    battery_capacity_wh: float = BATTERY_CAPACITY_WH,
+    max_gap_s: float = MAX_GAP_S,
+) -> TripStats:
+    """Même résultat que `TripComputer`, en une passe vectorisée.
+
+    `has_fix` est facultatif (colonnes de `TelemetryHistory`) : toutes les
+    positions sont alors considérées comme valides.
+    """
+    t = np.asarray(columns["t"], dtype=np.float64)
+    count = t.size
+    if count == 0:
+        return TripStats()
+    speed = np.asarray(columns["speed_kmh"], dtype=np.float64)
+    stats = TripStats(max_speed_kmh=max(0.0, float(speed.max())), frames=count)
+    if count < 2:
+        return stats
+
+    dt = np.diff(t)
+    valid = (dt > 0) & (dt <= max_gap_s)
+    dt = np.where(valid, dt, 0.0)
+    stats.elapsed_s = float(dt.sum())
+    if stats.elapsed_s > 0:
+        stats.avg_speed_kmh = float(np.dot(speed[:-1], dt)) / stats.elapsed_s
+    stats.reverse_s = float(dt[np.asarray(columns["reverse"], dtype=np.bool_)[:-1]].sum())
+
+    drops = -np.diff(np.asarray(columns["battery_percent"], dtype=np.float64))
+    stats.energy_wh = float(drops[drops > 0].sum()) * battery_capacity_wh / 100
+
+    lat = np.radians(np.asarray(columns["latitude"], dtype=np.float64))
+    lon = np.radians(np.asarray(columns["longitude"], dtype=np.float64))
+    a = np.sin(np.diff(lat) / 2) ** 2 + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(np.diff(lon) / 2) ** 2
+    segments = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+    has_fix = columns.get("has_fix")
+    if has_fix is not None:
+        has_fix = np.asarray(has_fix, dtype=np.bool_)
+        segments = segments[has_fix[:-1] & has_fix[1:]]
+    stats.distance_m = float(segments.sum())
+    return stats
+
+
+def compute_session(path: Path, battery_capacity_wh: float = BATTERY_CAPACITY_WH) -> TripStats:
+    """Recalcule les statistiques d'un journal enregistré par `SessionRecorder`."""
+    from recorder import read_session
+
+    return compute_trip(frame_columns(read_session(path)), battery_capacity_wh)
+
+
+def format_duration(seconds: float) -> str:
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes}:{secs:02d}"
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Statistiques de trajet d'une session enregistrée")
+    parser.add_argument("session", type=Path)
+    parser.add_argument("--battery-wh", type=float, default=BATTERY_CAPACITY_WH)
+    args = parser.parse_args(argv)
+    stats = compute_session(args.session, args.battery_wh)
+    print(
+        f"{stats.frames} frames, {format_duration(stats.elapsed_s)}, {stats.distance_m / 1000:.2f} km, "
+        f"avg {stats.avg_speed_kmh:.1f} km/h, max {stats.max_speed_kmh:.1f} km/h, "
+        f"{stats.energy_wh:.0f} Wh, reverse {format_duration(stats.reverse_s)}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
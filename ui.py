@@ -2,26 +2,150 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-
-from PySide6.QtCore import Qt, QTimer, Signal
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPointF, Qt, QTimer, Signal
+from PySide6.QtGui import QColor, QPainter, QPalette, QPen, QPolygonF
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QCheckBox,
     QFrame,
     QGridLayout,
     QGroupBox,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QMainWindow,
     QPushButton,
     QSlider,
     QStackedWidget,
+    QStyledItemDelegate,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
-from models import AppSettings, ConnectivityState, PageId, TelemetryFrame, ThemeMode
-from services import AlertManager, SettingsRepository, TelemetryService, ThemeManager
+from camera import CameraFeed, CameraTile, CompositeSource, birdeye_remap, default_sources, mosaic_remap
+from fleet import LOST_AFTER_S, STALE_AFTER_S, FleetState
+from gauges import BatteryGauge, CompassGauge, SpeedGauge
+from history import TelemetryHistory
+from laps import LapTimer, Track, format_lap_time
+from perf import PerfMonitor
+from state import Field, TelemetryState, field_values
+from tiles import MapView, MBTilesReader, TileLoader
+from trip import TripComputer, format_duration
+from models import (
+    AlertLevel,
+    AppSettings,
+    BindingStats,
+    ConnectivityState,
+    PageId,
+    PerfSnapshot,
+    RenderStats,
+    TelemetryFrame,
+    ThemeMode,
+)
+from services import (
+    AlertManager,
+    RenderScheduler,
+    SettingsRepository,
+    TelemetryService,
+    ThemeManager,
+)
+
+_BINDING_STATS = BindingStats()
+
+
+def binding_stats() -> BindingStats:
+    return replace(_BINDING_STATS)
+
+
+class WidgetBinder:
+    """Cache la dernière valeur affichée par widget et ne touche Qt qu'en cas de changement."""
+
+    def __init__(self, stats: BindingStats | None = None) -> None:
+        self._stats = stats if stats is not None else _BINDING_STATS
+        self._values: dict[QWidget, Hashable] = {}
+        self._texts: dict[QWidget, str] = {}
+        self._visible: dict[QWidget, bool] = {}
+
+    def set_value(self, label: QLabel, value: Hashable, formatter: Callable[[Hashable], str]) -> bool:
+        if label in self._values and self._values[label] == value:
+            self._stats.skipped += 1
+            return False
+        self._values[label] = value
+        return self.set_text(label, formatter(value))
+
+    def set_text(self, label: QLabel, text: str) -> bool:
+        if self._texts.get(label) == text:
+            self._stats.skipped += 1
+            return False
+        self._texts[label] = text
+        label.setText(text)
+        self._stats.applied += 1
+        return True
+
+    def set_checked(self, button: QPushButton, checked: bool) -> bool:
+        if button.isChecked() == checked:
+            self._stats.skipped += 1
+            return False
+        button.setChecked(checked)
+        self._stats.applied += 1
+        return True
+
+    def set_state(self, stack: StyleStateStack, value: str) -> bool:
+        if stack.set_state(value):
+            self._stats.applied += 1
+            return True
+        self._stats.skipped += 1
+        return False
+
+    def set_visible(self, widget: QWidget, visible: bool) -> bool:
+        if self._visible.get(widget) == visible:
+            self._stats.skipped += 1
+            return False
+        self._visible[widget] = visible
+        widget.setVisible(visible)
+        self._stats.applied += 1
+        return True
+
+
+class StyleStateStack(QStackedWidget):
+    """Une variante pré-stylée par valeur d'un état QSS (`linkState`, `alertLevel`...).
+
+    La propriété dynamique de chaque variante est posée une seule fois : Qt
+    résout ses règles au premier polish puis à chaque changement de thème.
+    Changer d'état revient à changer de page, sans unpolish/polish ni
+    nouvelle résolution de la feuille.
+    """
+
+    def __init__(self, name: str, variants: dict[str, QWidget], parent=None) -> None:
+        super().__init__(parent)
+        self._indices: dict[str, int] = {}
+        for value, widget in variants.items():
+            widget.setProperty(name, value)
+            self._indices[value] = self.addWidget(widget)
+
+    def variant(self, value: str) -> QWidget:
+        return self.widget(self._indices[value])
+
+    def variants(self) -> list[QWidget]:
+        return [self.widget(index) for index in range(self.count())]
+
+    def set_state(self, value: str) -> bool:
+        index = self._indices[value]
+        if index == self.currentIndex():
+            return False
+        self.setCurrentIndex(index)
+        return True
+
+
+def _format_fix_state(fix_state) -> str:
+    return fix_state.value.replace("_", " ").upper()
 
 
 class TopStatusBar(QWidget):
@@ -29,31 +153,43 @@ class TopStatusBar(QWidget):
         super().__init__(parent)
         self.setObjectName("TopStatusBar")
         self._speed_label = QLabel("0 km/h")
-        self._battery_label = QLabel("Battery: --%")
+        self._battery = BatteryGauge()
+        self._battery.setFixedSize(64, 26)
         self._gps_label = QLabel("GPS: NO FIX")
-        self._link_label = QLabel("LINK: DISCONNECTED")
+        self._link_state = StyleStateStack(
+            "linkState", {state.value: QLabel(f"LINK: {state.value.upper()}") for state in ConnectivityState}
+        )
+        self._link_state.set_state(ConnectivityState.DISCONNECTED.value)
+        self._binder = WidgetBinder()
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(16, 10, 16, 10)
         layout.setSpacing(24)
-        for label in [self._speed_label, self._battery_label, self._gps_label, self._link_label]:
-            layout.addWidget(label)
+        for widget in [self._speed_label, self._battery, self._gps_label, self._link_state]:
+            layout.addWidget(widget)
         layout.addStretch(1)
 
-    def set_speed_text(self, speed_text: str) -> None:
-        self._speed_label.setText(speed_text)
+    def speed_label(self) -> QLabel:
+        return self._speed_label
+
+    def set_speed_text(self, speed_text: str) -> bool:
+        return self._binder.set_text(self._speed_label, speed_text)
 
     def set_battery_percent(self, battery_percent: int) -> None:
-        self._battery_label.setText(f"Battery: {battery_percent}%")
+        self._battery.set_percent(battery_percent)
 
     def set_gps_state(self, gps_state) -> None:
-        self._gps_label.setText(f"GPS: {gps_state.value.replace('_', ' ').upper()}")
+        self._binder.set_value(self._gps_label, gps_state, lambda s: f"GPS: {_format_fix_state(s)}")
 
     def set_connectivity(self, state: ConnectivityState) -> None:
-        self._link_label.setText(f"LINK: {state.value.upper()}")
-        self._link_label.setProperty("linkState", state.value)
-        self.style().unpolish(self._link_label)
-        self.style().polish(self._link_label)
+        self._binder.set_state(self._link_state, state.value)
+
+    def bind(self, state: TelemetryState) -> None:
+        """Abonnements permanents : la barre d'état est toujours visible."""
+        state.subscribe(Field.SPEED, lambda frame: self.set_speed_text(f"{frame.speed_kmh:0.0f} km/h"))
+        state.subscribe(Field.BATTERY, lambda frame: self.set_battery_percent(frame.battery_percent))
+        state.subscribe(Field.GPS_FIX, lambda frame: self.set_gps_state(frame.gps.fix_state))
+        state.subscribe(Field.LINK, lambda frame: self.set_connectivity(frame.connectivity))
 
 
 class BottomNavBar(QWidget):
@@ -63,6 +199,7 @@ class BottomNavBar(QWidget):
         super().__init__(parent)
         self.setObjectName("BottomNavBar")
         self._buttons: dict[PageId, QPushButton] = {}
+        self._binder = WidgetBinder()
         layout = QHBoxLayout(self)
         layout.setContentsMargins(12, 10, 12, 10)
         layout.setSpacing(12)
@@ -77,6 +214,9 @@ class BottomNavBar(QWidget):
         button = QPushButton(text)
         button.setObjectName("NavButton")
         button.setMinimumHeight(64)
+        # L'état actif passe par la pseudo-classe `:checked`, dont Qt met les règles en cache.
+        button.setCheckable(True)
+        button.setAutoExclusive(True)
         button.clicked.connect(lambda: self._on_button_clicked(page))
         self._buttons[page] = button
         layout.addWidget(button)
@@ -86,10 +226,7 @@ class BottomNavBar(QWidget):
         self.page_selected.emit(page)
 
     def set_active_page(self, page: PageId) -> None:
-        for page_id, button in self._buttons.items():
-            button.setProperty("active", page_id == page)
-            self.style().unpolish(button)
-            self.style().polish(button)
+        self._binder.set_checked(self._buttons[page], True)
 
 
 class AlertBanner(QWidget):
@@ -98,7 +235,10 @@ class AlertBanner(QWidget):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self._alert = None
+        self._binder = WidgetBinder()
         self.setObjectName("AlertBanner")
+        # Sans cet attribut, un QWidget simple ne peint pas le fond défini par la feuille.
+        self.setAttribute(Qt.WA_StyledBackground)
         self._message = QLabel("")
         self._dismiss_btn = QPushButton("Dismiss")
         self._dismiss_btn.clicked.connect(self._emit_dismiss)
@@ -110,11 +250,8 @@ class AlertBanner(QWidget):
 
     def set_alert(self, alert) -> None:
         self._alert = alert
-        self._message.setText(alert.message)
-        self._dismiss_btn.setVisible(alert.ack_required)
-        self.setProperty("alertLevel", alert.level.value)
-        self.style().unpolish(self)
-        self.style().polish(self)
+        self._binder.set_text(self._message, alert.message)
+        self._binder.set_visible(self._dismiss_btn, alert.ack_required)
 
     def _emit_dismiss(self) -> None:
         if self._alert is not None:
@@ -126,34 +263,88 @@ class AlertBannerHost(QWidget):
 
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
-        self._banner = AlertBanner()
-        self._banner.dismissed.connect(self.alert_dismissed)
+        # Une bannière pré-stylée par niveau : changer de niveau ne repolit rien.
+        self._banners = StyleStateStack("alertLevel", {level.value: AlertBanner() for level in AlertLevel})
+        for banner in self._banners.variants():
+            banner.dismissed.connect(self.alert_dismissed)
+        self._binder = WidgetBinder()
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(12, 0, 12, 0)
-        layout.addWidget(self._banner)
+        layout.addWidget(self._banners)
         self.hide()
 
     def show_alert(self, alert) -> None:
         if alert is None:
             self.hide()
             return
-        self._banner.set_alert(alert)
+        self._banners.variant(alert.level.value).set_alert(alert)
+        self._binder.set_state(self._banners, alert.level.value)
         self.show()
 
 
+class Sparkline(QWidget):
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.setObjectName("Sparkline")
+        self.setMinimumHeight(48)
+        self._x = None
+        self._y = None
+
+    def set_series(self, x, y) -> None:
+        self._x = x
+        self._y = y
+        self.update()
+
+    def paintEvent(self, event) -> None:
+        if self._x is None or len(self._x) < 2:
+            return
+        x, y = self._x, self._y
+        width = self.width() - 4
+        height = self.height() - 4
+        span_x = max(float(x[-1] - x[0]), 1e-9)
+        low, high = float(y.min()), float(y.max())
+        span_y = max(high - low, 1e-9)
+        xs = ((x - x[0]) / span_x * width + 2).tolist()
+        ys = (height + 2 - (y - low) / span_y * height).tolist()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(self.palette().color(QPalette.WindowText), 2))
+        painter.drawPolyline(QPolygonF([QPointF(px, py) for px, py in zip(xs, ys)]))
+
+
 class HomePage(QWidget):
     go_to_page = Signal(object)
 
-    def __init__(self, parent=None) -> None:
+    TREND_WINDOW_S = 600.0
+    # Le temps au tour est affiché au dixième : inutile de le relire plus souvent.
+    LAP_REFRESH_MS = 100
+
+    def __init__(
+        self,
+        state: TelemetryState,
+        history: TelemetryHistory | None = None,
+        trip: TripComputer | None = None,
+        laps: LapTimer | None = None,
+        parent=None,
+    ) -> None:
         super().__init__(parent)
-        self._speed = QLabel("0")
-        self._unit = QLabel("km/h")
-        self._battery = QLabel("100%")
-        self._gps = QLabel("GPS: --")
+        self._history = history
+        self._trip = trip
+        self._laps = laps
+        self._speed_trend = Sparkline()
+        self._battery_trend = Sparkline()
+        self._speed = SpeedGauge()
+        self._battery = BatteryGauge()
+        self._heading = CompassGauge()
+        self._lap = QLabel("No track" if laps is None else "Out lap")
+        # Avance/retard alterne souvent : une variante pré-stylée par état plutôt qu'un repolish.
+        self._delta = StyleStateStack("delta", {value: QLabel("") for value in ("none", "ahead", "behind")})
+        self._best_lap: float | None = None
         self._reverse = QLabel("OFF")
-        self._heading = QLabel("--°")
-        self._power = QLabel("0 kW")
+        self._trip_distance = QLabel("0.00 km")
+        self._trip_energy = QLabel("0 Wh")
+        self._binder = WidgetBinder()
 
         root = QVBoxLayout(self)
         root.setContentsMargins(12, 8, 12, 8)
@@ -161,26 +352,26 @@ class HomePage(QWidget):
 
         hero = QFrame()
         hero.setObjectName("HeroCard")
-        hero_layout = QVBoxLayout(hero)
-        hero_layout.setContentsMargins(18, 14, 18, 14)
-
-        speed_row = QHBoxLayout()
-        speed_row.addWidget(self._speed)
-        self._speed.setObjectName("HeroSpeed")
-        self._unit.setObjectName("HeroSpeedUnit")
-        speed_row.addWidget(self._unit, alignment=Qt.AlignBottom)
-        speed_row.addStretch(1)
-        hero_layout.addLayout(speed_row)
-        hero_layout.addWidget(QLabel("Live speed"), alignment=Qt.AlignLeft)
+        hero_layout = QHBoxLayout(hero)
+        hero_layout.setContentsMargins(18, 10, 18, 10)
+        self._speed.setMinimumSize(200, 200)
+        self._battery.setMinimumSize(140, 56)
+        self._battery.setMaximumHeight(72)
+        self._heading.setMinimumSize(140, 140)
+        hero_layout.addLayout(self._gauge_column("Battery", self._battery), 1)
+        hero_layout.addWidget(self._speed, 2)
+        hero_layout.addLayout(self._gauge_column("Heading", self._heading), 1)
         root.addWidget(hero)
 
         grid = QGridLayout()
         grid.setSpacing(12)
-        grid.addWidget(self._card("Battery", self._battery), 0, 0)
-        grid.addWidget(self._card("GPS fix", self._gps), 0, 1)
-        grid.addWidget(self._card("Reverse", self._reverse), 1, 0)
-        grid.addWidget(self._card("Heading", self._heading), 1, 1)
-        grid.addWidget(self._card("Power", self._power), 2, 0, 1, 2)
+        self._lap_card = self._lap_timing_card()
+        grid.addWidget(self._lap_card, 0, 0)
+        grid.addWidget(self._card("Reverse", self._reverse), 0, 1)
+        grid.addWidget(self._card("Trip", self._trip_distance), 1, 0)
+        grid.addWidget(self._card("Energy used", self._trip_energy), 1, 1)
+        grid.addWidget(self._trend_card("Speed trend", self._speed_trend), 2, 0)
+        grid.addWidget(self._trend_card("Battery trend", self._battery_trend), 2, 1)
         root.addLayout(grid)
 
         actions = QHBoxLayout()
@@ -194,6 +385,26 @@ class HomePage(QWidget):
         cam_btn.clicked.connect(lambda: self.go_to_page.emit(PageId.CAMERA))
         root.addLayout(actions)
 
+        self._trend_timer = QTimer(self)
+        self._trend_timer.setInterval(1000)
+        self._trend_timer.timeout.connect(self._refresh_trends)
+        self._trend_timer.timeout.connect(self._refresh_trip)
+        # Le chronomètre avance aussi à l'arrêt (horodatage des trames) : relu à intervalle fixe.
+        self._lap_timer = QTimer(self)
+        self._lap_timer.setInterval(self.LAP_REFRESH_MS)
+        if laps is not None:
+            self._lap_timer.timeout.connect(self._refresh_lap)
+
+        binder = self._binder
+        self._subscriptions = state.group()
+        subscribe = self._subscriptions.subscribe
+        subscribe(Field.SPEED, lambda frame: self._speed.set_speed(frame.speed_kmh))
+        subscribe(Field.BATTERY, lambda frame: self._battery.set_percent(frame.battery_percent))
+        subscribe(Field.HEADING, lambda frame: self._heading.set_heading(frame.gps.heading_deg))
+        subscribe(
+            Field.REVERSE, lambda frame: binder.set_value(self._reverse, frame.reverse, lambda on: "ON" if on else "OFF")
+        )
+
     def _card(self, title: str, value_label: QLabel) -> QGroupBox:
         box = QGroupBox(title)
         box.setObjectName("PanelCard")
@@ -202,40 +413,117 @@ class HomePage(QWidget):
         layout.addWidget(value_label)
         return box
 
-    def on_telemetry(self, frame: TelemetryFrame) -> None:
-        self._speed.setText(f"{frame.speed_kmh:0.0f}")
-        self._battery.setText(f"{frame.battery_percent}%")
-        self._gps.setText(frame.gps.fix_state.value.replace("_", " ").upper())
-        self._reverse.setText("ON" if frame.reverse else "OFF")
-        self._heading.setText(f"{frame.gps.heading_deg:.0f}°")
-        self._power.setText(f"{frame.speed_kmh * 0.8:0.1f} kW")
+    def _lap_timing_card(self) -> QGroupBox:
+        box = QGroupBox("Lap")
+        box.setObjectName("PanelCard")
+        layout = QHBoxLayout(box)
+        self._lap.setObjectName("MetricValue")
+        layout.addWidget(self._lap, 1)
+        for label in self._delta.variants():
+            label.setObjectName("MetricValue")
+            label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        layout.addWidget(self._delta)
+        return box
+
+    def _gauge_column(self, title: str, gauge: QWidget) -> QVBoxLayout:
+        column = QVBoxLayout()
+        column.addWidget(QLabel(title), alignment=Qt.AlignHCenter)
+        column.addWidget(gauge, 1, alignment=Qt.AlignCenter)
+        return column
+
+    def _trend_card(self, title: str, sparkline: Sparkline) -> QGroupBox:
+        box = QGroupBox(title)
+        box.setObjectName("PanelCard")
+        layout = QVBoxLayout(box)
+        layout.addWidget(sparkline)
+        return box
+
+    def activate(self) -> None:
+        self._subscriptions.resume()
+        self._trend_timer.start()
+        self._refresh_trends()
+        self._refresh_trip()
+        if self._laps is not None:
+            self._lap_timer.start()
+            self._refresh_lap()
+
+    def deactivate(self) -> None:
+        self._subscriptions.suspend()
+        self._trend_timer.stop()
+        self._lap_timer.stop()
+
+    def _refresh_trends(self) -> None:
+        history = self._history
+        if history is None or len(history) < 2:
+            return
+        # Fenêtre glissante : le coût de la décimation (1 Hz, thread GUI) ne croît pas avec la session.
+        last_n = history.window_since(float(history.column("t", 1)[0]) - self.TREND_WINDOW_S)
+        points = max(16, self._speed_trend.width() // 2)
+        self._speed_trend.set_series(*history.downsample("speed_kmh", points, last_n))
+        self._battery_trend.set_series(*history.downsample("battery_percent", points, last_n))
+
+    def _refresh_trip(self) -> None:
+        # Cumuls lents : rafraîchis avec les tendances (1 Hz), pas à chaque trame.
+        if self._trip is None:
+            return
+        stats = self._trip.stats()
+        self._binder.set_text(
+            self._trip_distance,
+            f"{stats.distance_m / 1000:.2f} km · avg {stats.avg_speed_kmh:.0f} / max {stats.max_speed_kmh:.0f} km/h",
+        )
+        self._binder.set_text(
+            self._trip_energy, f"{stats.energy_wh:.0f} Wh · reverse {format_duration(stats.reverse_s)}"
+        )
+
+    def _refresh_lap(self) -> None:
+        stats = self._laps.stats()
+        binder = self._binder
+        if stats.lap == 0:
+            binder.set_text(self._lap, "Out lap")
+        else:
+            pit = " · PIT" if stats.in_pit else ""
+            binder.set_text(self._lap, f"L{stats.lap} S{stats.sector + 1} · {format_lap_time(stats.lap_time_s, 1)}{pit}")
+        if stats.delta_s is None:
+            state, text = "none", ""
+        else:
+            state, text = ("ahead" if stats.delta_s <= 0 else "behind"), f"{stats.delta_s:+.2f}"
+        self._delta.set_state(state)
+        binder.set_text(self._delta.variant(state), text)
+        if stats.best_lap_s != self._best_lap:
+            self._best_lap = stats.best_lap_s
+            self._lap_card.setTitle(f"Lap · best {format_lap_time(stats.best_lap_s)}")
 
 
 class NavigationPage(QWidget):
     follow_changed = Signal(bool)
     zoom_changed = Signal(int)
 
-    def __init__(self, map_follow: bool, map_zoom: int, parent=None) -> None:
+    def __init__(
+        self, state: TelemetryState, map_follow: bool, map_zoom: int, tiles_path: Path | None = None, parent=None
+    ) -> None:
         super().__init__(parent)
         self._follow = map_follow
         self._zoom = map_zoom
+        self._tile_loader = TileLoader(MBTilesReader(tiles_path), parent=self) if tiles_path is not None else None
+        self._map = MapView(self._tile_loader, map_zoom)
         self._latlon = QLabel("Lat/Lon: --")
         self._heading = QLabel("Heading: --")
         self._fix = QLabel("Fix: --")
         self._follow_button = QPushButton("")
         self._zoom_label = QLabel("")
+        self._binder = WidgetBinder()
 
         root = QVBoxLayout(self)
         root.setContentsMargins(12, 8, 12, 8)
         root.setSpacing(12)
 
-        map_placeholder = QFrame()
-        map_placeholder.setObjectName("MapPlaceholder")
-        map_layout = QVBoxLayout(map_placeholder)
-        map_layout.addStretch(1)
-        map_layout.addWidget(QLabel("Map view"), alignment=Qt.AlignHCenter)
-        map_layout.addWidget(QLabel("OSM/QtLocation integration ready"), alignment=Qt.AlignHCenter)
-        map_layout.addStretch(1)
+        map_frame = QFrame()
+        map_frame.setObjectName("MapPlaceholder")
+        map_layout = QVBoxLayout(map_frame)
+        map_layout.setContentsMargins(0, 0, 0, 0)
+        if self._tile_loader is None:
+            map_layout.addWidget(QLabel("Offline map: no tileset"), alignment=Qt.AlignHCenter)
+        map_layout.addWidget(self._map, 1)
 
         info_panel = QFrame()
         info_panel.setObjectName("InfoCard")
@@ -259,18 +547,52 @@ class NavigationPage(QWidget):
         controls.addWidget(zoom_out)
         controls.addWidget(zoom_in)
 
-        root.addWidget(map_placeholder, 1)
+        root.addWidget(map_frame, 1)
         root.addWidget(info_panel)
         root.addLayout(controls)
         self._refresh_controls()
 
+        binder = self._binder
+        self._subscriptions = state.group()
+        subscribe = self._subscriptions.subscribe
+        subscribe(
+            Field.POSITION,
+            lambda frame: binder.set_text(
+                self._latlon, f"Lat/Lon: {frame.gps.latitude:.5f}, {frame.gps.longitude:.5f}"
+            ),
+        )
+        subscribe(Field.HEADING, lambda frame: binder.set_text(self._heading, f"Heading: {frame.gps.heading_deg:.0f}°"))
+        subscribe(
+            Field.GPS_FIX,
+            lambda frame: binder.set_value(self._fix, frame.gps.fix_state, lambda s: f"Fix: {_format_fix_state(s)}"),
+        )
+        subscribe(
+            Field.POSITION | Field.HEADING | Field.SPEED,
+            lambda frame: self._map.set_kart(frame.gps, frame.speed_kmh, self._follow, frame.produced_ns),
+        )
+
+    def activate(self) -> None:
+        self._map.set_active(True)
+        self._subscriptions.resume()
+
+    def deactivate(self) -> None:
+        self._subscriptions.suspend()
+        # Ne garde en mémoire que les tuiles visibles et abandonne les chargements en attente.
+        self._map.set_active(False)
+
+    def tile_loader(self) -> TileLoader | None:
+        return self._tile_loader
+
     def _toggle_follow(self) -> None:
         self._follow = not self._follow
+        if self._follow:
+            self._map.recenter()
         self._refresh_controls()
         self.follow_changed.emit(self._follow)
 
     def _set_zoom(self, value: int) -> None:
         self._zoom = max(1, min(20, value))
+        self._map.set_zoom(self._zoom)
         self._refresh_controls()
         self.zoom_changed.emit(self._zoom)
 
@@ -278,26 +600,42 @@ class NavigationPage(QWidget):
         self._follow_button.setText("Follow kart: ON" if self._follow else "Follow kart: OFF")
         self._zoom_label.setText(f"Zoom: {self._zoom}")
 
-    def on_telemetry(self, frame: TelemetryFrame) -> None:
-        self._latlon.setText(f"Lat/Lon: {frame.gps.latitude:.5f}, {frame.gps.longitude:.5f}")
-        self._heading.setText(f"Heading: {frame.gps.heading_deg:.0f}°")
-        self._fix.setText(f"Fix: {frame.gps.fix_state.value.replace('_', ' ').upper()}")
-
 
 class CameraPage(QWidget):
-    def __init__(self, parent=None) -> None:
+    """Flux arrière, gauche et droite ; les captures ne tournent que lorsque la page est affichée.
+
+    « Mosaic » et « Bird-eye » sont des flux composites calculés hors du thread
+    GUI à partir des trois caméras.
+    """
+
+    MODES = ("Rear", "Front", "Mosaic", "Bird-eye")
+    COMPOSITES = {"Mosaic": mosaic_remap, "Bird-eye": birdeye_remap}
+
+    def __init__(self, state: TelemetryState, feeds: list[CameraFeed] | None = None, parent=None) -> None:
         super().__init__(parent)
+        self._feeds = feeds if feeds is not None else [CameraFeed(source) for source in default_sources()]
+        self._composites = {
+            mode: CameraFeed(CompositeSource(mode, self._feeds, build_table))
+            for mode, build_table in self.COMPOSITES.items()
+        }
+        for feed in self._all_feeds():
+            feed.setParent(self)
         self._mode = QLabel("Mode: Rear")
         self._reverse = QLabel("Reverse engaged: NO")
+        self._binder = WidgetBinder()
+        self._tiles = [CameraTile(feed) for feed in self._feeds]
+        self._composite_tiles = {mode: CameraTile(feed) for mode, feed in self._composites.items()}
 
         root = QVBoxLayout(self)
         root.setContentsMargins(12, 8, 12, 8)
         root.setSpacing(12)
 
         feeds = QGridLayout()
-        feeds.addWidget(self._camera_tile("Rear camera"), 0, 0, 2, 2)
-        feeds.addWidget(self._camera_tile("Left side"), 0, 2)
-        feeds.addWidget(self._camera_tile("Right side"), 1, 2)
+        feeds.addWidget(self._tiles[0], 0, 0, 2, 2)
+        for row, tile in enumerate(self._tiles[1:3]):
+            feeds.addWidget(tile, row, 2)
+        for tile in self._composite_tiles.values():
+            feeds.addWidget(tile, 0, 0, 2, 3)
         root.addLayout(feeds, 1)
 
         status = QHBoxLayout()
@@ -307,33 +645,79 @@ class CameraPage(QWidget):
         root.addLayout(status)
 
         buttons = QHBoxLayout()
-        for mode in ["Rear", "Front", "Mosaic", "Bird-eye"]:
+        for mode in self.MODES:
             btn = QPushButton(mode)
-            btn.clicked.connect(lambda _=False, m=mode: self._mode.setText(f"Mode: {m}"))
+            btn.clicked.connect(lambda _=False, m=mode: self.set_mode(m))
+            # Pas de caméra avant montée pour l'instant.
+            btn.setEnabled(mode != "Front")
             buttons.addWidget(btn)
         root.addLayout(buttons)
-
-    def _camera_tile(self, text: str) -> QFrame:
-        tile = QFrame()
-        tile.setObjectName("CameraPlaceholder")
-        layout = QVBoxLayout(tile)
-        layout.addStretch(1)
-        layout.addWidget(QLabel(text))
-        layout.addStretch(1)
-        return tile
-
-    def on_telemetry(self, frame: TelemetryFrame) -> None:
-        self._reverse.setText("Reverse engaged" if frame.reverse else "Reverse engaged: NO")
+        self.set_mode("Rear")
+
+        self._subscriptions = state.group()
+        self._subscriptions.subscribe(
+            Field.REVERSE,
+            lambda frame: self._binder.set_value(
+                self._reverse, frame.reverse, lambda on: "Reverse engaged" if on else "Reverse engaged: NO"
+            ),
+        )
+
+    def feeds(self) -> list[CameraFeed]:
+        return list(self._feeds)
+
+    def composite_feeds(self) -> dict[str, CameraFeed]:
+        return dict(self._composites)
+
+    def _all_feeds(self) -> list[CameraFeed]:
+        return [*self._feeds, *self._composites.values()]
+
+    def set_mode(self, mode: str) -> None:
+        self._binder.set_text(self._mode, f"Mode: {mode}")
+        self._binder.set_visible(self._tiles[0], mode not in self._composites)
+        for tile in self._tiles[1:]:
+            self._binder.set_visible(tile, mode not in self._composites and mode != "Rear")
+        for name, tile in self._composite_tiles.items():
+            self._binder.set_visible(tile, name == mode)
+        if self.isVisible():
+            self._sync_captures()
+
+    def activate(self) -> None:
+        self._subscriptions.resume()
+        self._sync_captures()
+
+    def deactivate(self) -> None:
+        self._subscriptions.suspend()
+        for feed in reversed(self._all_feeds()):
+            feed.stop()
+
+    def _sync_captures(self) -> None:
+        # Une tuile cachée n'a pas besoin de capture : son thread est arrêté, sauf
+        # pour les caméras qui alimentent le composite affiché.
+        needed: list[CameraFeed] = []
+        for tile in [*self._tiles, *self._composite_tiles.values()]:
+            if tile.isVisibleTo(self):
+                source = tile.feed.source
+                if isinstance(source, CompositeSource):
+                    needed.extend(source.inputs)
+                needed.append(tile.feed)
+        for feed in reversed(self._all_feeds()):
+            if feed not in needed:
+                feed.stop()
+        for feed in needed:
+            feed.start()
 
 
 class SettingsPage(QWidget):
     save_requested = Signal(object)
+    perf_overlay_toggled = Signal(bool)
+    brightness_preview = Signal(int)
 
     def __init__(self, settings: AppSettings, parent=None) -> None:
         super().__init__(parent)
         self._settings = settings
         self._theme_toggle = QCheckBox("Night mode")
         self._follow_toggle = QCheckBox("Follow map")
+        self._perf_toggle = QCheckBox("Performance overlay")
         self._brightness = QSlider()
         self._brightness_value = QLabel("")
 
@@ -352,12 +736,15 @@ class SettingsPage(QWidget):
         self._brightness.setMinimum(0)
         self._brightness.setMaximum(100)
         self._brightness.valueChanged.connect(self._sync_brightness_label)
+        self._brightness.valueChanged.connect(self.brightness_preview)
 
         row = QHBoxLayout()
         row.addWidget(QLabel("Brightness"))
         row.addWidget(self._brightness, 1)
         row.addWidget(self._brightness_value)
         card_layout.addLayout(row)
+        card_layout.addWidget(self._perf_toggle)
+        self._perf_toggle.toggled.connect(self.perf_overlay_toggled)
 
         layout.addWidget(card)
 
@@ -373,26 +760,277 @@ class SettingsPage(QWidget):
     def _load_values(self) -> None:
         self._theme_toggle.setChecked(self._settings.theme_mode == ThemeMode.NIGHT)
         self._follow_toggle.setChecked(self._settings.map_follow)
+        self._perf_toggle.setChecked(self._settings.perf_overlay)
         self._brightness.setValue(self._settings.brightness)
         self._sync_brightness_label(self._settings.brightness)
 
+    def deactivate(self) -> None:
+        # Les réglages non enregistrés (aperçu de luminosité compris) sont abandonnés.
+        self._load_values()
+
     def _sync_brightness_label(self, value: int) -> None:
         self._brightness_value.setText(f"{value}%")
 
     def _emit_save(self) -> None:
         self._settings.theme_mode = ThemeMode.NIGHT if self._theme_toggle.isChecked() else ThemeMode.DAY
         self._settings.map_follow = self._follow_toggle.isChecked()
+        self._settings.perf_overlay = self._perf_toggle.isChecked()
         self._settings.brightness = self._brightness.value()
         self.save_requested.emit(self._settings)
 
 
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole.value
+_TEXT_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole.value
+_ALIGN_LEFT = (Qt.AlignLeft | Qt.AlignVCenter).value
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter.value
+_DISPLAY_ROLES = [Qt.ItemDataRole.DisplayRole]
+
+
+class LeaderboardModel(QAbstractTableModel):
+    """Classement de la flotte, une ligne par kart dans l'ordre des positions.
+
+    Chaque cellule est réduite à un entier à la résolution affichée (km/h,
+    %, centièmes de km, état de liaison) ; `refresh` compare cette matrice à la
+    précédente en une opération NumPy et n'émet `dataChanged` que pour les
+    cellules modifiées. Le texte n'est formaté que lorsque la vue le demande.
+    """
+
+    HEADERS = ("Pos", "Kart", "Speed", "Max", "Battery", "Distance", "Link")
+    LINK_TEXT = ("OK", "LATE", "LOST", "--")
+
+    def __init__(self, names: list[str], parent=None) -> None:
+        super().__init__(parent)
+        self._names = names
+        self._keys = np.zeros((0, len(self.HEADERS)), dtype=np.int64)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._keys)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        # La vue interroge plusieurs rôles par cellule : comparaisons sur des entiers pré-calculés.
+        if role == _TEXT_ALIGNMENT_ROLE:
+            return _ALIGN_LEFT if index.column() == 1 else _ALIGN_CENTER
+        if role != _DISPLAY_ROLE:
+            return None
+        return self.text(index.row(), index.column())
+
+    def text(self, row: int, column: int) -> str:
+        value = int(self._keys[row, column])
+        if column == 1:
+            return self._names[value]
+        if column in (2, 3):
+            return f"{value} km/h"
+        if column == 4:
+            return f"{value}%"
+        if column == 5:
+            return f"{value / 100:.2f} km"
+        if column == 6:
+            return self.LINK_TEXT[value]
+        return str(value)
+
+    def live_count(self) -> int:
+        return int(np.count_nonzero(self._keys[:, 6] == 0))
+
+    def refresh(self, snapshot: dict[str, np.ndarray], now_ns: int) -> int:
+        """Applique un instantané de `FleetState` ; retourne le nombre de cellules modifiées."""
+        keys = self._build_keys(snapshot, now_ns)
+        if keys.shape != self._keys.shape:
+            self.beginResetModel()
+            self._keys = keys
+            self.endResetModel()
+            return keys.size
+        changed = keys != self._keys
+        self._keys = keys
+        for column in np.flatnonzero(changed.any(axis=0)):
+            rows = np.flatnonzero(changed[:, column])
+            self.dataChanged.emit(
+                self.index(int(rows[0]), int(column)), self.index(int(rows[-1]), int(column)), _DISPLAY_ROLES
+            )
+        return int(np.count_nonzero(changed))
+
+    @staticmethod
+    def _build_keys(snapshot: dict[str, np.ndarray], now_ns: int) -> np.ndarray:
+        count = len(snapshot["distance_m"])
+        # Distance décroissante ; à égalité, ordre de déclaration des karts.
+        order = np.lexsort((np.arange(count), -snapshot["distance_m"]))
+        received = snapshot["received_ns"][order]
+        age_s = (now_ns - received) / 1e9
+        keys = np.empty((count, 7), dtype=np.int64)
+        keys[:, 0] = np.arange(1, count + 1)
+        keys[:, 1] = order
+        keys[:, 2] = np.rint(snapshot["speed_kmh"][order])
+        keys[:, 3] = np.rint(snapshot["max_speed_kmh"][order])
+        keys[:, 4] = snapshot["battery_percent"][order]
+        keys[:, 5] = np.rint(snapshot["distance_m"][order] / 10)
+        keys[:, 6] = np.select([received == 0, age_s < STALE_AFTER_S, age_s < LOST_AFTER_S], [3, 0, 1], 2)
+        return keys
+
+
+class _LeaderboardDelegate(QStyledItemDelegate):
+    """Texte seul, lu directement dans le modèle : le fond (lignes alternées) reste peint par la vue.
+
+    Le délégué standard met chaque cellule en page avec `QTextLayout` et
+    interroge le modèle pour une dizaine de rôles ; ici, un seul `drawText`.
+    """
+
+    def __init__(self, model: LeaderboardModel, parent=None) -> None:
+        super().__init__(parent)
+        self._model = model
+
+    def paint(self, painter: QPainter, option, index: QModelIndex) -> None:
+        column = index.column()
+        rect = option.rect.adjusted(12, 0, -12, 0) if column == 1 else option.rect
+        painter.setPen(option.palette.color(QPalette.Text))
+        painter.drawText(rect, _ALIGN_LEFT if column == 1 else _ALIGN_CENTER, self._model.text(index.row(), column))
+
+
+class FleetPage(QWidget):
+    """Vue d'ensemble de la flotte, rafraîchie par minuterie au rythme de l'affichage, pas par trame."""
+
+    def __init__(self, state: FleetState, refresh_hz: int = 30, parent=None) -> None:
+        super().__init__(parent)
+        self._state = state
+        self._model = LeaderboardModel(state.names, self)
+        self._summary = QLabel("")
+        self._summary.setObjectName("PlaceholderSubtitle")
+        self._binder = WidgetBinder()
+
+        table = QTableView()
+        table.setObjectName("Leaderboard")
+        table.setModel(self._model)
+        table.setItemDelegate(_LeaderboardDelegate(self._model, table))
+        table.verticalHeader().hide()
+        table.verticalHeader().setDefaultSectionSize(36)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table.setSelectionMode(QAbstractItemView.NoSelection)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.setFocusPolicy(Qt.NoFocus)
+        table.setShowGrid(False)
+        table.setAlternatingRowColors(True)
+        self._table = table
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 8, 12, 8)
+        layout.setSpacing(12)
+        title = QLabel("Fleet leaderboard")
+        title.setObjectName("PlaceholderTitle")
+        layout.addWidget(title)
+        layout.addWidget(self._summary)
+        layout.addWidget(table, 1)
+
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setInterval(max(1, round(1000 / max(1, refresh_hz))))
+        self._refresh_timer.timeout.connect(self.refresh)
+
+    def model(self) -> LeaderboardModel:
+        return self._model
+
+    def table(self) -> QTableView:
+        return self._table
+
+    def activate(self) -> None:
+        self._refresh_timer.start()
+        self.refresh()
+
+    def deactivate(self) -> None:
+        self._refresh_timer.stop()
+
+    def refresh(self) -> int:
+        changed = self._model.refresh(self._state.snapshot(), time.monotonic_ns())
+        self._binder.set_text(self._summary, f"{len(self._state)} karts · {self._model.live_count()} live")
+        return changed
+
+
+class BrightnessOverlay(QWidget):
+    """Voile noir semi-transparent au-dessus de la fenêtre : changer la luminosité ne fait que repeindre."""
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        self._alpha = 0
+
+    def set_dim_opacity(self, opacity: float) -> None:
+        alpha = round(max(0.0, min(1.0, opacity)) * 255)
+        if alpha == self._alpha:
+            return
+        self._alpha = alpha
+        self.setVisible(alpha > 0)
+        self.update()
+
+    def paintEvent(self, event) -> None:
+        QPainter(self).fillRect(event.rect(), QColor(0, 0, 0, self._alpha))
+
+
+class PerfOverlay(QLabel):
+    def __init__(self, monitor: PerfMonitor, parent=None) -> None:
+        super().__init__(parent)
+        self.setObjectName("PerfOverlay")
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self._monitor = monitor
+        self._timer = QTimer(self)
+        self._timer.setInterval(500)
+        self._timer.timeout.connect(self._refresh)
+        self.hide()
+
+    def set_enabled(self, enabled: bool) -> None:
+        self.setVisible(enabled)
+        if enabled:
+            self._refresh()
+            self.raise_()
+            self._timer.start()
+        else:
+            self._timer.stop()
+
+    def _refresh(self) -> None:
+        snap: PerfSnapshot = self._monitor.snapshot()
+        self.setText(
+            f"intake  p50 {snap.intake_p50_us / 1000:6.2f} ms  p99 {snap.intake_p99_us / 1000:6.2f} ms\n"
+            f"render  p50 {snap.render_p50_us / 1000:6.2f} ms  p99 {snap.render_p99_us / 1000:6.2f} ms\n"
+            f"paint   p50 {snap.paint_p50_us / 1000:6.2f} ms  p99 {snap.paint_p99_us / 1000:6.2f} ms\n"
+            f"loop lag p99 {snap.loop_lag_p99_us / 1000:5.1f} ms\n"
+            f"{snap.fps:5.1f} fps  {snap.frame_rate_hz:6.1f} Hz in"
+        )
+        self.adjustSize()
+        parent = self.parentWidget()
+        if parent is not None:
+            self.move(parent.width() - self.width() - 16, 64)
+
+
 class MainWindow(QMainWindow):
+    """Fenêtre principale.
+
+    Les pages sont enregistrées comme fabriques et construites au premier
+    `set_page` ; avec `warm_up_pages`, celles qui restent sont construites une
+    par une pendant les temps morts qui suivent la première trame affichée.
+    Une page peut exposer `activate()`/`deactivate()`, appelées quand elle
+    devient visible ou cachée, pour démarrer ou libérer ses ressources.
+
+    Chaque trame rendue passe par `TelemetryState` : les widgets s'y abonnent
+    aux champs qu'ils affichent, et une page reprend ses abonnements (avec un
+    rattrapage) dans `activate`, les suspend dans `deactivate`.
+    """
+
+    WARM_UP_DELAY_MS = 300
+
     def __init__(
         self,
         settings: AppSettings,
         settings_repo: SettingsRepository,
         theme_manager: ThemeManager,
         telemetry_service: TelemetryService,
+        warm_up_pages: bool = True,
+        tiles_path: Path | None = None,
+        camera_source: str = "synthetic",
+        track: Track | None = None,
         parent=None,
     ) -> None:
         super().__init__(parent)
@@ -402,45 +1040,56 @@ class MainWindow(QMainWindow):
         self._settings_repo = settings_repo
         self._theme_manager = theme_manager
         self._telemetry_service = telemetry_service
-        self._alert_manager = AlertManager()
-        self._last_frame_at = datetime.utcnow()
+        self._tiles_path = tiles_path
+        self._camera_source = camera_source
+        self._alert_manager = AlertManager(default_ttl_s=10.0)
+        self._history = TelemetryHistory(min_interval_s=0.08)
+        self._trip = TripComputer()
+        self._laps = LapTimer(track) if track is not None else None
+        self._perf = PerfMonitor(parent=self)
+        # Heure locale de réception : l'horodatage des trames vient de l'ECU ou du journal rejoué.
+        self._last_frame_at = time.monotonic()
+        self._state = TelemetryState()
+        self._render_scheduler = RenderScheduler(self._settings.max_render_hz, visible_key=field_values, parent=self)
 
         self._stack = QStackedWidget()
         self._top_bar = TopStatusBar()
+        self._top_bar.bind(self._state)
         self._banner_host = AlertBannerHost()
         self._bottom_nav = BottomNavBar()
 
-        home_page = HomePage()
-        nav_page = NavigationPage(self._settings.map_follow, self._settings.map_zoom)
-        cam_page = CameraPage()
-        settings_page = SettingsPage(self._settings)
-
-        self._pages: dict[PageId, QWidget] = {
-            PageId.HOME: home_page,
-            PageId.NAVIGATION: nav_page,
-            PageId.CAMERA: cam_page,
-            PageId.SETTINGS: settings_page,
+        self._page_factories: dict[PageId, Callable[[], QWidget]] = {
+            PageId.HOME: self._build_home_page,
+            PageId.NAVIGATION: self._build_navigation_page,
+            PageId.CAMERA: self._build_camera_page,
+            PageId.SETTINGS: self._build_settings_page,
         }
+        self._pages: dict[PageId, QWidget] = {}
+        self._current_page_id: PageId | None = None
+        self._warm_up_timer = QTimer(self)
+        self._warm_up_timer.setSingleShot(True)
+        self._warm_up_timer.timeout.connect(self._warm_up_next_page)
+        self._warm_up_pending = warm_up_pages
 
         central = QWidget(self)
         root = QVBoxLayout(central)
         root.setContentsMargins(16, 12, 16, 12)
         root.setSpacing(10)
-        for page in self._pages.values():
-            self._stack.addWidget(page)
         root.addWidget(self._top_bar)
         root.addWidget(self._banner_host)
         root.addWidget(self._stack, 1)
         root.addWidget(self._bottom_nav)
         self.setCentralWidget(central)
+        self._perf_overlay = PerfOverlay(self._perf, central)
+        self._brightness_overlay = BrightnessOverlay(self)
+        self._theme_manager.attach_brightness_overlay(self._brightness_overlay)
+        self._perf.watch_paint(self._top_bar.speed_label())
+        self._perf.watch_window(self)
 
         self._bottom_nav.page_selected.connect(self.set_page)
-        self._banner_host.alert_dismissed.connect(self._alert_manager.acknowledge)
+        self._banner_host.alert_dismissed.connect(self._on_alert_dismissed)
         self._telemetry_service.telemetry_updated.connect(self._on_telemetry)
-        home_page.go_to_page.connect(self.set_page)
-        nav_page.follow_changed.connect(self._on_follow_changed)
-        nav_page.zoom_changed.connect(self._on_zoom_changed)
-        settings_page.save_requested.connect(self._on_save_settings)
+        self._render_scheduler.render_requested.connect(self._render_frame)
 
         self.set_page(self._settings.default_page)
 
@@ -448,36 +1097,137 @@ class MainWindow(QMainWindow):
         self._disconnect_watchdog.setInterval(1200)
         self._disconnect_watchdog.timeout.connect(self._check_link_health)
         self._disconnect_watchdog.start()
+        self._perf.start()
+        self._perf_overlay.set_enabled(self._settings.perf_overlay)
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._brightness_overlay.setGeometry(self.rect())
+        self._brightness_overlay.raise_()
+
+    def _build_home_page(self) -> QWidget:
+        page = HomePage(self._state, self._history, self._trip, self._laps)
+        page.go_to_page.connect(self.set_page)
+        return page
+
+    def _build_navigation_page(self) -> QWidget:
+        page = NavigationPage(self._state, self._settings.map_follow, self._settings.map_zoom, self._tiles_path)
+        page.follow_changed.connect(self._on_follow_changed)
+        page.zoom_changed.connect(self._on_zoom_changed)
+        return page
+
+    def _build_camera_page(self) -> QWidget:
+        feeds = [CameraFeed(source) for source in default_sources(self._camera_source)]
+        return CameraPage(self._state, feeds)
+
+    def _build_settings_page(self) -> QWidget:
+        page = SettingsPage(self._settings)
+        page.save_requested.connect(self._on_save_settings)
+        page.perf_overlay_toggled.connect(self._perf_overlay.set_enabled)
+        page.brightness_preview.connect(self._theme_manager.set_brightness)
+        return page
+
+    def _ensure_page(self, page_id: PageId) -> QWidget | None:
+        page = self._pages.get(page_id)
+        if page is None:
+            factory = self._page_factories.get(page_id)
+            if factory is None:
+                return None
+            page = factory()
+            self._pages[page_id] = page
+            self._stack.addWidget(page)
+        return page
+
+    def built_pages(self) -> list[PageId]:
+        return list(self._pages)
 
     def set_page(self, page_id: PageId) -> None:
-        page = self._pages.get(page_id)
-        if page is not None:
-            self._stack.setCurrentWidget(page)
+        if page_id == self._current_page_id:
             self._bottom_nav.set_active_page(page_id)
+            return
+        page = self._ensure_page(page_id)
+        if page is None:
+            return
+        previous = self._pages.get(self._current_page_id)
+        deactivate = getattr(previous, "deactivate", None)
+        if callable(deactivate):
+            deactivate()
+        self._current_page_id = page_id
+        self._stack.setCurrentWidget(page)
+        # `activate` reprend les abonnements de la page : rattrapage des champs changés pendant qu'elle était cachée.
+        activate = getattr(page, "activate", None)
+        if callable(activate):
+            activate()
+        self._bottom_nav.set_active_page(page_id)
 
     def current_page(self) -> PageId:
-        current = self._stack.currentWidget()
-        for page_id, widget in self._pages.items():
-            if widget is current:
-                return page_id
-        return PageId.HOME
+        return self._current_page_id or PageId.HOME
+
+    def _warm_up_next_page(self) -> None:
+        # Une seule page par passage : la boucle d'événements reste réactive entre deux constructions.
+        for page_id in self._page_factories:
+            if page_id not in self._pages:
+                self._ensure_page(page_id)
+                self._warm_up_timer.start(0)
+                return
 
     def _on_follow_changed(self, value: bool) -> None:
         self._settings.map_follow = value
+        self._settings_repo.save_settings(self._settings)
 
     def _on_zoom_changed(self, value: int) -> None:
         self._settings.map_zoom = value
+        self._settings_repo.save_settings(self._settings)
+
+    def _on_alert_dismissed(self, alert_id: str) -> None:
+        self._alert_manager.acknowledge(alert_id)
+        self._banner_host.show_alert(self._alert_manager.get_banner_alert())
 
     def _on_save_settings(self, settings: AppSettings) -> None:
         self._settings_repo.save_settings(settings)
         self._theme_manager.apply_theme(settings.theme_mode, settings.brightness)
+        self._render_scheduler.set_max_hz(settings.max_render_hz)
+
+    def telemetry_state(self) -> TelemetryState:
+        return self._state
+
+    def render_stats(self) -> RenderStats:
+        return self._render_scheduler.stats()
+
+    def binding_stats(self) -> BindingStats:
+        return binding_stats()
+
+    def perf_monitor(self) -> PerfMonitor:
+        return self._perf
+
+    def dump_perf_stats(self, path: Path) -> None:
+        self._perf.dump(path)
+
+    def history(self) -> TelemetryHistory:
+        return self._history
+
+    def trip(self) -> TripComputer:
+        return self._trip
+
+    def laps(self) -> LapTimer | None:
+        return self._laps
 
     def _on_telemetry(self, frame: TelemetryFrame) -> None:
-        self._last_frame_at = frame.timestamp
-        self._top_bar.set_speed_text(f"{frame.speed_kmh:0.0f} km/h")
-        self._top_bar.set_battery_percent(frame.battery_percent)
-        self._top_bar.set_gps_state(frame.gps.fix_state)
-        self._top_bar.set_connectivity(frame.connectivity)
+        self._perf.on_intake(frame)
+        self._last_frame_at = time.monotonic()
+        self._history.append(frame)
+        self._trip.update(frame)
+        if self._laps is not None:
+            self._laps.update(frame)
+        self._render_scheduler.submit(frame)
+
+    def _render_frame(self, frame: TelemetryFrame) -> None:
+        started_ns = time.monotonic_ns()
+        if self._warm_up_pending:
+            self._warm_up_pending = False
+            self._warm_up_timer.start(self.WARM_UP_DELAY_MS)
+        # Seuls les abonnés des champs modifiés sont appelés (barre d'état, page affichée).
+        changed = self._state.update(frame)
 
         self._alert_manager.ingest(frame.alerts)
         self._banner_host.show_alert(self._alert_manager.get_banner_alert())
@@ -485,11 +1235,37 @@ class MainWindow(QMainWindow):
         if frame.reverse and self.current_page() != PageId.SETTINGS:
             self.set_page(PageId.CAMERA)
 
-        page = self._stack.currentWidget()
-        on_telemetry = getattr(page, "on_telemetry", None)
-        if callable(on_telemetry):
-            on_telemetry(frame)
+        self._perf.on_rendered(frame, started_ns, awaiting_paint=bool(changed & Field.SPEED))
 
     def _check_link_health(self) -> None:
-        if datetime.utcnow() - self._last_frame_at > timedelta(seconds=2):
+        if time.monotonic() - self._last_frame_at > 2.0:
             self._top_bar.set_connectivity(ConnectivityState.DISCONNECTED)
+            self._render_scheduler.invalidate()
+            self._state.invalidate(Field.LINK)
+        self._banner_host.show_alert(self._alert_manager.get_banner_alert())
+
+
+class FleetWindow(QMainWindow):
+    """Fenêtre du mode flotte : le classement seul, sans télémétrie d'un kart particulier."""
+
+    def __init__(self, state: FleetState, theme_manager: ThemeManager, refresh_hz: int = 30, parent=None) -> None:
+        super().__init__(parent)
+        self.setObjectName("RootWindow")
+        self.setWindowTitle("Electric Kart Console · Fleet")
+        self._page = FleetPage(state, refresh_hz)
+        central = QWidget(self)
+        root = QVBoxLayout(central)
+        root.setContentsMargins(16, 12, 16, 12)
+        root.addWidget(self._page)
+        self.setCentralWidget(central)
+        self._brightness_overlay = BrightnessOverlay(self)
+        theme_manager.attach_brightness_overlay(self._brightness_overlay)
+        self._page.activate()
+
+    def page(self) -> FleetPage:
+        return self._page
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._brightness_overlay.setGeometry(self.rect())
+        self._brightness_overlay.raise_()